@@ -13,7 +13,6 @@ from pathlib import Path
 
 import requests
 import streamlit as st
-import yaml
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -25,20 +24,26 @@ TMP_DIR = PROJECT_ROOT / ".tmp"
 PROFILE_PATH = PROJECT_ROOT / "user_profile.yaml"
 CONFIG_PATH = PROJECT_ROOT / "job_search_config.yaml"
 QA_DATABANK_PATH = PROJECT_ROOT / "qa_databank.yaml"
-REPORTS_PATH = TMP_DIR / "company_reports.json"
 TOOLS_DIR = PROJECT_ROOT / "tools"
 
+# Shared helpers from tools/ (same import style as the tools scripts)
+sys.path.insert(0, str(TOOLS_DIR))
+
+from job_store import open_job_store
+from answer_log import open_answer_log
+from file_cache import cache_stats, invalidate, load_yaml_cached
+from llm_client import get_client
+from persistence import dumps, load_json, load_yaml, save_json, save_yaml
+from report_store import DEFAULT_TTL_DAYS, open_report_store
+
 # Session state persistence functions
 def load_session_state():
     """Load saved session state from disk."""
     session_path = TMP_DIR / "session_state.json"
-    if session_path.exists():
-        try:
-            with open(session_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
+    try:
+        return load_json(session_path, default={})
+    except:
+        return {}
 
 
 def save_session_state(state_dict=None):
@@ -46,7 +51,6 @@ def save_session_state(state_dict=None):
     if state_dict is None:
         state_dict = st.session_state
 
-    TMP_DIR.mkdir(exist_ok=True)
     session_path = TMP_DIR / "session_state.json"
 
     # Widget key patterns to exclude (these cannot be set programmatically)
@@ -69,13 +73,12 @@ def save_session_state(state_dict=None):
             continue
 
         try:
-            json.dumps(value)  # Test if serializable
+            dumps(value)  # Test if serializable
             serializable_state[key] = value
         except (TypeError, ValueError):
             pass  # Skip non-serializable values
 
-    with open(session_path, "w", encoding="utf-8") as f:
-        json.dump(serializable_state, f, ensure_ascii=False, indent=2)
+    save_json(session_path, serializable_state)
 
 
 # Page config
@@ -857,55 +860,64 @@ html {
 
 # === Data Loading Functions ===
 
-def load_jobs():
-    """Load jobs from scored_jobs.json."""
-    scored_path = TMP_DIR / "scored_jobs.json"
-    if scored_path.exists():
-        with open(scored_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return []
+JOBS_PAGE_SIZE = 50
+
+
+def load_job_stats():
+    """Load summary counts from the job store (no job rows are read)."""
+    with open_job_store() as store:
+        return store.stats()
+
 
+def load_run_delta():
+    """Return (old_run_id, new_run_id, delta) for the last two scrape runs, or None."""
+    with open_job_store() as store:
+        return store.latest_delta()
 
-def load_profile():
-    """Load user profile."""
-    if PROFILE_PATH.exists():
-        with open(PROFILE_PATH, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
-    return {"profile": {"skills": {"required": [], "preferred": []}, "locations": {"preferred": [], "acceptable": []}, "salary": {"minimum": 20000, "preferred": 30000}, "dealbreakers": []}, "scoring": {"weights": {}}}
+
+def count_jobs(**filters):
+    """Count jobs in the job store matching the Jobs page filters."""
+    with open_job_store() as store:
+        return store.count_jobs(**filters)
+
+
+def load_jobs(page=0, **filters):
+    """Load one page of filtered jobs from the job store as Job records, best fit first."""
+    with open_job_store() as store:
+        return store.query_jobs(limit=JOBS_PAGE_SIZE, offset=page * JOBS_PAGE_SIZE, **filters)
+
+
+def load_profile(mutable=False):
+    """Load user profile (cached until the file changes; pass mutable=True to edit it)."""
+    return load_yaml_cached(PROFILE_PATH, default={"profile": {"skills": {"required": [], "preferred": []}, "locations": {"preferred": [], "acceptable": []}, "salary": {"minimum": 20000, "preferred": 30000}, "dealbreakers": []}, "scoring": {"weights": {}}}, mutable=mutable)
 
 
 def save_profile(profile_data):
     """Save user profile."""
-    with open(PROFILE_PATH, "w", encoding="utf-8") as f:
-        yaml.dump(profile_data, f, default_flow_style=False, allow_unicode=True)
+    save_yaml(PROFILE_PATH, profile_data)
+    invalidate(PROFILE_PATH)
 
 
-def load_config():
-    """Load job search config."""
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
-    return {"search_params": {"titles": [], "location": "London", "posted_within_days": 7}, "api": {"max_results": 50, "pages": 3}}
+def load_config(mutable=False):
+    """Load job search config (cached until the file changes; pass mutable=True to edit it)."""
+    return load_yaml_cached(CONFIG_PATH, default={"search_params": {"titles": [], "location": "London", "posted_within_days": 7}, "api": {"max_results": 50, "pages": 3}}, mutable=mutable)
 
 
 def save_config(config_data):
     """Save job search config."""
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+    save_yaml(CONFIG_PATH, config_data)
+    invalidate(CONFIG_PATH)
 
 
-def load_qa_databank():
-    """Load Q&A databank."""
-    if QA_DATABANK_PATH.exists():
-        with open(QA_DATABANK_PATH, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
-    return {"personal_info": {}, "work_authorization": {}, "salary": {}, "questions": {}, "cover_letter": {}}
+def load_qa_databank(mutable=False):
+    """Load Q&A databank (cached until the file changes; pass mutable=True to edit it)."""
+    return load_yaml_cached(QA_DATABANK_PATH, default={"personal_info": {}, "work_authorization": {}, "salary": {}, "questions": {}, "cover_letter": {}}, mutable=mutable)
 
 
 def save_qa_databank(databank):
     """Save Q&A databank."""
-    with open(QA_DATABANK_PATH, "w", encoding="utf-8") as f:
-        yaml.dump(databank, f, default_flow_style=False, allow_unicode=True)
+    save_yaml(QA_DATABANK_PATH, databank)
+    invalidate(QA_DATABANK_PATH)
 
 
 def load_env_keys():
@@ -965,65 +977,54 @@ def save_env_keys(anthropic_key, serpapi_key):
     load_dotenv(override=True)
 
 
-def load_company_reports():
-    """Load saved company reports."""
-    if REPORTS_PATH.exists():
-        with open(REPORTS_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+def open_company_reports():
+    """Open the company report store with the TTL from config (reports.ttl_days)."""
+    ttl_days = (load_config().get("reports") or {}).get("ttl_days", DEFAULT_TTL_DAYS)
+    return open_report_store(ttl_days=ttl_days)
+
+
+def get_company_report(company_name):
+    """Return the saved report for a company, or None if missing or expired."""
+    with open_company_reports() as store:
+        return store.get(company_name)
 
 
 def save_company_report(company_name, report):
     """Save a company report."""
-    reports = load_company_reports()
-    reports[company_name] = report
-    TMP_DIR.mkdir(exist_ok=True)
-    with open(REPORTS_PATH, "w", encoding="utf-8") as f:
-        json.dump(reports, f, indent=2, ensure_ascii=False)
+    with open_company_reports() as store:
+        store.put(company_name, report)
 
 
 def load_cv_text():
     """Load saved CV text from disk."""
     cv_cache_path = TMP_DIR / "cv_text.json"
-    if cv_cache_path.exists():
-        try:
-            with open(cv_cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return data.get("text", ""), data.get("filename", "")
-        except:
-            return "", ""
-    return "", ""
+    try:
+        data = load_json(cv_cache_path, default={})
+        return data.get("text", ""), data.get("filename", "")
+    except:
+        return "", ""
 
 
 def save_cv_text(cv_text, filename=""):
     """Save CV text to disk for persistence across page refreshes."""
-    TMP_DIR.mkdir(exist_ok=True)
-    cv_cache_path = TMP_DIR / "cv_text.json"
-    with open(cv_cache_path, "w", encoding="utf-8") as f:
-        json.dump({"text": cv_text, "filename": filename}, f, ensure_ascii=False, indent=2)
+    save_json(TMP_DIR / "cv_text.json", {"text": cv_text, "filename": filename})
 
 
 def load_cv_extracted():
     """Load saved extracted CV data from disk."""
     cv_extracted_path = TMP_DIR / "cv_extracted.json"
-    if cv_extracted_path.exists():
-        try:
-            with open(cv_extracted_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except:
-            return None
-    return None
+    try:
+        return load_json(cv_extracted_path)
+    except:
+        return None
 
 
 def save_cv_extracted(extracted_data, timestamp):
     """Save extracted CV data to disk for persistence across page refreshes."""
-    TMP_DIR.mkdir(exist_ok=True)
-    cv_extracted_path = TMP_DIR / "cv_extracted.json"
-    with open(cv_extracted_path, "w", encoding="utf-8") as f:
-        json.dump({
-            "extracted": extracted_data,
-            "timestamp": timestamp
-        }, f, ensure_ascii=False, indent=2)
+    save_json(TMP_DIR / "cv_extracted.json", {
+        "extracted": extracted_data,
+        "timestamp": timestamp
+    })
 
 
 def run_tool(script_name):
@@ -1057,8 +1058,7 @@ ANTHROPIC_API_KEY=your-key-here
 """
 
     try:
-        import anthropic
-        client = anthropic.Anthropic(api_key=api_key)
+        client = get_client(api_key)
 
         message = client.messages.create(
             model="claude-3-haiku-20240307",
@@ -1079,6 +1079,38 @@ Be concise and actionable."""}]
         return f"**Error:** {str(e)}\n\n[Google {company_name}](https://www.google.com/search?q={company_name.replace(' ', '+')})"
 
 
+def highlight_matches(text, spans):
+    """Bold the precomputed skill-match spans in a job description.
+
+    Args:
+        text: Job description
+        spans: Dict of term -> [[start, end], ...] from the scorer's fit_breakdown
+
+    Returns:
+        str: Markdown with matched spans wrapped in ** **
+    """
+    ranges = sorted(sp for term_spans in spans.values() for sp in term_spans)
+    if not ranges:
+        return text
+
+    # Merge overlapping spans (e.g. "java" inside "javascript")
+    merged = [list(ranges[0])]
+    for start, end in ranges[1:]:
+        if start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    parts = []
+    last = 0
+    for start, end in merged:
+        parts.append(text[last:start])
+        parts.append(f"**{text[start:end]}**")
+        last = end
+    parts.append(text[last:])
+    return "".join(parts)
+
+
 def check_backend_status():
     """Check if the Flask backend is running."""
     try:
@@ -1088,6 +1120,52 @@ def check_backend_status():
         return False
 
 
+def load_api_metrics():
+    """Fetch the backend's metrics summary (/api/metrics?format=json), or None if unavailable."""
+    try:
+        response = requests.get("http://localhost:5000/api/metrics", params={"format": "json"}, timeout=2)
+        return response.json() if response.ok else None
+    except Exception:
+        return None
+
+
+def render_api_metrics(summary):
+    """Show request latency, stage timings, LLM usage and cache hit ratios from the API."""
+    def total(counter, **labels):
+        return sum(item["value"] for item in summary["counters"].get(counter, [])
+                   if all(item["labels"].get(k) == v for k, v in labels.items()))
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("LLM calls", total("llm_calls_total"))
+    c2.metric("LLM errors", total("llm_calls_total") - total("llm_calls_total", outcome="ok"))
+    c3.metric("Tokens (in/out)", f"{total('llm_tokens_total', direction='input'):,} / "
+                                 f"{total('llm_tokens_total', direction='output'):,}")
+    c4.metric("Regex fallbacks", total("regex_fallbacks_total"))
+
+    ratios = {item["labels"]["cache"]: item["value"] for item in summary["gauges"].get("cache_hit_ratio", [])}
+    if ratios:
+        st.caption("Cache hit ratio: " + " · ".join(f"{name} {ratio:.0%}" for name, ratio in sorted(ratios.items())))
+
+    rows = []
+    for histogram, label in (("request_seconds", "endpoint"), ("stage_seconds", "stage")):
+        for item in summary["histograms"].get(histogram, []):
+            rows.append({
+                "Type": label,
+                "Name": item["labels"].get(label, ""),
+                "Count": item["count"],
+                "Mean ms": item["mean_ms"],
+                "p50 ms": item["p50_ms"],
+                "p95 ms": item["p95_ms"],
+            })
+    if rows:
+        st.dataframe(rows, hide_index=True, use_container_width=True)
+    errors = total("requests_total") - sum(
+        item["value"] for item in summary["counters"].get("requests_total", [])
+        if item["labels"].get("status", "").startswith(("2", "3")))
+    st.caption(f"Uptime {summary['uptime_s'] / 60:.0f} min · {total('requests_total')} requests · "
+               f"{errors} errors · Prometheus format at http://localhost:5000/api/metrics")
+
+
 # === Navigation ===
 
 st.sidebar.markdown("# JobRadar")
@@ -1184,42 +1262,69 @@ if page == "Jobs":
     if missing_keys and not st.session_state.api_warning_dismissed:
         show_api_key_warning(missing_keys)
 
-    jobs = load_jobs()
+    stats = load_job_stats()
 
     # Stats row - compact
     c1, c2, c3, c4 = st.columns(4)
-    c1.metric("Total", len(jobs))
-    c2.metric("Matching", len([j for j in jobs if j.get("fit_score", 0) > 0]))
-    if jobs:
-        c3.metric("Top Score", max(j.get("fit_score", 0) for j in jobs))
-        c4.metric("Avg Score", f"{sum(j.get('fit_score', 0) for j in jobs) / len(jobs):.0f}")
+    c1.metric("Total", stats["total"])
+    c2.metric("Matching", stats["matching"])
+    if stats["total"]:
+        c3.metric("Top Score", stats["top_score"])
+        c4.metric("Avg Score", f"{stats['avg_score']:.0f}")
     else:
         c3.metric("Top Score", "-")
         c4.metric("Avg Score", "-")
 
     st.divider()
 
-    if not jobs:
+    if not stats["total"]:
         st.info("No jobs found. Go to **Actions** to scrape jobs.")
     else:
         # Filters - single compact row
-        f1, f2, f3 = st.columns([1, 2, 1])
+        f1, f2, f3, f4 = st.columns([1, 2, 1, 1])
         with f1:
             min_score = st.selectbox("Min Score", [0, 20, 40, 60, 80], index=0, label_visibility="collapsed")
         with f2:
-            search = st.text_input("Search", placeholder="Search jobs...", label_visibility="collapsed")
+            search = st.text_input(
+                "Search", placeholder='Search jobs... (prefix words, "exact phrase")',
+                label_visibility="collapsed",
+            )
         with f3:
+            min_salary = st.selectbox(
+                "Min Salary", [0, 20000, 30000, 40000, 50000, 70000], index=0,
+                format_func=lambda v: "Any salary" if v == 0 else f"£{v // 1000}K+",
+                label_visibility="collapsed",
+            )
+        with f4:
             show_zero = st.checkbox("Show 0", value=False, help="Include jobs with score=0")
+            run_delta = load_run_delta()
+            only_new = False
+            if run_delta:
+                old_run, new_run, delta = run_delta
+                new_count = len(delta["added"]) + len(delta["changed"])
+                only_new = st.checkbox(
+                    f"New ({new_count})", value=False,
+                    help="Only jobs added or changed in the latest scrape run",
+                )
 
-        # Filter jobs
-        filtered = [
-            j for j in jobs
-            if (j.get("fit_score", 0) >= min_score or (show_zero and j.get("fit_score", 0) == 0))
-            and (not search or search.lower() in j.get("title", "").lower() or search.lower() in j.get("company", "").lower())
-        ]
-        filtered.sort(key=lambda x: x.get("fit_score", 0), reverse=True)
+        # Filter jobs with an indexed query (salary_max is parsed once at ingest);
+        # searches use the full-text index and are ranked by relevance
+        filters = {
+            "min_score": min_score,
+            "include_zero": show_zero,
+            "min_salary": min_salary,
+            "search": search,
+            "delta": (old_run, new_run) if only_new else None,
+        }
+        match_count = count_jobs(**filters)
 
-        st.caption(f"Showing {len(filtered)} of {len(jobs)} jobs")
+        page_count = max(1, (match_count + JOBS_PAGE_SIZE - 1) // JOBS_PAGE_SIZE)
+        job_page = 0
+        if page_count > 1:
+            job_page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1) - 1
+        filtered = load_jobs(page=job_page, **filters)
+
+        st.caption(f"Showing {len(filtered)} of {match_count} matching jobs ({stats['total']} total)")
 
         if filtered:
             # Initialize selection
@@ -1292,9 +1397,9 @@ if page == "Jobs":
 
                 with b2:
                     company = job.get('company', '')
-                    reports = load_company_reports()
+                    company_report = get_company_report(company)
 
-                    if company in reports:
+                    if company_report is not None:
                         if st.button("View Report", use_container_width=True):
                             st.session_state['show_report'] = company
                     else:
@@ -1309,17 +1414,32 @@ if page == "Jobs":
 
                 # Show report OR description
                 if st.session_state.get('show_report') == job.get('company'):
-                    reports = load_company_reports()
-                    if job.get('company') in reports:
-                        st.markdown(reports[job.get('company')])
+                    if company_report is not None:
+                        st.markdown(company_report)
                         if st.button("Close Report", key="close_rep", use_container_width=True):
                             st.session_state['show_report'] = None
                             st.rerun()
                 else:
-                    # Show job description inline
+                    # Score breakdown precomputed by the scorer (no rescan on rerun)
+                    breakdown = job.get("fit_breakdown")
+                    if breakdown:
+                        with st.expander(f"Why {score}?"):
+                            if breakdown.get("dealbreaker"):
+                                st.markdown(f"Dealbreaker found: **{breakdown['dealbreaker']}**")
+                            for category, sub_score in breakdown.get("scores", {}).items():
+                                label = category.replace("_", " ").capitalize()
+                                hits = breakdown.get("matched", {}).get(category)
+                                suffix = f" · {', '.join(hits)}" if hits else ""
+                                st.caption(f"{label}: {sub_score:g}{suffix}")
+
+                    # Show job description inline, with matched skills highlighted
                     st.markdown("**Job Description**")
                     with st.container(height=300):
-                        st.write(job.get("description", "No description available."))
+                        description = job.get("description", "")
+                        if description and breakdown:
+                            st.markdown(highlight_matches(description, breakdown.get("spans", {})))
+                        else:
+                            st.write(description or "No description available.")
 
 
 # ============================================================
@@ -1331,10 +1451,10 @@ elif page == "Settings":
     st.caption("Configure your profile, job preferences, and Q&A databank")
     st.markdown("---")
 
-    # Load all data
-    profile = load_profile()
-    config = load_config()
-    databank = load_qa_databank()
+    # Load all data (editable copies; saved back below)
+    profile = load_profile(mutable=True)
+    config = load_config(mutable=True)
+    databank = load_qa_databank(mutable=True)
 
     user = profile.get("profile", {})
     skills = user.get("skills", {})
@@ -1928,8 +2048,9 @@ elif page == "Settings":
                 key="q_days"
             )
 
-        # Auto-save search config
+        # Auto-save search config (other sections such as sites/output/reports are kept)
         new_config = {
+            **config,
             "search_params": {
                 "titles": [t.strip() for t in new_titles.split("\n") if t.strip()],
                 "keywords": search_params.get("keywords", []),
@@ -2337,9 +2458,8 @@ elif page == "CV":
                 st.session_state['proceed_with_parse'] = False  # Reset flag
                 with st.spinner("Analyzing CV..."):
                     try:
-                        import anthropic
                         from datetime import datetime
-                        client = anthropic.Anthropic(api_key=api_key)
+                        client = get_client(api_key)
 
                         prompt = f"""Extract structured information from this CV/resume. BE EXTREMELY ACCURATE - do not invent or assume any information.
 
@@ -2492,7 +2612,7 @@ CRITICAL RULES FOR EDUCATION:
                             status_placeholder.info("💾 Saving to files...")
 
                             # Load and update databank
-                            databank = load_qa_databank()
+                            databank = load_qa_databank(mutable=True)
                             personal = databank.get("personal_info", {})
 
                             if extracted.get("name"):
@@ -2530,7 +2650,7 @@ CRITICAL RULES FOR EDUCATION:
                                 st.error(f"❌ FAILED TO SAVE PERSONAL INFO: {e}")
 
                             # Update profile with skills, experience, and education
-                            profile = load_profile()
+                            profile = load_profile(mutable=True)
                             profile_updated = False
 
                             # Save current role
@@ -2732,11 +2852,7 @@ elif page == "Projects":
 
     # Load or initialize projects
     projects_path = PROJECT_ROOT / "github_projects.yaml"
-    if projects_path.exists():
-        with open(projects_path, "r", encoding="utf-8") as f:
-            projects_data = yaml.safe_load(f) or {"projects": []}
-    else:
-        projects_data = {"projects": []}
+    projects_data = load_yaml(projects_path) or {"projects": []}
 
     projects = projects_data.get("projects", [])
 
@@ -2793,8 +2909,7 @@ elif page == "Projects":
                     projects.append(new_project)
                     projects_data["projects"] = projects
 
-                    with open(projects_path, "w", encoding="utf-8") as f:
-                        yaml.dump(projects_data, f, default_flow_style=False, allow_unicode=True)
+                    save_yaml(projects_path, projects_data)
 
                     st.session_state['adding_project'] = False
                     st.success("Project added!")
@@ -2847,8 +2962,7 @@ elif page == "Projects":
                     if st.button("Delete", key=f"del_{idx}", type="secondary", use_container_width=True):
                         projects.pop(idx)
                         projects_data["projects"] = projects
-                        with open(projects_path, "w", encoding="utf-8") as f:
-                            yaml.dump(projects_data, f, default_flow_style=False, allow_unicode=True)
+                        save_yaml(projects_path, projects_data)
                         st.rerun()
 
                 with col2:
@@ -2913,12 +3027,21 @@ elif page == "Actions":
                 st.code(stdout + stderr, language="text")
 
     # Quick stats
-    jobs = load_jobs()
-    if jobs:
+    stats = load_job_stats()
+    if stats["total"]:
         c1, c2, c3 = st.columns(3)
-        c1.metric("Total Jobs", len(jobs))
-        c2.metric("Matching", len([j for j in jobs if j.get('fit_score', 0) > 0]))
-        c3.metric("High Fit (70+)", len([j for j in jobs if j.get('fit_score', 0) >= 70]))
+        c1.metric("Total Jobs", stats["total"])
+        c2.metric("Matching", stats["matching"])
+        c3.metric("High Fit (70+)", stats["high_fit"])
+
+    run_delta = load_run_delta()
+    if run_delta:
+        _, new_run, delta = run_delta
+        st.caption(f"Last run ({new_run}): {len(delta['added'])} new · {len(delta['changed'])} changed · "
+                   f"{len(delta['removed'])} no longer listed")
+
+    cache = cache_stats()
+    st.caption(f"Config cache: {cache['hits']} hits · {cache['misses']} misses · {cache['entries']} files")
 
     st.divider()
 
@@ -2957,6 +3080,13 @@ elif page == "Actions":
     questions_count = len([q for q, a in databank.get("questions", {}).items() if a])
     st.caption(f"Q&A Bank: {questions_count} saved answers")
 
+    # API metrics (only if backend is running)
+    if backend_running:
+        api_metrics = load_api_metrics()
+        if api_metrics:
+            with st.expander("API metrics"):
+                render_api_metrics(api_metrics)
+
     # Test API section (only if backend is running)
     if backend_running:
         st.divider()
@@ -2992,18 +3122,15 @@ elif page == "History":
     st.caption("Track which answers you used for each application")
     st.markdown("---")
 
-    # Load history
-    history_path = TMP_DIR / "answer_usage_history.json"
-    history = []
-    if history_path.exists():
-        try:
-            with open(history_path, "r", encoding="utf-8") as f:
-                history = json.load(f)
-                history.reverse()  # Most recent first
-        except Exception as e:
-            st.error(f"Failed to load history: {e}")
+    # Load history stats (entries are read newest first, only as many as shown)
+    answer_log = open_answer_log()
+    stats = {"total": 0}
+    try:
+        stats = answer_log.stats()
+    except Exception as e:
+        st.error(f"Failed to load history: {e}")
 
-    if not history:
+    if not stats["total"]:
         st.info("No answer usage tracked yet. Use the Chrome extension to track answers.")
         st.markdown("""
 **How tracking works:**
@@ -3015,10 +3142,10 @@ elif page == "History":
     else:
         # Stats
         c1, c2, c3, c4 = st.columns(4)
-        c1.metric("Total", len(history))
-        c2.metric("Databank", len([h for h in history if h['source'] == 'databank']))
-        c3.metric("Custom", len([h for h in history if h['source'] != 'databank']))
-        c4.metric("Edited", len([h for h in history if h.get('was_edited', False)]))
+        c1.metric("Total", stats["total"])
+        c2.metric("Databank", stats["databank"])
+        c3.metric("Custom", stats["custom"])
+        c4.metric("Edited", stats["edited"])
 
         st.divider()
 
@@ -3033,18 +3160,16 @@ elif page == "History":
             limit = st.number_input("Show entries", min_value=5, max_value=100, value=20, step=5)
 
         # Apply filters
-        filtered = history
-        if filter_source != "All":
-            filtered = [h for h in filtered if h['source'].lower() == filter_source.lower()]
-        if filter_company:
-            filtered = [h for h in filtered if filter_company.lower() in h.get('company', '').lower()]
-
-        filtered = filtered[:int(limit)]
+        filtered = answer_log.query(
+            limit=int(limit),
+            source=filter_source if filter_source != "All" else None,
+            company=filter_company or None,
+        )
 
         st.divider()
 
         # Show history in clean cards
-        st.subheader(f"Recent Activity ({len(filtered)} / {len(history)} entries)")
+        st.subheader(f"Recent Activity ({len(filtered)} / {stats['total']} entries)")
 
         for idx, entry in enumerate(filtered):
             with st.container():
@@ -3072,7 +3197,7 @@ elif page == "History":
         if st.button("Export History as JSON", use_container_width=True):
             st.download_button(
                 "Download",
-                data=json.dumps(history, indent=2),
+                data=json.dumps(answer_log.query(), indent=2),
                 file_name=f"answer_history_{datetime.datetime.now().strftime('%Y%m%d')}.json",
                 mime="application/json"
             )
@@ -0,0 +1,140 @@
+"""Benchmark regex question extraction on large page texts.
+
+Run with: python benchmarks/bench_extraction.py [--sizes 10000 100000 1000000]
+
+Builds application pages of roughly the requested sizes (job descriptions
+from synthetic_jobs.py with forms and applicant questions scattered
+through them) and times tools/question_extractor.extract_questions
+against the per-pattern re.findall implementation it replaced (copied
+below). Outputs are asserted identical for every page.
+Results are appended to benchmarks/results/extraction_history.json.
+"""
+
+import argparse
+import random
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from bench_utils import append_history, comparison_report, load_history, time_call
+from synthetic_jobs import generate_jobs
+
+from question_extractor import extract_questions, is_job_description
+
+FORM_BLOCKS = [
+    "Personal Information\nFirst Name *\nLast Name *\nEmail Address *\nPhone Number *\n",
+    "Are you eligible to work in the UK? *\nDo you require visa sponsorship? *\n",
+    "Why are you interested in this role at our company?\nWhat is your expected salary?\n",
+    "Tell us about yourself in a few sentences\nDescribe your biggest technical achievement\n",
+    "Please provide a link to your portfolio\nLinkedIn Profile URL\nCover Letter (Optional)\n",
+    "Do you have experience with Python and SQL?\nNotice Period *\nStart Date\n",
+]
+
+
+def legacy_extract_questions_regex(page_text):
+    """The original implementation, kept verbatim as the reference."""
+    questions = []
+
+    question_patterns = [
+        r'(Why (?:are you|do you want)[^.?\n]{10,100}\?)',
+        r'(What (?:is your|are your)[^.?\n]{5,80}\?)',
+        r'(Do you (?:have|require|need)[^.?\n]{5,60}\?)',
+        r'(Are you (?:authorized|eligible|willing)[^.?\n]{5,60}\?)',
+        r'(Tell us about (?:yourself|your)[^.?\n]{5,60})',
+        r'(Describe your [^.?\n]{5,60})',
+        r'(Please (?:provide|describe|explain) [^.?\n]{5,60})',
+    ]
+
+    for pattern in question_patterns:
+        matches = re.findall(pattern, page_text, re.IGNORECASE)
+        for match in matches:
+            if isinstance(match, tuple):
+                match = match[0]
+            match = match.strip()
+            if not is_job_description(match):
+                if match and match not in questions:
+                    questions.append(match)
+
+    form_fields = [
+        'First Name', 'Last Name', 'Full Name', 'Email', 'Email Address',
+        'Phone', 'Phone Number', 'Mobile Number', 'Address', 'City',
+        'Postcode', 'Post Code', 'Zip Code', 'Country', 'LinkedIn',
+        'Expected Salary', 'Current Salary', 'Notice Period', 'Start Date',
+        'Cover Letter', 'Resume', 'CV'
+    ]
+
+    text_lower = page_text.lower()
+    for field in form_fields:
+        if field.lower() in text_lower and field not in questions:
+            questions.append(field)
+
+    seen = set()
+    unique = []
+    for q in questions:
+        q_lower = q.lower().strip()
+        if q_lower not in seen:
+            seen.add(q_lower)
+            unique.append(q)
+
+    return unique[:15]
+
+
+def build_page(size, seed):
+    """An application page of about `size` characters: job descriptions with form blocks mixed in."""
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    jobs = iter(generate_jobs(max(size // 500, 10), seed=seed))
+    while length < size:
+        job = next(jobs, None)
+        if job is None:
+            jobs = iter(generate_jobs(max(size // 500, 10), seed=rng.randint(0, 10**6)))
+            continue
+        part = job["description"] + "\n"
+        if rng.random() < 0.2:
+            part += rng.choice(FORM_BLOCKS)
+        parts.append(part)
+        length += len(part)
+    parts.append("".join(FORM_BLOCKS))
+    return "".join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="Page sizes in characters")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case (best is kept)")
+    args = parser.parse_args()
+
+    params = {"sizes": args.sizes, "seed": args.seed, "repeat": args.repeat}
+    results = {}
+    for size in args.sizes:
+        page = build_page(size, args.seed)
+        legacy_s, expected = time_call(lambda: legacy_extract_questions_regex(page), repeat=args.repeat)
+        new_s, actual = time_call(lambda: extract_questions(page), repeat=args.repeat)
+        assert actual == expected, f"{size}: output differs from the original implementation"
+        results[f"page_{size}"] = {
+            "chars": len(page),
+            "questions": len(actual),
+            "legacy_ms": round(legacy_s * 1000, 3),
+            "ms": round(new_s * 1000, 3),
+            "speedup": round(legacy_s / new_s, 1) if new_s else None,
+        }
+
+    for name, values in results.items():
+        print(f"{name}:")
+        for key, value in values.items():
+            print(f"  {key}: {value}")
+
+    previous = [run for run in load_history("extraction") if run["params"] == params]
+    entry = append_history("extraction", params, results)
+    print()
+    print(comparison_report(previous[-1] if previous else None, entry, ["ms"]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""Benchmark connection reuse of the shared LLM client against a local stub server.
+
+Run with: python benchmarks/bench_llm_client.py [--calls 50] [--threads 4]
+
+Starts a stub Anthropic Messages API on localhost that counts TCP
+connections, then makes the same number of messages.create() calls two
+ways: a new anthropic.Anthropic client per call (what the app used to do)
+and tools/llm_client.get_client(). With the shared client every call after
+the first reuses a pooled keep-alive connection. The stub adds a fixed
+connection setup delay (--handshake-ms) to stand in for the TLS handshake
+a real API connection pays. No API key or network access is needed.
+Results are appended to benchmarks/results/llm_client_history.json.
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from bench_utils import append_history, comparison_report, load_history, time_call
+
+STUB_RESPONSE = json.dumps({
+    "id": "msg_stub",
+    "type": "message",
+    "role": "assistant",
+    "model": "claude-3-haiku-20240307",
+    "content": [{"type": "text", "text": "[\"First Name\", \"Email\"]"}],
+    "stop_reason": "end_turn",
+    "stop_sequence": None,
+    "usage": {"input_tokens": 100, "output_tokens": 10},
+}).encode("utf-8")
+
+
+class StubServer(ThreadingHTTPServer):
+    """Minimal Messages API stub that counts connections and requests."""
+
+    daemon_threads = True
+
+    def __init__(self, handshake_seconds=0.0):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.handshake_seconds = handshake_seconds
+        self.connections = 0
+        self.requests = 0
+        self._count_lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def reset(self):
+        with self._count_lock:
+            self.connections = 0
+            self.requests = 0
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def setup(self):
+        super().setup()
+        with self.server._count_lock:
+            self.server.connections += 1
+        time.sleep(self.server.handshake_seconds)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.server._count_lock:
+            self.server.requests += 1
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(STUB_RESPONSE)))
+        self.end_headers()
+        self.wfile.write(STUB_RESPONSE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_calls(get, calls, threads):
+    """Make `calls` messages.create() requests, getting a client from get() each time."""
+    def call(_):
+        get().messages.create(
+            model="claude-3-haiku-20240307",
+            max_tokens=100,
+            messages=[{"role": "user", "content": "Extract form fields"}],
+        )
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(call, range(calls)))
+
+
+def bench_case(server, name, get, calls, threads):
+    server.reset()
+    seconds, _ = time_call(lambda: make_calls(get, calls, threads))
+    assert server.requests == calls, f"{name}: expected {calls} requests, stub saw {server.requests}"
+    return {
+        "calls": calls,
+        "connections": server.connections,
+        "s": round(seconds, 4),
+        "ms_per_call": round(seconds / calls * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--threads", type=int, default=4, help="Concurrent callers (like API worker threads)")
+    parser.add_argument("--handshake-ms", type=float, default=20.0,
+                        help="Simulated connection setup cost per new connection")
+    args = parser.parse_args()
+
+    try:
+        import anthropic
+    except ImportError:
+        print("anthropic is not installed: pip install -r requirements.txt")
+        return 1
+    import llm_client
+
+    server = StubServer(handshake_seconds=args.handshake_ms / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    params = {"calls": args.calls, "threads": args.threads, "handshake_ms": args.handshake_ms}
+    results = {}
+    try:
+        results["client_per_call"] = bench_case(
+            server, "client_per_call",
+            lambda: anthropic.Anthropic(api_key="stub-key", base_url=server.base_url),
+            args.calls, args.threads,
+        )
+        results["shared_client"] = bench_case(
+            server, "shared_client",
+            lambda: llm_client.get_client("stub-key", base_url=server.base_url),
+            args.calls, args.threads,
+        )
+    finally:
+        llm_client.close_clients()
+        server.shutdown()
+
+    for name, values in results.items():
+        print(f"{name}:")
+        for key, value in values.items():
+            print(f"  {key}: {value}")
+
+    previous = [run for run in load_history("llm_client") if run["params"] == params]
+    entry = append_history("llm_client", params, results)
+    print()
+    print(comparison_report(previous[-1] if previous else None, entry, ["s", "connections"]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""Benchmark the persistence layer against stdlib json / pure-Python YAML.
+
+Run with: python benchmarks/bench_persistence.py [--jobs 1000 10000] [--history 5000]
+
+Builds files shaped like the ones the app reads and writes (scored jobs
+export, answer usage history, session state, Q&A databank, user profile)
+and times load and save through tools/persistence.py versus the code it
+replaced (json.dump(indent=2) / json.load, yaml.safe_load / yaml.dump).
+Results are appended to benchmarks/results/persistence_history.json.
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+import yaml
+
+from bench_utils import append_history, comparison_report, load_history, time_call
+from synthetic_jobs import BENCH_PROFILE, generate_jobs
+
+import persistence
+
+
+def scored_jobs(count, seed):
+    """Scored job dicts with a fit breakdown, like .tmp/scored_jobs.json."""
+    jobs = []
+    for job in generate_jobs(count, seed=seed):
+        job["fit_score"] = random.randint(0, 100)
+        job["fit_breakdown"] = {
+            "score": job["fit_score"],
+            "scores": {"required_skills": 66.7, "preferred_skills": 33.3, "location": 100,
+                       "title_relevance": 50, "salary": 50},
+            "matched": {"required": ["Python"], "preferred": ["SQL", "Git"], "location": "London"},
+            "spans": {"Python": [[12, 18], [140, 146]], "SQL": [[300, 303]]},
+        }
+        jobs.append(job)
+    return jobs
+
+
+def answer_history(count, seed):
+    """Entries like .tmp/answer_usage_history.json."""
+    rng = random.Random(seed)
+    sources = ["databank", "ai_generated", "edited", "manual"]
+    return [{
+        "question": f"Question {i}: why do you want to work at company {rng.randint(1, 500)}?",
+        "answer": " ".join(rng.choice(["I", "enjoy", "building", "reliable", "software", "teams"])
+                           for _ in range(rng.randint(10, 80))),
+        "source": rng.choice(sources),
+        "url": f"https://jobs.example.com/apply/{rng.randint(1, 10**6)}",
+        "timestamp": f"2026-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}T12:00:00",
+    } for i in range(count)]
+
+
+def session_state(seed):
+    """A session_state.json-sized dict of widget values and cached page data."""
+    rng = random.Random(seed)
+    state = {f"setting_{i}": rng.choice([True, False, 0, 42, "London", None]) for i in range(200)}
+    state["cv_extracted"] = {"skills": [f"skill {i}" for i in range(60)],
+                             "experience": [{"title": f"Role {i}", "summary": "x" * 400} for i in range(8)]}
+    return state
+
+
+def qa_databank(questions):
+    """A qa_databank.yaml with the template sections plus many saved answers."""
+    return {
+        "personal_info": {"full_name": "Benchmark Candidate", "email": "bench@example.com",
+                          "phone": "+44 7700 900000", "city": "London", "country": "United Kingdom",
+                          "linkedin": "linkedin.com/in/bench", "github": "github.com/bench"},
+        "work_authorization": {"right_to_work": "Yes", "visa_sponsorship": "No"},
+        "salary": {"expected": "35000", "minimum": "30000"},
+        "questions": {f"Describe a time you handled situation {i}": "I " + "did a thing and learned. " * 12
+                      for i in range(questions)},
+        "cover_letter": {"intro": "Dear Hiring Manager,", "body": "Lorem ipsum. " * 40, "closing": "Best"},
+    }
+
+
+def bench_json(name, data, directory, repeat):
+    """Time save and load of one JSON payload, old vs new, plus file size."""
+    old_path = directory / f"{name}_old.json"
+    new_path = directory / f"{name}_new.json"
+
+    def old_save():
+        with open(old_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+    def old_load():
+        with open(old_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    old_save_s, _ = time_call(old_save, repeat=repeat)
+    new_save_s, _ = time_call(lambda: persistence.save_json(new_path, data), repeat=repeat)
+    old_load_s, old_data = time_call(old_load, repeat=repeat)
+    new_load_s, new_data = time_call(lambda: persistence.load_json(new_path), repeat=repeat)
+    assert old_data == new_data, f"{name}: round-trip mismatch"
+
+    return {
+        "stdlib_save_s": round(old_save_s, 5),
+        "save_s": round(new_save_s, 5),
+        "stdlib_load_s": round(old_load_s, 5),
+        "load_s": round(new_load_s, 5),
+        "stdlib_kb": round(old_path.stat().st_size / 1024, 1),
+        "kb": round(new_path.stat().st_size / 1024, 1),
+        "save_speedup": round(old_save_s / new_save_s, 1) if new_save_s else None,
+        "load_speedup": round(old_load_s / new_load_s, 1) if new_load_s else None,
+    }
+
+
+def bench_yaml(name, data, directory, repeat):
+    """Time save and load of one YAML document, pure-Python vs persistence."""
+    old_path = directory / f"{name}_old.yaml"
+    new_path = directory / f"{name}_new.yaml"
+
+    def old_save():
+        with open(old_path, "w", encoding="utf-8") as f:
+            yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+
+    def old_load():
+        with open(old_path, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f)
+
+    old_save_s, _ = time_call(old_save, repeat=repeat)
+    new_save_s, _ = time_call(lambda: persistence.save_yaml(new_path, data), repeat=repeat)
+    old_load_s, old_data = time_call(old_load, repeat=repeat)
+    new_load_s, new_data = time_call(lambda: persistence.load_yaml(new_path), repeat=repeat)
+    assert old_data == new_data == data, f"{name}: round-trip mismatch"
+
+    return {
+        "stdlib_save_s": round(old_save_s, 5),
+        "save_s": round(new_save_s, 5),
+        "stdlib_load_s": round(old_load_s, 5),
+        "load_s": round(new_load_s, 5),
+        "save_speedup": round(old_save_s / new_save_s, 1) if new_save_s else None,
+        "load_speedup": round(old_load_s / new_load_s, 1) if new_load_s else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1_000, 10_000],
+                        help="Sizes of the scored jobs export")
+    parser.add_argument("--history", type=int, default=5_000, help="Answer history entries")
+    parser.add_argument("--questions", type=int, default=300, help="Saved databank answers")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case (best is kept)")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    params = {"jobs": args.jobs, "history": args.history, "questions": args.questions,
+              "seed": args.seed, "repeat": args.repeat,
+              "json_backend": persistence.JSON_BACKEND, "yaml_backend": persistence.YAML_BACKEND}
+    print(f"Backends: JSON={persistence.JSON_BACKEND}, YAML={persistence.YAML_BACKEND}")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        json_cases = {f"scored_jobs_{n}": scored_jobs(n, args.seed) for n in args.jobs}
+        json_cases["answer_history"] = answer_history(args.history, args.seed)
+        json_cases["session_state"] = session_state(args.seed)
+        yaml_cases = {"qa_databank": qa_databank(args.questions), "user_profile": BENCH_PROFILE}
+
+        for name, data in json_cases.items():
+            results[name] = bench_json(name, data, directory, args.repeat)
+        for name, data in yaml_cases.items():
+            results[name] = bench_yaml(name, data, directory, args.repeat)
+
+    for name, values in results.items():
+        print(f"{name}:")
+        for key, value in values.items():
+            print(f"  {key}: {value}")
+
+    previous = [run for run in load_history("persistence") if run["params"] == params]
+    entry = append_history("persistence", params, results)
+    print()
+    print(comparison_report(previous[-1] if previous else None, entry, ["save_s", "load_s", "kb"]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
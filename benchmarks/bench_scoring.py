@@ -0,0 +1,91 @@
+"""Benchmark calculate_fit_score and score_jobs on synthetic jobs.
+
+Run with: python benchmarks/bench_scoring.py [--sizes 1000 10000 100000 1000000]
+
+Each size is timed (best of --repeat) and, unless --no-memory is given,
+run once more under tracemalloc for peak memory. Results are appended to
+benchmarks/results/scoring_history.json and compared with the previous run
+that used the same parameters.
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+
+from bench_utils import append_history, comparison_report, load_history, peak_memory, time_call
+from synthetic_jobs import BENCH_PROFILE, generate_jobs
+
+from job_record import Job
+from score_job_fit import calculate_fit_score, score_jobs
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+
+def bench_size(size, args):
+    """Benchmark both scoring entry points for one job count."""
+    jobs = list(generate_jobs(size, seed=args.seed, hit_rate=args.hit_rate,
+                              dealbreaker_rate=args.dealbreaker_rate))
+
+    def score_each():
+        for job in jobs:
+            calculate_fit_score(job, BENCH_PROFILE)
+
+    def score_all():
+        # score_jobs prints a summary; keep benchmark output readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            return score_jobs(jobs, profile=BENCH_PROFILE)
+
+    per_job_seconds, _ = time_call(score_each, repeat=args.repeat)
+    batch_seconds, _ = time_call(score_all, repeat=args.repeat)
+
+    result = {
+        "calculate_fit_score_s": round(per_job_seconds, 4),
+        "score_jobs_s": round(batch_seconds, 4),
+        "jobs_per_s": round(size / batch_seconds) if batch_seconds else None,
+    }
+    if not args.no_memory:
+        result["score_jobs_peak_mb"] = round(peak_memory(score_all) / 1_048_576, 2)
+        # Cost of holding the job list itself: plain dicts vs slotted Job records
+        result["dict_records_mb"] = round(peak_memory(lambda: [dict(j) for j in jobs]) / 1_048_576, 2)
+        result["job_records_mb"] = round(peak_memory(lambda: [Job.from_dict(j) for j in jobs]) / 1_048_576, 2)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--hit-rate", type=float, default=0.3,
+                        help="Probability each profile skill appears in a description")
+    parser.add_argument("--dealbreaker-rate", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per size (best is kept)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass")
+    args = parser.parse_args()
+
+    params = {
+        "sizes": args.sizes,
+        "seed": args.seed,
+        "hit_rate": args.hit_rate,
+        "dealbreaker_rate": args.dealbreaker_rate,
+        "repeat": args.repeat,
+    }
+
+    results = {}
+    for size in args.sizes:
+        print(f"Scoring {size:,} jobs...", flush=True)
+        results[f"{size}_jobs"] = bench_size(size, args)
+        for key, value in results[f"{size}_jobs"].items():
+            print(f"  {key}: {value}")
+
+    previous = [run for run in load_history("scoring") if run["params"] == params]
+    entry = append_history("scoring", params, results)
+    print()
+    print(comparison_report(previous[-1] if previous else None, entry,
+                            ["calculate_fit_score_s", "score_jobs_s", "score_jobs_peak_mb",
+                             "job_records_mb"]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
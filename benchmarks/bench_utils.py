@@ -0,0 +1,104 @@
+"""Shared timing, memory and history helpers for the benchmark scripts."""
+
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def time_call(fn, repeat=1):
+    """Run fn repeat times and return (best seconds, last result)."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def peak_memory(fn):
+    """Run fn under tracemalloc and return peak traced allocation in bytes."""
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def git_commit():
+    """Return the current short commit hash, or '' outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent, capture_output=True, text=True, timeout=5,
+        ).stdout.strip()
+    except Exception:
+        return ""
+
+
+def load_history(name):
+    """Load the list of previous runs for a benchmark."""
+    path = RESULTS_DIR / f"{name}_history.json"
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return []
+
+
+def append_history(name, params, results):
+    """Append a run to the benchmark's JSON history file and return the entry."""
+    history = load_history(name)
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "params": params,
+        "results": results,
+    }
+    history.append(entry)
+    RESULTS_DIR.mkdir(exist_ok=True)
+    with open(RESULTS_DIR / f"{name}_history.json", "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=2)
+    return entry
+
+
+def comparison_report(previous, current, metrics):
+    """Format a comparison of two history entries.
+
+    Args:
+        previous: Earlier history entry, or None
+        current: History entry just recorded
+        metrics: Result keys to compare (lower is better)
+
+    Returns:
+        str: One line per (case, metric) with the relative change
+    """
+    if previous is None:
+        return "No previous baseline - this run is the new baseline."
+
+    lines = [f"Compared with {previous['timestamp']} ({previous.get('commit') or 'unknown commit'}):"]
+    for case, values in current["results"].items():
+        before = previous["results"].get(case)
+        if not before:
+            lines.append(f"  {case}: no baseline")
+            continue
+        for metric in metrics:
+            if metric not in values or not before.get(metric):
+                continue
+            change = (values[metric] - before[metric]) / before[metric] * 100
+            if abs(change) < 1:
+                verdict = "unchanged"
+            else:
+                verdict = "faster/smaller" if change < 0 else "slower/larger"
+            lines.append(f"  {case} {metric}: {before[metric]:.4g} -> {values[metric]:.4g} "
+                         f"({change:+.1f}%, {verdict})")
+    return "\n".join(lines)
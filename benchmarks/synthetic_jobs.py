@@ -0,0 +1,114 @@
+"""Seeded synthetic job generator for benchmarking the scoring pipeline.
+
+Produces job dicts shaped like normalize_job() output, with title and
+description lengths drawn from distributions close to real SerpAPI results
+and a configurable rate at which profile skills appear in descriptions.
+"""
+
+import random
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add tools directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+
+from salary_parser import parse_salary
+
+# Skills used by BENCH_PROFILE; hit_rate controls how often each appears
+REQUIRED_SKILLS = ["Python", "JavaScript", "communication"]
+PREFERRED_SKILLS = ["React", "Node.js", "SQL", "Git", "Docker", "AWS"]
+DEALBREAKERS = ["senior", "lead", "10+ years", "must have degree"]
+
+BENCH_PROFILE = {
+    "profile": {
+        "name": "Benchmark Candidate",
+        "skills": {"required": REQUIRED_SKILLS, "preferred": PREFERRED_SKILLS},
+        "locations": {"preferred": ["London", "Remote", "Hybrid"],
+                      "acceptable": ["Manchester", "Birmingham"]},
+        "salary": {"minimum": 25000, "preferred": 35000},
+        "dealbreakers": DEALBREAKERS,
+    },
+    "scoring": {"weights": {
+        "required_skills": 0.35,
+        "preferred_skills": 0.20,
+        "location": 0.20,
+        "title_relevance": 0.15,
+        "salary": 0.10,
+    }},
+}
+
+SENIORITY = ["", "", "", "Junior ", "Graduate ", "Mid-Level ", "Senior ", "Lead "]
+TECH = ["", "", "Python ", "Backend ", "Frontend ", "Full Stack ", "Data ", "Cloud ", "QA "]
+ROLES = ["Developer", "Software Engineer", "Engineer", "Analyst", "Programmer",
+         "Consultant", "Administrator", "Technician", "Support Specialist"]
+COMPANIES = [f"Company {i}" for i in range(500)]
+LOCATIONS = ["London", "London, UK", "Remote", "Manchester", "Birmingham", "Leeds",
+             "Bristol", "Edinburgh", "Hybrid - London", "Cambridge", "Glasgow"]
+SALARIES = ["", "", "", "£25K–£30K a year", "£30,000 - £35,000 per annum",
+            "£15 an hour", "Up to £45k", "£400 a day", "£2,800 a month", "Competitive"]
+
+FILLER = [
+    "We are a fast-growing team building products used by thousands of customers.",
+    "You will work closely with product managers and designers.",
+    "Our office is close to public transport and offers flexible working.",
+    "The role involves maintaining existing systems and building new features.",
+    "We value curiosity, ownership and a willingness to learn.",
+    "Benefits include a pension scheme, private healthcare and 25 days holiday.",
+    "You will take part in code reviews and contribute to technical decisions.",
+    "Our stack is evolving and we are open to new ideas.",
+    "Training and mentoring are available for the right candidate.",
+    "The team runs regular knowledge-sharing sessions and hack days.",
+]
+
+
+def _description(rng, hit_rate, dealbreaker_rate):
+    """Build one description of realistic length with seeded skill hits."""
+    # Lengths cluster around ~1,200 chars; normalize_job caps at 2,000
+    target = min(2000, max(150, int(rng.lognormvariate(7.0, 0.5))))
+    sentences = []
+    for skill in REQUIRED_SKILLS + PREFERRED_SKILLS:
+        if rng.random() < hit_rate:
+            sentences.append(f"Experience with {skill} is important for this role.")
+    if rng.random() < dealbreaker_rate:
+        sentences.append(f"This is a {rng.choice(DEALBREAKERS)} position.")
+    while sum(len(s) + 1 for s in sentences) < target:
+        sentences.append(rng.choice(FILLER))
+    rng.shuffle(sentences)
+    return " ".join(sentences)[:2000]
+
+
+def generate_jobs(count, seed=42, hit_rate=0.3, dealbreaker_rate=0.1, pool_size=2000):
+    """Yield count synthetic job dicts.
+
+    Args:
+        count: Number of jobs to generate
+        seed: RNG seed, so runs are reproducible
+        hit_rate: Probability each profile skill appears in a description
+        dealbreaker_rate: Probability a description contains a dealbreaker
+        pool_size: Number of distinct descriptions; jobs draw from this pool
+            (like real agency reposts) so 1M-job runs fit in memory
+
+    Yields:
+        dict: Job shaped like scraper_utils.normalize_job output
+    """
+    rng = random.Random(seed)
+    pool = [_description(rng, hit_rate, dealbreaker_rate) for _ in range(min(pool_size, count))]
+    scraped_at = datetime(2026, 1, 1, tzinfo=timezone.utc).isoformat(timespec="seconds")
+
+    for i in range(count):
+        salary = rng.choice(SALARIES)
+        salary_min, salary_max = parse_salary(salary)
+        yield {
+            "title": f"{rng.choice(SENIORITY)}{rng.choice(TECH)}{rng.choice(ROLES)}",
+            "company": rng.choice(COMPANIES),
+            "location": rng.choice(LOCATIONS),
+            "url": f"https://example.com/jobs/{seed}/{i}",
+            "date_posted": f"{rng.randint(1, 30)} days ago",
+            "salary": salary,
+            "salary_min": salary_min,
+            "salary_max": salary_max,
+            "description": rng.choice(pool),
+            "source": "google_jobs (synthetic)",
+            "scraped_at": scraped_at,
+        }
@@ -52,6 +52,7 @@ def main():
         'streamlit',
         'flask',
         'flask_cors',
+        'waitress',
         'anthropic',
         'yaml',
         'dotenv',
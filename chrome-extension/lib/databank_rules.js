@@ -0,0 +1,130 @@
+// Generated by tools/databank_rules.py --export. Do not edit by hand.
+export const DATABANK_RULES = [
+  {
+    "name": "first_name",
+    "priority": 10,
+    "any": [
+      "first name"
+    ],
+    "none": [
+      "last"
+    ],
+    "path": "personal_info.full_name",
+    "transform": "first",
+    "source": "personal_info"
+  },
+  {
+    "name": "last_name",
+    "priority": 20,
+    "any": [
+      "last name",
+      "surname",
+      "family name"
+    ],
+    "path": "personal_info.full_name",
+    "transform": "last",
+    "source": "personal_info"
+  },
+  {
+    "name": "full_name",
+    "priority": 30,
+    "any": [
+      "your name",
+      "full name"
+    ],
+    "path": "personal_info.full_name",
+    "source": "personal_info",
+    "exact": [
+      "name"
+    ]
+  },
+  {
+    "name": "email",
+    "priority": 40,
+    "any": [
+      "email",
+      "e-mail"
+    ],
+    "path": "personal_info.email",
+    "source": "personal_info"
+  },
+  {
+    "name": "phone",
+    "priority": 50,
+    "any": [
+      "phone",
+      "telephone",
+      "mobile",
+      "contact number"
+    ],
+    "path": "personal_info.phone",
+    "source": "personal_info"
+  },
+  {
+    "name": "location",
+    "priority": 60,
+    "any": [
+      "location",
+      "address",
+      "city",
+      "where do you live"
+    ],
+    "path": "personal_info.location",
+    "source": "personal_info"
+  },
+  {
+    "name": "linkedin",
+    "priority": 70,
+    "any": [
+      "linkedin"
+    ],
+    "path": "personal_info.linkedin",
+    "source": "personal_info"
+  },
+  {
+    "name": "salary",
+    "priority": 80,
+    "any": [
+      "salary",
+      "compensation",
+      "pay",
+      "wage",
+      "expected"
+    ],
+    "path": "salary.expected_salary",
+    "source": "salary"
+  },
+  {
+    "name": "work_authorization",
+    "priority": 90,
+    "any": [
+      "work in uk",
+      "eligible to work",
+      "right to work",
+      "authorization"
+    ],
+    "path": "work_authorization.eligible_to_work_uk",
+    "source": "work_auth"
+  },
+  {
+    "name": "sponsorship",
+    "priority": 100,
+    "any": [
+      "sponsor",
+      "visa"
+    ],
+    "path": "work_authorization.require_sponsorship",
+    "source": "work_auth"
+  },
+  {
+    "name": "notice_period",
+    "priority": 110,
+    "any": [
+      "notice period",
+      "start date",
+      "when can you start"
+    ],
+    "path": "work_authorization.notice_period",
+    "source": "work_auth"
+  }
+];
@@ -6,6 +6,82 @@
  * Works completely offline without backend dependency.
  */
 
+import { DATABANK_RULES } from './databank_rules.js';
+
+/**
+ * Build a matcher that finds which keywords occur in a text in one pass.
+ * Ported from tools/text_match.py KeywordScanner: a lookahead alternation
+ * (longest keyword first) reports the longest keyword at each position, and
+ * shorter keywords that are its prefixes are added from a precomputed map.
+ * @param {string[]} keywords - Literal keywords (lowercase)
+ * @returns {function(string): Set<string>} - Returns the keywords found in a text
+ */
+function buildKeywordScanner(keywords) {
+  const unique = [...new Set(keywords)].sort((a, b) => b.length - a.length || (a < b ? -1 : 1));
+  const escaped = unique.map(k => k.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'));
+  const regex = new RegExp(`(?=(${escaped.join('|')}))`, 'g');
+  const prefixes = new Map(unique.map(k => [k, unique.filter(p => k.startsWith(p))]));
+
+  return (text) => {
+    const found = new Set();
+    for (const match of text.matchAll(regex)) {
+      for (const keyword of prefixes.get(match[1])) {
+        found.add(keyword);
+      }
+    }
+    return found;
+  };
+}
+
+// Rules generated from tools/databank_rules.py, tried in priority order
+const RULES = [...DATABANK_RULES].sort((a, b) => a.priority - b.priority);
+const scanKeywords = buildKeywordScanner(
+  RULES.flatMap(rule => [...rule.any, ...(rule.none || [])])
+);
+
+/**
+ * Look up a dotted path (e.g. "personal_info.email") in the databank.
+ * @param {Object} databank - Q&A databank structure
+ * @param {string} path - Dotted path
+ * @returns {*} - Value, or undefined if any part is missing
+ */
+function lookup(databank, path) {
+  return path.split('.').reduce((value, key) => (value ? value[key] : undefined), databank);
+}
+
+/**
+ * Answer a question from the first rule it triggers whose databank value is set.
+ * @param {string} question - Question to match
+ * @param {Object} databank - Q&A databank structure
+ * @returns {Object|null} - { answer, score, source } or null if no rule applies
+ */
+function matchRule(question, databank) {
+  const qLower = question.toLowerCase();
+  const found = scanKeywords(qLower);
+
+  for (const rule of RULES) {
+    const triggered = rule.any.some(k => found.has(k)) || (rule.exact || []).includes(qLower);
+    if (!triggered || (rule.none || []).some(k => found.has(k))) {
+      continue;
+    }
+
+    const value = lookup(databank, rule.path);
+    if (!value) {
+      continue;
+    }
+
+    let answer = value;
+    if (rule.transform === 'first') {
+      answer = value.split(' ')[0] || '';
+    } else if (rule.transform === 'last') {
+      answer = value.split(' ').slice(1).join(' ') || '';
+    }
+    return { answer, score: 1.0, source: rule.source };
+  }
+
+  return null;
+}
+
 /**
  * Calculate word overlap similarity between two texts.
  * @param {string} text1 - First text
@@ -45,9 +121,6 @@ export function calculateSimilarity(text1, text2) {
  */
 export function matchToDatabank(question, databank) {
   const questions = databank.questions || {};
-  const personalInfo = databank.personal_info || {};
-  const salaryInfo = databank.salary || {};
-  const workAuth = databank.work_authorization || {};
 
   let bestMatch = null;
   let bestScore = 0;
@@ -66,87 +139,10 @@ export function matchToDatabank(question, databank) {
     }
   }
 
-  const qLower = question.toLowerCase();
-
-  // 2. Check personal info patterns (exact matches)
-
-  // Name patterns
-  const fullName = personalInfo.full_name || '';
-  if (fullName) {
-    const nameParts = fullName.split(' ');
-    const firstName = nameParts[0] || '';
-    const lastName = nameParts.slice(1).join(' ') || '';
-
-    // First name only
-    if (qLower.includes('first name') && !qLower.includes('last')) {
-      return { answer: firstName, score: 1.0, source: 'personal_info' };
-    }
-
-    // Last name only
-    if (qLower.includes('last name') || qLower.includes('surname') || qLower.includes('family name')) {
-      return { answer: lastName, score: 1.0, source: 'personal_info' };
-    }
-
-    // Full name
-    if (qLower.includes('your name') || qLower.includes('full name') || (qLower === 'name' && qLower.length < 10)) {
-      return { answer: fullName, score: 1.0, source: 'personal_info' };
-    }
-  }
-
-  // Email patterns
-  if (qLower.includes('email') || qLower.includes('e-mail')) {
-    if (personalInfo.email) {
-      return { answer: personalInfo.email, score: 1.0, source: 'personal_info' };
-    }
-  }
-
-  // Phone patterns
-  if (qLower.includes('phone') || qLower.includes('telephone') || qLower.includes('mobile') || qLower.includes('contact number')) {
-    if (personalInfo.phone) {
-      return { answer: personalInfo.phone, score: 1.0, source: 'personal_info' };
-    }
-  }
-
-  // Location patterns
-  if (qLower.includes('location') || qLower.includes('address') || qLower.includes('city') || qLower.includes('where do you live')) {
-    if (personalInfo.location) {
-      return { answer: personalInfo.location, score: 1.0, source: 'personal_info' };
-    }
-  }
-
-  // LinkedIn patterns
-  if (qLower.includes('linkedin')) {
-    if (personalInfo.linkedin) {
-      return { answer: personalInfo.linkedin, score: 1.0, source: 'personal_info' };
-    }
-  }
-
-  // Salary patterns
-  if (qLower.includes('salary') || qLower.includes('compensation') || qLower.includes('pay') || qLower.includes('wage') || qLower.includes('expected')) {
-    if (salaryInfo.expected_salary) {
-      return { answer: salaryInfo.expected_salary, score: 1.0, source: 'salary' };
-    }
-  }
-
-  // Work authorization patterns
-  if (qLower.includes('work in uk') || qLower.includes('eligible to work') || qLower.includes('right to work') || qLower.includes('authorization')) {
-    if (workAuth.eligible_to_work_uk) {
-      return { answer: workAuth.eligible_to_work_uk, score: 1.0, source: 'work_auth' };
-    }
-  }
-
-  // Sponsorship patterns
-  if (qLower.includes('sponsor') || qLower.includes('visa')) {
-    if (workAuth.require_sponsorship) {
-      return { answer: workAuth.require_sponsorship, score: 1.0, source: 'work_auth' };
-    }
-  }
-
-  // Notice period patterns
-  if (qLower.includes('notice period') || qLower.includes('start date') || qLower.includes('when can you start')) {
-    if (workAuth.notice_period) {
-      return { answer: workAuth.notice_period, score: 1.0, source: 'work_auth' };
-    }
+  // 2. Check personal info patterns (exact matches), one scan for all rules
+  const rule = matchRule(question, databank);
+  if (rule) {
+    return rule;
   }
 
   // Return best match from stored questions or null
@@ -209,7 +209,8 @@ async function parseAndAnswer() {
     const controller = new AbortController();
     const timeoutId = setTimeout(() => controller.abort(), 3000);
 
-    const response = await fetch(`${API_URL}/api/parse-and-answer`, {
+    // Streamed: regex + databank answers arrive first, AI refinements after
+    const response = await fetch(`${API_URL}/api/parse-and-answer/stream`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify({ pageText: pageContent, context: {} }),
@@ -218,15 +219,36 @@ async function parseAndAnswer() {
 
     clearTimeout(timeoutId);
 
-    if (response.ok) {
-      const data = await response.json();
-      answers = data.answers || [];
-      usedBackend = true;
-      setStatus(`Done! Found ${answers.length} questions (Backend)`);
-    } else {
+    if (!response.ok) {
       throw new Error(`Server error: ${response.status}`);
     }
+
+    await readNdjson(response, (event) => {
+      if (event.type === 'answers') {
+        // Only redraw for AI results that change the question list, so
+        // answers edited while waiting are kept
+        const changed = event.stage !== 'ai' || event.added.length > 0 || event.removed.length > 0;
+        answers = event.answers || [];
+        if (changed) {
+          displayAnswers(answers);
+        }
+        usedBackend = true;
+        setStatus(event.stage === 'ai'
+          ? `Done! Found ${answers.length} questions (Backend)`
+          : `Found ${answers.length} questions, refining with AI...`);
+      } else if (event.type === 'done') {
+        setStatus(`Done! Found ${answers.length} questions (Backend${event.method === 'ai' ? '' : ', regex'})`);
+      }
+    });
   } catch (e) {
+    if (usedBackend) {
+      // Stream broke after answers arrived - keep what is shown
+      console.log('Answer stream interrupted:', e.message);
+      await chrome.storage.local.set({ answers });
+      parseBtn.disabled = false;
+      return;
+    }
+
     // Backend unavailable - use local processing
     console.log('Backend unavailable, using local extraction:', e.message);
     setStatus('Parsing locally...');
@@ -273,11 +295,45 @@ async function parseAndAnswer() {
     }
   }
 
-  displayAnswers(answers);
+  if (!usedBackend) {
+    displayAnswers(answers);
+  }
   await chrome.storage.local.set({ answers });
   parseBtn.disabled = false;
 }
 
+/**
+ * Read a newline-delimited JSON response, calling onEvent for each object as it arrives.
+ * @param {Response} response - Fetch response with an NDJSON body
+ * @param {function(Object): void} onEvent - Called once per line
+ */
+async function readNdjson(response, onEvent) {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  while (true) {
+    const { done, value } = await reader.read();
+    buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+
+    let newline;
+    while ((newline = buffer.indexOf('\n')) >= 0) {
+      const line = buffer.slice(0, newline).trim();
+      buffer = buffer.slice(newline + 1);
+      if (line) {
+        onEvent(JSON.parse(line));
+      }
+    }
+
+    if (done) {
+      if (buffer.trim()) {
+        onEvent(JSON.parse(buffer));
+      }
+      return;
+    }
+  }
+}
+
 function displayAnswers(answers) {
   if (!answers || answers.length === 0) {
     answersContainer.innerHTML = '<p class="no-results">No questions found on this page.</p>';
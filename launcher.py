@@ -1,6 +1,9 @@
 """
 JobRadar Launcher - Starts both Flask backend and Streamlit dashboard
+
+Usage: python launcher.py [--api-threads 8] [--api-dev]
 """
+import argparse
 import os
 import subprocess
 import sys
@@ -60,6 +63,15 @@ def signal_handler(sig, frame):
 def main():
     global flask_process, streamlit_process
 
+    parser = argparse.ArgumentParser(description="Start the JobRadar API and dashboard")
+    parser.add_argument("--api-threads", type=int, default=8,
+                        help="Worker threads for the API server (concurrent extension requests)")
+    parser.add_argument("--api-dev", action="store_true",
+                        help="Run the API on Flask's development server (debugger on)")
+    args = parser.parse_args()
+
+    flask_args = ["--dev"] if args.api_dev else ["--threads", str(args.api_threads)]
+
     # Register signal handler for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
 
@@ -75,7 +87,7 @@ def main():
     print("[1/2] Starting Flask Backend (http://localhost:5000)...")
     try:
         flask_process = subprocess.Popen(
-            [python_exe, str(FLASK_SCRIPT)],
+            [python_exe, str(FLASK_SCRIPT), *flask_args],
             cwd=str(TOOLS_DIR),
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -1,11 +1,19 @@
-"""Test question extraction - Regex vs AI comparison."""
+"""Test question extraction - Regex vs AI comparison.
+
+Run with: python test_extraction.py [--ai]
+  --ai  also time real AI extraction with the full page vs the form
+        sections only (needs ANTHROPIC_API_KEY, makes 2 calls per sample)
+"""
+import os
 import sys
+import time
 from pathlib import Path
 
 # Add tools directory to path
 sys.path.insert(0, str(Path(__file__).parent / "tools"))
 
-from answer_questions_api import extract_questions_regex, extract_questions_with_ai
+from answer_questions_api import EXTRACTION_TOKEN_BUDGET, _call_extraction_model, extract_questions_regex
+from form_segmenter import estimate_tokens, select_form_text
 
 # Sample job application page texts
 SAMPLE_PAGES = [
@@ -97,7 +105,53 @@ SAMPLE_PAGES = [
     Expected salary (annual): *
 
     Submit Your Application
-    """
+    """,
+
+    # Sample 4: long job description above the form (the common case:
+    # the whole posting is copied, and the form starts far down the page)
+    "\n".join([
+        "Senior Data Engineer - Acme Analytics",
+        "London (Hybrid) | Full time | £70,000 - £85,000",
+        "",
+        "About us",
+        "Acme Analytics helps retailers understand their customers. We are a team of 120 "
+        "engineers, analysts and designers working across London and Manchester, and we are "
+        "growing fast after our Series C round last year.",
+        "",
+        "The role",
+    ] + [
+        f"You will be responsible for designing and operating data pipeline number {i} that feeds "
+        "our reporting platform, working closely with analysts and product managers to make sure "
+        "data is accurate, timely and well documented for everyone in the business."
+        for i in range(1, 31)
+    ] + [
+        "",
+        "Requirements",
+        "- 5+ years of experience with Python and SQL",
+        "- Experience with Airflow, dbt and Spark",
+        "- Familiarity with AWS or GCP",
+        "- Strong communication skills",
+        "",
+        "Benefits",
+        "- 30 days holiday",
+        "- Private healthcare",
+        "- Learning budget",
+        "",
+        "Apply for this job",
+        "First Name *",
+        "Last Name *",
+        "Email *",
+        "Phone *",
+        "Resume/CV *",
+        "LinkedIn Profile",
+        "Are you eligible to work in the UK? *",
+        "Will you now or in the future require visa sponsorship? *",
+        "What is your notice period? *",
+        "What are your salary expectations? *",
+        "Why do you want to work at Acme Analytics? *",
+        "How did you hear about this job?",
+        "Submit application",
+    ]),
 ]
 
 def test_extraction():
@@ -150,5 +204,61 @@ standard labels. AI extraction is more flexible but costs money per request.
 RECOMMENDATION: Start with regex, add AI extraction as optional upgrade.
 """)
 
+def test_form_segmenter(with_ai=False):
+    """Measure how much page text the form segmenter keeps for the AI prompt.
+
+    Before: the prompt sent page_text[:8000]. After: the most form-like
+    blocks within EXTRACTION_TOKEN_BUDGET. Questions the regex extractor
+    finds on the full page should still be in the selected text.
+    """
+    print("=" * 80)
+    print("FORM SEGMENTER - TOKENS SENT FOR AI EXTRACTION")
+    print("=" * 80)
+    print(f"{'Sample':<8}{'Before':>10}{'After':>10}{'Saved':>8}  Regex questions kept")
+
+    total_before = total_after = 0
+    missing = []
+    for i, page in enumerate(SAMPLE_PAGES, 1):
+        before = page[:8000]
+        after = select_form_text(page, EXTRACTION_TOKEN_BUDGET)
+        questions = extract_questions_regex(page)
+        kept = [q for q in questions if q.lower() in after.lower()]
+        tokens_before, tokens_after = estimate_tokens(before), estimate_tokens(after)
+        total_before += tokens_before
+        total_after += tokens_after
+        saved = 1 - tokens_after / tokens_before if tokens_before else 0
+        print(f"{i:<8}{tokens_before:>10}{tokens_after:>10}{saved:>8.0%}  {len(kept)}/{len(questions)}")
+        for q in questions:
+            if q not in kept:
+                print(f"{'':<8}missing: {q}")
+                missing.append((i, q))
+        if i == 4:
+            # Long job description with the form at the end
+            assert tokens_after <= EXTRACTION_TOKEN_BUDGET, f"sample 4: {tokens_after} tokens over budget"
+            assert len(after) < len(before), "sample 4: selection is not smaller than page[:8000]"
+    print(f"{'Total':<8}{total_before:>10}{total_after:>10}{1 - total_after / total_before:>8.0%}")
+    print("(tokens estimated as characters / 4)")
+
+    assert not missing, f"regex questions missing from the selected form text: {missing}"
+
+    if not with_ai:
+        return
+    if not os.getenv("ANTHROPIC_API_KEY"):
+        print("\nSkipping AI latency comparison: ANTHROPIC_API_KEY is not set")
+        return
+
+    print()
+    print(f"{'Sample':<8}{'Full page':>12}{'Form only':>12}  Questions (full / form)")
+    for i, page in enumerate(SAMPLE_PAGES, 1):
+        start = time.perf_counter()
+        full_questions = _call_extraction_model(page[:8000])
+        full_s = time.perf_counter() - start
+        start = time.perf_counter()
+        form_questions = _call_extraction_model(select_form_text(page, EXTRACTION_TOKEN_BUDGET))
+        form_s = time.perf_counter() - start
+        print(f"{i:<8}{full_s:>11.2f}s{form_s:>11.2f}s  {len(full_questions)} / {len(form_questions)}")
+
+
 if __name__ == "__main__":
     test_extraction()
+    test_form_segmenter(with_ai="--ai" in sys.argv)
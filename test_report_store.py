@@ -0,0 +1,63 @@
+"""Test company report lookup keys.
+
+Run with: python test_report_store.py
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+# Add tools directory to path
+sys.path.insert(0, str(Path(__file__).parent / "tools"))
+
+from report_store import ReportStore, company_key
+
+# (name, name) pairs that must share a cached report
+SAME_COMPANY = [
+    ("Acme Ltd", "ACME Limited"),
+    ("Acme, Inc.", "acme"),
+    ("Acme GmbH", "Acme"),
+    ("Acme Holdings plc", "Acme Holdings"),
+]
+
+# (name, name) pairs that are different employers
+DIFFERENT_COMPANIES = [
+    ("Acme Group", "Acme"),
+    ("Acme Group Ltd", "Acme Ltd"),
+    ("Acme Company", "Acme"),
+    ("Acme & Co", "Acme"),
+]
+
+
+def test_company_key():
+    """Legal-form suffixes are ignored; other trailing words are not."""
+    for first, second in SAME_COMPANY:
+        assert company_key(first) == company_key(second), f"{first!r} and {second!r} should match"
+    for first, second in DIFFERENT_COMPANIES:
+        assert company_key(first) != company_key(second), f"{first!r} and {second!r} should differ"
+    print(f"  {len(SAME_COMPANY)} matching and {len(DIFFERENT_COMPANIES)} distinct name pairs OK")
+
+
+def test_group_report_not_shared():
+    """A report saved for "Acme Group" is not returned for "Acme", including rows keyed by older rules."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "jobs.db"
+        with ReportStore(path) as store:
+            store.put("Acme Group", "Acme Group report")
+            assert store.get("Acme Group") == "Acme Group report"
+            assert store.get("Acme Group Limited") == "Acme Group report"
+            assert store.get("Acme") is None
+            # Row keyed the old way, when "group" was stripped
+            store.conn.execute("UPDATE company_reports SET company_key = 'acme'")
+            store.conn.commit()
+        with ReportStore(path) as store:
+            assert store.get("Acme") is None
+            assert store.get("Acme Group") == "Acme Group report"
+    print("  Acme Group report is not shared with Acme")
+
+
+if __name__ == "__main__":
+    print("Company report keys")
+    print("=" * 60)
+    test_company_key()
+    test_group_report_not_shared()
+    print("\nAll report store cases passed")
@@ -0,0 +1,66 @@
+"""Test salary parsing on the formats job boards return.
+
+Run with: python test_salary_parser.py
+"""
+import sys
+from pathlib import Path
+
+# Add tools directory to path
+sys.path.insert(0, str(Path(__file__).parent / "tools"))
+
+from salary_parser import parse_salary
+
+# (salary text, expected annual (min, max))
+SALARY_CASES = [
+    ("£30K–£35K a year", (30000, 35000)),
+    ("£30,000 to £40,000 per annum", (30000, 40000)),
+    # Second figure without a currency symbol
+    ("£30k-35k a year", (30000, 35000)),
+    ("£30,000 - 40,000", (30000, 40000)),
+    ("£30,000 to 40,000 pa", (30000, 40000)),
+    # Unit written once for the range
+    ("£30-35k", (30000, 35000)),
+    # A later number that is not the top of the range
+    ("£30,000 - 2025 start", (30000, 30000)),
+    ("37.5 hours per week, £25,000", (25000, 25000)),
+    ("Up to £40k", (40000, 40000)),
+    ("$120,000", (120000, 120000)),
+    # Hourly, daily and weekly rates
+    ("£15 an hour", (29250, 29250)),
+    ("£450 - £550 per day", (117000, 143000)),
+    ("£800 per week", (41600, 41600)),
+    ("£800 pw", (41600, 41600)),
+    ("£2,500 pcm", (30000, 30000)),
+    # Unlabelled three-figure rates are day rates, not hourly
+    ("£500", (130000, 130000)),
+    # Dots as thousands separators
+    ("€45.000 - €55.000", (45000, 55000)),
+    ("€1.500 per month", (18000, 18000)),
+    # Not plausible salaries, or not numbers
+    ("€30.000.000", (None, None)),
+    ("£1.2.3", (None, None)),
+    ("£1.2m", (None, None)),
+    ("£900 per hour", (None, None)),
+    ("Competitive", (None, None)),
+    ("", (None, None)),
+]
+
+
+def test_parse_salary():
+    """Each sample salary string parses to the expected annual range."""
+    failures = []
+    for text, expected in SALARY_CASES:
+        result = parse_salary(text)
+        status = "OK" if result == expected else "FAIL"
+        print(f"  [{status}] {text!r:40} -> {result}")
+        if result != expected:
+            failures.append((text, expected, result))
+
+    assert not failures, f"{len(failures)} salary strings parsed wrongly: {failures}"
+
+
+if __name__ == "__main__":
+    print("Salary parsing")
+    print("=" * 60)
+    test_parse_salary()
+    print("\nAll salary cases passed")
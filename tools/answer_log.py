@@ -0,0 +1,247 @@
+"""Append-only log of answers used from the Chrome extension.
+
+Each tracked answer is one JSON line appended to the newest segment in
+.tmp/answer_log/, so tracking costs O(1) however long the history gets and
+nothing is ever truncated. When a segment passes max_segment_bytes a new
+one is started, and a background thread merges sealed segments into
+gzip-compressed ones. Reads walk segments newest first, so "latest N"
+queries stop early instead of parsing the whole history.
+
+Segment names carry sequence numbers: 00000007.jsonl is a plain segment,
+00000001-00000006.jsonl.gz a compacted one covering segments 1-6.
+"""
+
+import gzip
+import os
+import re
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+from persistence import dumps, load_json, loads
+
+# Also imported by the Flask API, so avoid scraper_utils (and its .env loading)
+TMP_DIR = Path(__file__).parent.parent / ".tmp"
+ANSWER_LOG_DIR = TMP_DIR / "answer_log"
+LEGACY_HISTORY_PATH = TMP_DIR / "answer_usage_history.json"
+
+# Legacy history is migrated into segment 0, ahead of anything appended
+LEGACY_SEGMENT_NAME = "00000000.jsonl"
+
+MAX_SEGMENT_BYTES = 1_000_000
+COMPACT_MIN_SEGMENTS = 4
+
+_SEGMENT_RE = re.compile(r"^(\d{8})(?:-(\d{8}))?\.jsonl(\.gz)?$")
+
+
+class AnswerLog:
+    """Segmented JSONL answer log with size-based rotation and compaction.
+
+    Args:
+        directory: Folder holding the segments
+        max_segment_bytes: Start a new segment once the active one reaches this size
+        compact_min_segments: Merge sealed plain segments once there are this many
+    """
+
+    def __init__(self, directory=ANSWER_LOG_DIR, max_segment_bytes=MAX_SEGMENT_BYTES,
+                 compact_min_segments=COMPACT_MIN_SEGMENTS):
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        self.compact_min_segments = compact_min_segments
+        self._lock = threading.Lock()
+        self._compactor = None
+        self._stats_cache = {}  # sealed segment name -> (size, counts)
+
+    # Segment bookkeeping
+
+    def _segments(self):
+        """Return (first, last, name) for every live segment, oldest first.
+
+        Plain segments already covered by a compacted one (left behind by a
+        compaction in progress) are skipped so no entry is read twice.
+        """
+        if not self.directory.exists():
+            return []
+        segments = []
+        for name in os.listdir(self.directory):
+            match = _SEGMENT_RE.match(name)
+            if match:
+                first = int(match.group(1))
+                segments.append((first, int(match.group(2) or first), name))
+        segments.sort()
+        live = []
+        covered = -1
+        for first, last, name in segments:
+            if last <= covered:
+                continue
+            live.append((first, last, name))
+            covered = max(covered, last)
+        return live
+
+    def _read_segment(self, name):
+        """Return the entries in one segment, oldest first."""
+        path = self.directory / name
+        try:
+            if name.endswith(".gz"):
+                with gzip.open(path, "rb") as f:
+                    data = f.read()
+            else:
+                with open(path, "rb") as f:
+                    data = f.read()
+        except FileNotFoundError:
+            return []  # Removed by a concurrent compaction; its entries are in the merged segment
+        return [loads(line) for line in data.splitlines() if line.strip()]
+
+    # Writing
+
+    def append(self, entry):
+        """Append one entry to the active segment, rotating it if it is full."""
+        line = dumps(entry) + b"\n"
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            segments = self._segments()
+            rotated = False
+            # Segment 0 (migrated history) is written once and never appended to
+            if segments and segments[-1][0] > 0 and not segments[-1][2].endswith(".gz"):
+                seq = segments[-1][0]
+                path = self.directory / segments[-1][2]
+                if path.stat().st_size >= self.max_segment_bytes:
+                    seq += 1
+                    rotated = True
+            else:
+                seq = segments[-1][1] + 1 if segments else 1
+            with open(self.directory / f"{seq:08d}.jsonl", "ab") as f:
+                f.write(line)
+        if rotated:
+            self.compact_in_background()
+
+    def extend(self, entries):
+        """Append several entries in order (used for migration)."""
+        for entry in entries:
+            self.append(entry)
+
+    # Compaction
+
+    def compact(self):
+        """Merge sealed plain segments into one gzip segment. Returns the number merged."""
+        with self._lock:
+            segments = self._segments()
+            # The newest segment is the active one; never touch it
+            sealed = [seg for seg in segments[:-1] if not seg[2].endswith(".gz")]
+            if len(sealed) < self.compact_min_segments:
+                return 0
+            first, last = sealed[0][0], sealed[-1][1]
+            target = self.directory / f"{first:08d}-{last:08d}.jsonl.gz"
+            tmp_path = target.with_name(target.name + ".tmp")
+            with gzip.open(tmp_path, "wb") as out:
+                for _, _, name in sealed:
+                    with open(self.directory / name, "rb") as f:
+                        out.write(f.read())
+            os.replace(tmp_path, target)
+            for _, _, name in sealed:
+                os.remove(self.directory / name)
+                self._stats_cache.pop(name, None)
+            return len(sealed)
+
+    def compact_in_background(self):
+        """Run compact() on a daemon thread unless one is already running."""
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self.compact, name="answer-log-compactor", daemon=True)
+        self._compactor.start()
+
+    # Reading
+
+    def iter_newest(self, source=None, company=None):
+        """Yield entries newest first, optionally filtered.
+
+        Args:
+            source: Only entries whose source matches (case-insensitive)
+            company: Only entries whose company contains this text (case-insensitive)
+        """
+        source = source.lower() if source else None
+        company = company.lower() if company else None
+        for _, _, name in reversed(self._segments()):
+            for entry in reversed(self._read_segment(name)):
+                if source and (entry.get("source") or "").lower() != source:
+                    continue
+                if company and company not in (entry.get("company") or "").lower():
+                    continue
+                yield entry
+
+    def query(self, limit=None, source=None, company=None):
+        """Return up to limit entries newest first (see iter_newest for filters)."""
+        entries = []
+        for entry in self.iter_newest(source=source, company=company):
+            if limit is not None and len(entries) >= limit:
+                break
+            entries.append(entry)
+        return entries
+
+    def stats(self):
+        """Return counts for the History page: total, databank, custom and edited.
+
+        Counts for sealed segments are cached by name and size, so only the
+        active segment is re-read on each call.
+        """
+        totals = {"total": 0, "databank": 0, "custom": 0, "edited": 0}
+        segments = self._segments()
+        for index, (_, _, name) in enumerate(segments):
+            try:
+                size = os.path.getsize(self.directory / name)
+            except FileNotFoundError:
+                continue
+            cached = self._stats_cache.get(name)
+            if cached and cached[0] == size:
+                counts = cached[1]
+            else:
+                counts = {"total": 0, "databank": 0, "custom": 0, "edited": 0}
+                for entry in self._read_segment(name):
+                    counts["total"] += 1
+                    counts["databank" if entry.get("source") == "databank" else "custom"] += 1
+                    counts["edited"] += bool(entry.get("was_edited"))
+                if index < len(segments) - 1:
+                    self._stats_cache[name] = (size, counts)
+            for key, value in counts.items():
+                totals[key] += value
+        return totals
+
+    def migrate_legacy(self, path=LEGACY_HISTORY_PATH):
+        """Move a legacy answer_usage_history.json into the log. Returns entries moved.
+
+        The history is written to a temporary file and renamed to segment 0,
+        so if the dashboard and the API migrate at the same time they both
+        produce the same segment rather than importing the entries twice.
+        The old file is renamed to *.migrated rather than deleted.
+        """
+        if not path.exists():
+            return 0
+        with self._lock:
+            if any(first == 0 for first, _, _ in self._segments()):
+                return 0  # Already migrated
+            try:
+                history = load_json(path)
+            except FileNotFoundError:
+                history = None
+            if history is None:
+                return 0  # Migrated and renamed by another process meanwhile
+            self.directory.mkdir(parents=True, exist_ok=True)
+            target = self.directory / LEGACY_SEGMENT_NAME
+            tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(b"".join(dumps(entry) + b"\n" for entry in history))
+            os.replace(tmp_path, target)
+        try:
+            os.replace(path, path.with_name(path.name + ".migrated"))
+        except FileNotFoundError:
+            pass  # Another process migrating at the same time renamed it first
+        return len(history)
+
+
+@lru_cache(maxsize=None)
+def open_answer_log(directory=ANSWER_LOG_DIR):
+    """Return the process-wide AnswerLog for a directory, migrating legacy history once."""
+    log = AnswerLog(directory)
+    if directory == ANSWER_LOG_DIR:
+        log.migrate_legacy()
+    return log
@@ -3,46 +3,70 @@
 Receives raw page text, extracts questions using AI, matches against
 qa_databank.yaml, and generates answers for unmatched questions.
 
-Run with: python answer_questions_api.py
+Run with: python answer_questions_api.py [--threads 8]
+      or: python answer_questions_api.py --dev   (Flask debug server)
 """
 
+import argparse
 import json
 import os
 import re
+import signal
 import sys
 from pathlib import Path
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
 from dotenv import load_dotenv
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from tools.parse_cv import find_cv, parse_docx
+# Import tools modules flat, as the other tools scripts and app.py do, so
+# each is loaded once even when this file is imported as tools.answer_questions_api
+sys.path.insert(0, str(Path(__file__).parent))
+
+from answer_log import open_answer_log
+from api_metrics import METRICS
+from databank_index import get_databank_index
+from databank_rules import RULES as DATABANK_RULES
+from extraction_cache import extraction_key, open_extraction_cache
+from form_segmenter import select_form_text
+from llm_client import close_clients, get_client
+from parse_cv import find_cv, parse_docx
+from question_extractor import extract_questions, is_job_description
+from file_cache import cache_stats, cached_load, load_yaml_cached
 
 # Load environment variables
 load_dotenv(Path(__file__).parent.parent / ".env")
 
 app = Flask(__name__)
 CORS(app)  # Allow requests from Chrome extension
+METRICS.init_app(app)  # Per-endpoint latency and status counts, see /api/metrics
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
 QA_DATABANK_PATH = PROJECT_ROOT / "qa_databank.yaml"
 PROFILE_PATH = PROJECT_ROOT / "user_profile.yaml"
-ANSWER_HISTORY_PATH = PROJECT_ROOT / ".tmp" / "answer_usage_history.json"
+
+# Production server worker threads (concurrent requests, incl. slow LLM calls)
+DEFAULT_THREADS = 8
+
+EXTRACTION_MODEL = "claude-3-haiku-20240307"
+# Bump whenever _build_extraction_prompt or EXTRACTION_MODEL changes, so
+# cached extractions made with the old prompt are not reused
+PROMPT_VERSION = "2"
+# Tokens of page text sent for extraction (form-like blocks first, see form_segmenter)
+EXTRACTION_TOKEN_BUDGET = 2000
 
 
 def load_yaml(path):
-    """Load YAML file safely."""
-    import yaml
-    if path.exists():
-        with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
-    return {}
+    """Load YAML file safely.
+
+    Parsed once and kept in memory (read-only) until the file's mtime or
+    size changes, e.g. when the dashboard saves the databank.
+    """
+    return load_yaml_cached(path) or {}
 
 
+@METRICS.timed("load_databank")
 def load_qa_databank():
     """Load Q&A databank."""
     return load_yaml(QA_DATABANK_PATH)
@@ -53,39 +77,19 @@ def load_profile():
     return load_yaml(PROFILE_PATH)
 
 
+@METRICS.timed("load_cv")
 def load_cv_text():
-    """Load CV text if available."""
+    """Load CV text if available.
+
+    The .docx is only parsed when this is called, and the text is reused
+    until the file changes, so call it from the code paths that need it.
+    """
     cv_path = find_cv()
     if cv_path:
-        return parse_docx(cv_path)
+        return cached_load(cv_path, parse_docx)
     return ""
 
 
-def load_answer_history():
-    """Load answer usage history."""
-    if ANSWER_HISTORY_PATH.exists():
-        try:
-            with open(ANSWER_HISTORY_PATH, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading history: {e}")
-            return []
-    return []
-
-
-def save_answer_history(history):
-    """Save answer usage history."""
-    try:
-        # Ensure .tmp directory exists
-        ANSWER_HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(ANSWER_HISTORY_PATH, "w", encoding="utf-8") as f:
-            json.dump(history, f, indent=2, ensure_ascii=False)
-        return True
-    except Exception as e:
-        print(f"Error saving history: {e}")
-        return False
-
-
 def calculate_similarity(text1, text2):
     """Calculate simple word overlap similarity."""
     def normalize(text):
@@ -112,90 +116,27 @@ def match_to_databank(question, databank):
         tuple: (answer, similarity_score) or (None, 0) if no match
     """
     questions = databank.get("questions", {})
-    personal_info = databank.get("personal_info", {})
-    salary_info = databank.get("salary", {})
-    work_auth = databank.get("work_authorization", {})
 
-    best_match = None
-    best_score = 0
     threshold = 0.3  # Lower threshold for broader matching
 
-    # Check against stored questions
-    for stored_q, answer in questions.items():
-        if not answer:  # Skip empty answers
-            continue
-        score = calculate_similarity(question, stored_q)
-        if score > best_score and score > threshold:
-            best_score = score
-            best_match = answer
-
-    # Check for common patterns
-    q_lower = question.lower()
-
-    # Name patterns
-    full_name = personal_info.get("full_name", "")
-    if full_name:
-        name_parts = full_name.split()
-        first_name = name_parts[0] if name_parts else ""
-        last_name = " ".join(name_parts[1:]) if len(name_parts) > 1 else ""
-
-        # First name only
-        if any(x in q_lower for x in ["first name"]) and "last" not in q_lower:
-            return first_name, 1.0
-
-        # Last name only
-        if any(x in q_lower for x in ["last name", "surname", "family name"]):
-            return last_name, 1.0
-
-        # Full name
-        if any(x in q_lower for x in ["your name", "full name", "name"]):
-            return full_name, 1.0
-
-    # Email patterns
-    if any(x in q_lower for x in ["email", "e-mail"]):
-        if personal_info.get("email"):
-            return personal_info["email"], 1.0
-
-    # Phone patterns
-    if any(x in q_lower for x in ["phone", "telephone", "mobile", "contact number"]):
-        if personal_info.get("phone"):
-            return personal_info["phone"], 1.0
-
-    # Location patterns
-    if any(x in q_lower for x in ["location", "address", "city", "where do you live"]):
-        if personal_info.get("location"):
-            return personal_info["location"], 1.0
-
-    # LinkedIn patterns
-    if "linkedin" in q_lower:
-        if personal_info.get("linkedin"):
-            return personal_info["linkedin"], 1.0
-
-    # Salary patterns
-    if any(x in q_lower for x in ["salary", "compensation", "pay", "wage", "expected"]):
-        if salary_info.get("expected_salary"):
-            return salary_info["expected_salary"], 1.0
-
-    # Work authorization patterns
-    if any(x in q_lower for x in ["work in uk", "eligible to work", "right to work", "authorization"]):
-        if work_auth.get("eligible_to_work_uk"):
-            return work_auth["eligible_to_work_uk"], 1.0
-
-    # Sponsorship patterns
-    if any(x in q_lower for x in ["sponsor", "visa"]):
-        if work_auth.get("require_sponsorship"):
-            return work_auth["require_sponsorship"], 1.0
-
-    # Notice period patterns
-    if any(x in q_lower for x in ["notice period", "start date", "when can you start"]):
-        if work_auth.get("notice_period"):
-            return work_auth["notice_period"], 1.0
+    # Check against stored questions (indexed; same result as scoring each
+    # one with calculate_similarity)
+    best_match, best_score = get_databank_index(questions).best_match(question, threshold)
+
+    # Check for common patterns (name, email, salary, ...; see databank_rules)
+    rule, answer = DATABANK_RULES.match(question, databank)
+    if rule is not None:
+        return answer, 1.0
 
     return best_match, best_score
 
 
-def _build_extraction_prompt(page_text):
-    """Build the Claude prompt for question extraction."""
+def _build_extraction_prompt(form_text):
+    """Build the Claude prompt for question extraction.
+
+    Args:
+        form_text: The form-like parts of the page, from select_form_text()
+    """
     return f"""Extract form field labels from this job application page.
 
 CRITICAL RULES:
@@ -219,112 +160,100 @@ If you only see 3-4 form fields in the text, return only those 3-4 fields. Do no
 
 Return ONLY a JSON array of the exact field labels found. No explanations.
 
-Page text:
-{page_text[:8000]}"""
+Page text (form sections):
+{form_text}"""
 
 
-def extract_questions_with_ai(page_text):
-    """Use Claude to extract questions from raw page text."""
-    api_key = os.getenv("ANTHROPIC_API_KEY")
+@METRICS.timed("llm_extract")
+def _call_extraction_model(form_text):
+    """Ask Claude for the form field labels in form_text. Raises on API or parse errors."""
+    client = get_client()
 
-    if not api_key:
-        # Fallback: simple regex extraction
-        return extract_questions_regex(page_text)
+    prompt = _build_extraction_prompt(form_text)
 
     try:
-        import anthropic
-        client = anthropic.Anthropic(api_key=api_key)
-
-        prompt = _build_extraction_prompt(page_text)
-
         message = client.messages.create(
-            model="claude-3-haiku-20240307",
+            model=EXTRACTION_MODEL,
             max_tokens=1000,
             messages=[{"role": "user", "content": prompt}]
         )
+    except Exception:
+        METRICS.inc("llm_calls_total", purpose="extract", outcome="error")
+        raise
+
+    usage = getattr(message, "usage", None)
+    if usage is not None:
+        METRICS.inc("llm_tokens_total", usage.input_tokens, direction="input")
+        METRICS.inc("llm_tokens_total", usage.output_tokens, direction="output")
 
-        response_text = message.content[0].text.strip()
+    response_text = message.content[0].text.strip()
 
-        # Parse JSON response - handle markdown code blocks
-        if response_text.startswith("```"):
-            response_text = re.sub(r'^```\w*\n?', '', response_text)
-            response_text = re.sub(r'\n?```$', '', response_text)
+    # Parse JSON response - handle markdown code blocks
+    if response_text.startswith("```"):
+        response_text = re.sub(r'^```\w*\n?', '', response_text)
+        response_text = re.sub(r'\n?```$', '', response_text)
 
+    try:
         questions = json.loads(response_text)
-        return questions if isinstance(questions, list) else []
+    except ValueError:
+        METRICS.inc("llm_calls_total", purpose="extract", outcome="invalid_response")
+        raise
+    METRICS.inc("llm_calls_total", purpose="extract", outcome="ok")
+    return questions if isinstance(questions, list) else []
+
+
+def extract_questions_cached(page_text):
+    """AI question extraction through the page-hash cache.
+
+    Shared by /api/parse-and-answer and /api/debug/extract-questions, so a
+    form extracted by either is answered from cache by both. Only
+    successful AI results are stored; errors propagate to the caller.
+
+    Returns:
+        tuple: (questions, cached) where cached is True on a cache hit
+    """
+    # Keyed on what the prompt actually sees, so pages that only differ
+    # outside their form sections share an entry
+    with METRICS.stage("segment"):
+        form_text = select_form_text(page_text, EXTRACTION_TOKEN_BUDGET)
+    key = extraction_key(form_text, f"{PROMPT_VERSION}:{EXTRACTION_MODEL}")
+    cache = open_extraction_cache()
+    questions = cache.get(key)
+    if questions is not None:
+        return questions, True
+
+    questions = _call_extraction_model(form_text)
+    cache.put(key, questions)
+    return questions, False
+
+
+def extract_questions_with_ai(page_text):
+    """Use Claude to extract questions from raw page text (cached by page hash)."""
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+
+    if not api_key:
+        # Fallback: simple regex extraction
+        METRICS.inc("regex_fallbacks_total", reason="no_api_key")
+        return extract_questions_regex(page_text)
+
+    try:
+        questions, _ = extract_questions_cached(page_text)
+        return questions
 
     except Exception as e:
         print(f"AI extraction failed: {e}")
+        METRICS.inc("regex_fallbacks_total", reason="ai_error")
         return extract_questions_regex(page_text)
 
 
+@METRICS.timed("regex_extract")
 def extract_questions_regex(page_text):
-    """Fallback: extract questions using regex patterns. Very conservative."""
-    questions = []
-
-    # Only match questions that are clearly asking the user for input
-    # Avoid matching job requirements or descriptions
-    question_patterns = [
-        # Direct questions to applicant
-        r'(Why (?:are you|do you want)[^.?\n]{10,100}\?)',
-        r'(What (?:is your|are your)[^.?\n]{5,80}\?)',
-        r'(Do you (?:have|require|need)[^.?\n]{5,60}\?)',
-        r'(Are you (?:authorized|eligible|willing)[^.?\n]{5,60}\?)',
-        r'(Tell us about (?:yourself|your)[^.?\n]{5,60})',
-        r'(Describe your [^.?\n]{5,60})',
-        r'(Please (?:provide|describe|explain) [^.?\n]{5,60})',
-    ]
-
-    for pattern in question_patterns:
-        matches = re.findall(pattern, page_text, re.IGNORECASE)
-        for match in matches:
-            if isinstance(match, tuple):
-                match = match[0]
-            match = match.strip()
-            # Filter out job description phrases
-            if not is_job_description(match):
-                if match and match not in questions:
-                    questions.append(match)
-
-    # Common form field labels - only exact matches
-    form_fields = [
-        'First Name', 'Last Name', 'Full Name', 'Email', 'Email Address',
-        'Phone', 'Phone Number', 'Mobile Number', 'Address', 'City',
-        'Postcode', 'Post Code', 'Zip Code', 'Country', 'LinkedIn',
-        'Expected Salary', 'Current Salary', 'Notice Period', 'Start Date',
-        'Cover Letter', 'Resume', 'CV'
-    ]
-
-    text_lower = page_text.lower()
-    for field in form_fields:
-        if field.lower() in text_lower and field not in questions:
-            questions.append(field)
-
-    # Deduplicate
-    seen = set()
-    unique = []
-    for q in questions:
-        q_lower = q.lower().strip()
-        if q_lower not in seen:
-            seen.add(q_lower)
-            unique.append(q)
-
-    return unique[:15]  # Typical form has 5-15 fields
-
-
-def is_job_description(text):
-    """Check if text looks like job description rather than a form field."""
-    text_lower = text.lower()
-    # Phrases that indicate job requirements, not form fields
-    job_desc_phrases = [
-        'experience with', 'experience in', 'knowledge of', 'proficiency in',
-        'ability to', 'responsible for', 'you will', 'we are looking',
-        'the ideal candidate', 'requirements', 'qualifications',
-        'must have', 'should have', 'preferred', 'required',
-        'years of experience', 'degree in', 'background in',
-        'skills in', 'familiarity with', 'understanding of'
-    ]
-    return any(phrase in text_lower for phrase in job_desc_phrases)
+    """Fallback: extract questions using regex patterns. Very conservative.
+
+    Compiled, prefiltered engine in question_extractor; same output as the
+    original per-pattern findall version.
+    """
+    return extract_questions(page_text)
 
 
 @app.route('/api/health', methods=['GET'])
@@ -333,6 +262,47 @@ def health_check():
     return jsonify({"status": "ok", "message": "Backend is running"})
 
 
+def _cache_gauges():
+    """Cache counters read at /api/metrics time."""
+    extraction = open_extraction_cache().stats()
+    files = cache_stats()
+    file_lookups = files["hits"] + files["misses"]
+    return {
+        ("cache_hits", (("cache", "extraction"),)): extraction["memory_hits"] + extraction["disk_hits"],
+        ("cache_misses", (("cache", "extraction"),)): extraction["misses"],
+        ("cache_hit_ratio", (("cache", "extraction"),)): extraction["hit_rate"],
+        ("cache_entries", (("cache", "extraction"),)): extraction["disk_entries"],
+        ("cache_hits", (("cache", "files"),)): files["hits"],
+        ("cache_misses", (("cache", "files"),)): files["misses"],
+        ("cache_hit_ratio", (("cache", "files"),)): round(files["hits"] / file_lookups, 3) if file_lookups else 0.0,
+        ("cache_entries", (("cache", "files"),)): files["entries"],
+    }
+
+
+METRICS.register_gauges(_cache_gauges)
+METRICS.describe("llm_calls_total", "Anthropic API calls by purpose and outcome")
+METRICS.describe("llm_tokens_total", "Anthropic API tokens used, by direction")
+METRICS.describe("regex_fallbacks_total", "Extractions answered by the regex fallback instead of AI, by reason")
+
+
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    """Request, stage, LLM and cache metrics.
+
+    Prometheus text format by default; ?format=json returns the summary
+    shown on the dashboard's Actions page.
+    """
+    if request.args.get('format') == 'json':
+        return jsonify(METRICS.summary())
+    return Response(METRICS.prometheus_text(), mimetype="text/plain; version=0.0.4")
+
+
+@app.route('/api/extraction-cache', methods=['GET'])
+def extraction_cache_stats():
+    """AI extraction cache hit rate and size."""
+    return jsonify(open_extraction_cache().stats())
+
+
 @app.route('/api/track-answer', methods=['POST'])
 def track_answer():
     """Save answer usage tracking data."""
@@ -343,9 +313,6 @@ def track_answer():
     if not all(k in data for k in required):
         return jsonify({"error": "Missing required fields"}), 400
 
-    # Load existing history
-    history = load_answer_history()
-
     # Create tracking entry
     from datetime import datetime
     entry = {
@@ -360,34 +327,28 @@ def track_answer():
         "outcome": None  # Can be updated later
     }
 
-    # Add to history
-    history.append(entry)
-
-    # Keep only last 1000 entries to prevent file bloat
-    if len(history) > 1000:
-        history = history[-1000:]
-
-    # Save
-    if save_answer_history(history):
-        return jsonify({"status": "success", "message": "Answer tracked"})
-    else:
+    # Append to the log (O(1); full history is kept)
+    try:
+        open_answer_log().append(entry)
+    except Exception as e:
+        print(f"Error saving history: {e}")
         return jsonify({"error": "Failed to save history"}), 500
+    return jsonify({"status": "success", "message": "Answer tracked"})
 
 
 @app.route('/api/answer-history', methods=['GET'])
 def get_answer_history():
-    """Get answer usage history."""
-    history = load_answer_history()
-
-    # Return most recent first
-    history.reverse()
+    """Get answer usage history, most recent first."""
+    log = open_answer_log()
 
     # Optional filtering by query params
     limit = request.args.get('limit', type=int, default=100)
+    source = request.args.get('source')
+    company = request.args.get('company')
 
     return jsonify({
-        "history": history[:limit],
-        "total": len(history)
+        "history": log.query(limit=limit, source=source, company=company),
+        "total": log.stats()["total"]
     })
 
 
@@ -403,27 +364,10 @@ def debug_extract_questions():
     # Extract using AI
     ai_questions = []
     ai_error = None
+    ai_cached = False
     try:
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if api_key:
-            import anthropic
-            client = anthropic.Anthropic(api_key=api_key)
-
-            prompt = _build_extraction_prompt(page_text)
-
-            message = client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=1000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            response_text = message.content[0].text.strip()
-
-            if response_text.startswith("```"):
-                response_text = re.sub(r'^```\w*\n?', '', response_text)
-                response_text = re.sub(r'\n?```$', '', response_text)
-
-            ai_questions = json.loads(response_text)
+        if os.getenv("ANTHROPIC_API_KEY"):
+            ai_questions, ai_cached = extract_questions_cached(page_text)
     except Exception as e:
         ai_error = str(e)
 
@@ -436,7 +380,8 @@ def debug_extract_questions():
         "ai_extraction": {
             "questions": ai_questions,
             "count": len(ai_questions),
-            "error": ai_error
+            "error": ai_error,
+            "cached": ai_cached
         },
         "regex_extraction": {
             "questions": regex_questions,
@@ -451,34 +396,15 @@ def parse_and_answer():
     """Main endpoint: extract questions and generate answers."""
     data = request.json
     page_text = data.get('pageText', '')
-    context = data.get('context', {})
 
     if not page_text:
         return jsonify({"error": "No page text provided", "answers": []}), 400
 
-    # Load data sources
+    # Answers come from the databank only; the profile and CV are not needed here
     databank = load_qa_databank()
-    profile = load_profile()
-    cv_text = load_cv_text()
-
-    # Build context for AI generation
-    ai_context = {
-        "profile": profile,
-        "cv_text": cv_text,
-        **context
-    }
 
     # Extract questions from page
-    questions = extract_questions_with_ai(page_text)
-
-    # Filter out anything that looks like job description content
-    questions = [q for q in questions if not is_job_description(q)]
-
-    # Sanity check: if we have way too many "questions", something is wrong
-    # A typical application form has 5-15 fields
-    if len(questions) > 20:
-        print(f"Warning: Found {len(questions)} questions, likely extracting job description. Limiting to 15.")
-        questions = questions[:15]
+    questions = _clean_questions(extract_questions_with_ai(page_text))
 
     if not questions:
         return jsonify({
@@ -486,47 +412,174 @@ def parse_and_answer():
             "message": "No questions found on page"
         })
 
-    # Process each question
     # Strategy: ONLY match against databank (no AI generation for cost savings)
     # User can edit answers in the extension before copying
-    answers = []
-    for question in questions:
-        match, score = match_to_databank(question, databank)
-
-        if match and score > 0.3:
-            # Found a good match in databank
-            answers.append({
-                "question": question,
-                "answer": match,
-                "source": "databank",
-                "confidence": score
-            })
+    with METRICS.stage("match"):
+        answers = [_answer_question(question, databank) for question in questions]
+    return jsonify({"answers": answers, **_answer_counts(answers)})
+
+
+@app.route('/api/parse-and-answer/stream', methods=['POST'])
+def parse_and_answer_stream():
+    """Streaming variant of /api/parse-and-answer (NDJSON, one event per line).
+
+    Regex-extracted questions are answered from the databank and sent
+    straight away, then AI extraction runs and its result replaces them:
+
+        {"type": "answers", "stage": "regex", "answers": [...]}
+        {"type": "answers", "stage": "ai", "answers": [...],
+         "added": [questions], "removed": [questions], "cached": false}
+        {"type": "error", "stage": "ai", "error": "..."}   (AI failed; regex answers stand)
+        {"type": "done", "method": "ai" | "regex", "total_questions": N, ...}
+
+    The final answers are the same as /api/parse-and-answer returns.
+    """
+    data = request.json
+    page_text = data.get('pageText', '')
+
+    if not page_text:
+        return jsonify({"error": "No page text provided", "answers": []}), 400
+
+    databank = load_qa_databank()
+
+    def events():
+        questions = _clean_questions(extract_questions_regex(page_text))
+        with METRICS.stage("match"):
+            answers = [_answer_question(question, databank) for question in questions]
+        yield _ndjson({"type": "answers", "stage": "regex", "answers": answers})
+
+        method = "regex"
+        if not os.getenv("ANTHROPIC_API_KEY"):
+            METRICS.inc("regex_fallbacks_total", reason="no_api_key")
         else:
-            # No match - user can type answer in extension
-            answers.append({
-                "question": question,
-                "answer": "[No answer in databank - add this question to Q&A Databank]",
-                "source": "not_found",
-                "confidence": 0
-            })
+            try:
+                ai_questions, cached = extract_questions_cached(page_text)
+            except Exception as e:
+                print(f"AI extraction failed: {e}")
+                METRICS.inc("regex_fallbacks_total", reason="ai_error")
+                yield _ndjson({"type": "error", "stage": "ai", "error": str(e)})
+            else:
+                method = "ai"
+                previous = {q.lower().strip() for q in questions}
+                questions = _clean_questions(ai_questions)
+                current = {q.lower().strip() for q in questions}
+                # Reuse the answers already matched for questions regex also found
+                matched = {a["question"]: a for a in answers}
+                with METRICS.stage("match"):
+                    answers = [matched.get(q) or _answer_question(q, databank) for q in questions]
+                yield _ndjson({
+                    "type": "answers",
+                    "stage": "ai",
+                    "answers": answers,
+                    "added": [q for q in questions if q.lower().strip() not in previous],
+                    "removed": [a["question"] for a in matched.values()
+                                if a["question"].lower().strip() not in current],
+                    "cached": cached,
+                })
+
+        yield _ndjson({"type": "done", "method": method, **_answer_counts(answers)})
+
+    return Response(stream_with_context(events()), mimetype="application/x-ndjson",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+def _clean_questions(questions):
+    """Drop job description phrases and cap runaway extractions."""
+    # Filter out anything that looks like job description content
+    questions = [q for q in questions if not is_job_description(q)]
 
-    return jsonify({
-        "answers": answers,
-        "total_questions": len(questions),
+    # Sanity check: if we have way too many "questions", something is wrong
+    # A typical application form has 5-15 fields
+    if len(questions) > 20:
+        print(f"Warning: Found {len(questions)} questions, likely extracting job description. Limiting to 15.")
+        questions = questions[:15]
+    return questions
+
+
+def _answer_question(question, databank):
+    """Build the answer entry for one question from the databank."""
+    match, score = match_to_databank(question, databank)
+
+    if match and score > 0.3:
+        # Found a good match in databank
+        return {
+            "question": question,
+            "answer": match,
+            "source": "databank",
+            "confidence": score
+        }
+    # No match - user can type answer in extension
+    return {
+        "question": question,
+        "answer": "[No answer in databank - add this question to Q&A Databank]",
+        "source": "not_found",
+        "confidence": 0
+    }
+
+
+def _answer_counts(answers):
+    return {
+        "total_questions": len(answers),
         "from_databank": len([a for a in answers if a["source"] == "databank"]),
         "not_found": len([a for a in answers if a["source"] == "not_found"])
-    })
+    }
 
 
-if __name__ == '__main__':
+def _ndjson(event):
+    return json.dumps(event) + "\n"
+
+
+def serve_production(host, port, threads):
+    """Serve the API with waitress: a thread pool, no reloader or debugger.
+
+    Requests run on `threads` worker threads, so a slow LLM call no longer
+    holds up other extension requests. SIGTERM (sent by the launcher on
+    exit) raises SystemExit, which closes the server. Waitress then waits
+    only about 5 seconds for its worker threads before exiting, so a
+    longer LLM extraction or answer call still running is cut off and
+    its client sees a dropped connection. Falls back to Flask's threaded
+    server, with the debugger off, if waitress is not installed.
+    """
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        from waitress import serve
+    except ImportError:
+        print("waitress not installed (pip install waitress) - using Flask's threaded server")
+        app.run(host=host, port=port, debug=False, threaded=True, use_reloader=False)
+        return
+    serve(app, host=host, port=port, threads=threads, ident="JobRadar API")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Job Application Assistant API")
+    parser.add_argument("--dev", action="store_true",
+                        help="Use Flask's development server (debugger and reloader on)")
+    parser.add_argument("--threads", type=int, default=DEFAULT_THREADS,
+                        help=f"Worker threads in production mode (default {DEFAULT_THREADS})")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    args = parser.parse_args()
+
     print("=" * 50)
     print("Job Application Assistant API")
     print("=" * 50)
     print(f"Q&A Databank: {QA_DATABANK_PATH}")
     print(f"User Profile: {PROFILE_PATH}")
     print()
-    print("Starting server on http://localhost:5000")
+    mode = "development" if args.dev else f"production, {args.threads} threads"
+    print(f"Starting server on http://{args.host}:{args.port} ({mode})")
     print("Press Ctrl+C to stop")
     print("=" * 50)
 
-    app.run(host='127.0.0.1', port=5000, debug=True)
+    try:
+        if args.dev:
+            app.run(host=args.host, port=args.port, debug=True)
+        else:
+            serve_production(args.host, args.port, args.threads)
+    finally:
+        close_clients()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
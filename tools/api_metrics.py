@@ -0,0 +1,235 @@
+"""In-process request metrics for the answer API.
+
+Counters and latency histograms kept in memory (reset when the API
+restarts) and exposed at /api/metrics, either in the Prometheus text
+format or as a JSON summary for the dashboard:
+
+    jobradar_api_requests_total{endpoint, method, status}
+    jobradar_api_request_seconds{endpoint}      histogram
+    jobradar_api_stage_seconds{stage}           histogram (databank load, LLM call, ...)
+    ...plus whatever counters the API increments and gauges it registers
+
+Request timings end when the view returns its response, so for streamed
+responses they measure time to the first chunk.
+"""
+
+import bisect
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+PREFIX = "jobradar_api_"
+
+# Seconds; from a databank lookup (ms) up to a slow LLM call
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """Fixed-bucket histogram (counts per bucket, plus sum and count)."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """Return [(upper bound, cumulative count)], ending with (inf, count)."""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q):
+        """Estimate a quantile by linear interpolation within its bucket (as Prometheus does)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        lower = 0.0
+        previous = 0
+        for bound, total in self.cumulative():
+            if total >= rank:
+                if bound == float("inf"):
+                    return self.buckets[-1]
+                in_bucket = total - previous
+                return lower + (bound - lower) * ((rank - previous) / in_bucket if in_bucket else 0)
+            lower, previous = bound, total
+        return self.buckets[-1]
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key, extra=()):
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metrics:
+    """Thread-safe registry of counters, histograms and gauge callbacks."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._counters = {}  # name -> {label key: value}
+        self._histograms = {}  # name -> {label key: Histogram}
+        self._help = {}
+        self._gauge_sources = []
+
+    def describe(self, name, help_text):
+        """Set the HELP text shown for a metric in the Prometheus output."""
+        self._help[name] = help_text
+
+    def inc(self, name, value=1, **labels):
+        """Add value to a counter."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        """Record one observation in a histogram."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def stage(self, stage):
+        """Time a block as one stage of request handling (stage_seconds{stage=...})."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe("stage_seconds", time.perf_counter() - start, stage=stage)
+
+    def timed(self, stage):
+        """Decorator form of stage()."""
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.stage(stage):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def register_gauges(self, source):
+        """Add a callable returning {(name, label key tuple): value}, read at export time."""
+        self._gauge_sources.append(source)
+
+    def _gauges(self):
+        gauges = {}
+        for source in self._gauge_sources:
+            try:
+                for (name, key), value in source().items():
+                    gauges.setdefault(name, {})[key] = value
+            except Exception as e:
+                print(f"Metrics gauge failed: {e}")
+        return gauges
+
+    def init_app(self, app):
+        """Time every request and count responses by endpoint and status."""
+        from flask import g, request
+
+        @app.before_request
+        def _start_timer():
+            g.metrics_start = time.perf_counter()
+
+        @app.after_request
+        def _record_request(response):
+            start = g.pop("metrics_start", None)
+            endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+            if start is not None:
+                self.observe("request_seconds", time.perf_counter() - start, endpoint=endpoint)
+            self.inc("requests_total", endpoint=endpoint, method=request.method,
+                     status=str(response.status_code))
+            return response
+
+    # Export
+
+    def prometheus_text(self):
+        """Render every metric in the Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {name: {key: (h.cumulative(), h.sum, h.count) for key, h in series.items()}
+                          for name, series in self._histograms.items()}
+        lines = []
+
+        def header(name, kind):
+            full = PREFIX + name
+            if name in self._help:
+                lines.append(f"# HELP {full} {self._help[name]}")
+            lines.append(f"# TYPE {full} {kind}")
+            return full
+
+        for name in sorted(counters):
+            full = header(name, "counter")
+            for key, value in sorted(counters[name].items()):
+                lines.append(f"{full}{_format_labels(key)} {_format_value(value)}")
+        for name, series in sorted(self._gauges().items()):
+            full = header(name, "gauge")
+            for key, value in sorted(series.items()):
+                lines.append(f"{full}{_format_labels(key)} {_format_value(value)}")
+        for name in sorted(histograms):
+            full = header(name, "histogram")
+            for key, (buckets, total, count) in sorted(histograms[name].items()):
+                for bound, cumulative in buckets:
+                    le = (("le", _format_value(bound)),)
+                    lines.append(f"{full}_bucket{_format_labels(key, le)} {cumulative}")
+                lines.append(f"{full}_sum{_format_labels(key)} {_format_value(total)}")
+                lines.append(f"{full}_count{_format_labels(key)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self):
+        """Return a JSON-friendly summary: counters, gauges and histogram count/mean/p50/p95."""
+        with self._lock:
+            counters = {name: [{"labels": dict(key), "value": value} for key, value in sorted(series.items())]
+                        for name, series in self._counters.items()}
+            histograms = {}
+            for name, series in self._histograms.items():
+                histograms[name] = [{
+                    "labels": dict(key),
+                    "count": h.count,
+                    "mean_ms": round(h.sum / h.count * 1000, 2) if h.count else None,
+                    "p50_ms": round(h.quantile(0.5) * 1000, 2) if h.count else None,
+                    "p95_ms": round(h.quantile(0.95) * 1000, 2) if h.count else None,
+                } for key, h in sorted(series.items())]
+        gauges = {name: [{"labels": dict(key), "value": value} for key, value in sorted(series.items())]
+                  for name, series in self._gauges().items()}
+        return {
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "counters": counters,
+            "gauges": gauges,
+            "histograms": histograms,
+        }
+
+
+METRICS = Metrics()
+METRICS.describe("requests_total", "HTTP responses by endpoint, method and status")
+METRICS.describe("request_seconds", "Request handling time by endpoint")
+METRICS.describe("stage_seconds", "Time spent per request-handling stage")
@@ -0,0 +1,214 @@
+"""Content-addressed store for job descriptions.
+
+Agency reposts and multi-location listings share the same description
+text, and every scrape run used to archive each copy verbatim. Here each
+distinct description is stored once, zlib-compressed, under a hash of its
+text; archived job records keep only the hash. Blobs are reference counted
+and gc() removes the ones nothing points at any more.
+
+The job store, CSV export and Google Sheets still hold full text, since
+they are what people read and search.
+
+Run with: python blob_store.py --measure   (report savings on .tmp/ archives)
+"""
+
+import argparse
+import hashlib
+import sqlite3
+import sys
+import zlib
+from collections import Counter
+
+from scraper_utils import TMP_DIR
+
+DESCRIPTIONS_DB_PATH = TMP_DIR / "descriptions.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    refcount INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# SQLite's default limit on host parameters per statement is 999
+_CHUNK = 900
+
+
+def content_hash(text):
+    """Return the 128-bit BLAKE2 hex digest used as a description's key."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _chunks(items):
+    for start in range(0, len(items), _CHUNK):
+        yield items[start:start + _CHUNK]
+
+
+class BlobStore:
+    """SQLite-backed hash -> compressed text store with reference counts."""
+
+    def __init__(self, path=DESCRIPTIONS_DB_PATH):
+        self.path = path
+        self.path.parent.mkdir(exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _existing(self, hashes):
+        found = set()
+        for chunk in _chunks(hashes):
+            placeholders = ",".join("?" * len(chunk))
+            found.update(row[0] for row in self.conn.execute(
+                f"SELECT hash FROM blobs WHERE hash IN ({placeholders})", chunk))
+        return found
+
+    def put_many(self, texts):
+        """Store texts, adding one reference per text. Returns their hashes in order.
+
+        Only texts not already stored are compressed and written; known
+        ones just have their refcount bumped.
+        """
+        hashes = [content_hash(text) for text in texts]
+        counts = Counter(hashes)
+        existing = self._existing(list(counts))
+        new_rows = {}
+        for text, digest in zip(texts, hashes):
+            if digest not in existing and digest not in new_rows:
+                new_rows[digest] = (digest, zlib.compress(text.encode("utf-8"), 6),
+                                    len(text), counts[digest])
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO blobs (hash, data, size, refcount) VALUES (?, ?, ?, ?)",
+                new_rows.values(),
+            )
+            self.conn.executemany(
+                "UPDATE blobs SET refcount = refcount + ? WHERE hash = ?",
+                [(counts[digest], digest) for digest in existing],
+            )
+        return hashes
+
+    def put(self, text):
+        """Store one text and return its hash."""
+        return self.put_many([text])[0]
+
+    def get_many(self, hashes):
+        """Return {hash: text} for the stored hashes among the given ones."""
+        texts = {}
+        for chunk in _chunks(list(set(hashes))):
+            placeholders = ",".join("?" * len(chunk))
+            for digest, data in self.conn.execute(
+                    f"SELECT hash, data FROM blobs WHERE hash IN ({placeholders})", chunk):
+                texts[digest] = zlib.decompress(data).decode("utf-8")
+        return texts
+
+    def get(self, digest):
+        """Return the text for a hash, or None if it isn't stored."""
+        return self.get_many([digest]).get(digest)
+
+    def release(self, hashes):
+        """Drop one reference per hash given (call gc() to delete unreferenced blobs)."""
+        counts = Counter(hashes)
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE blobs SET refcount = MAX(refcount - ?, 0) WHERE hash = ?",
+                [(count, digest) for digest, count in counts.items()],
+            )
+
+    def gc(self):
+        """Delete blobs with no references. Returns the number deleted."""
+        with self.conn:
+            return self.conn.execute("DELETE FROM blobs WHERE refcount <= 0").rowcount
+
+    def stats(self):
+        """Return blob count, reference count and logical vs stored sizes."""
+        row = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(refcount), 0), COALESCE(SUM(size * refcount), 0), "
+            "COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(data)), 0) FROM blobs"
+        ).fetchone()
+        return {
+            "blobs": row[0],
+            "references": row[1],
+            "referenced_chars": row[2],
+            "unique_chars": row[3],
+            "stored_bytes": row[4],
+        }
+
+
+def measure(descriptions):
+    """Measure what deduplicating a list of descriptions saves, on disk and in memory.
+
+    Args:
+        descriptions: Every description as it would be stored verbatim
+
+    Returns:
+        dict: Verbatim vs deduplicated byte counts
+    """
+    unique = {}
+    for text in descriptions:
+        unique.setdefault(content_hash(text), text)
+    verbatim_bytes = sum(len(text.encode("utf-8")) for text in descriptions)
+    stored_bytes = sum(len(zlib.compress(text.encode("utf-8"), 6)) for text in unique.values())
+    # Each record keeps a 32-char hash reference instead of the text
+    reference_bytes = len(descriptions) * 32
+    # In memory: one str object per record vs one per distinct text (shared references)
+    verbatim_memory = sum(sys.getsizeof(text) for text in descriptions)
+    shared_memory = sum(sys.getsizeof(text) for text in unique.values())
+    return {
+        "descriptions": len(descriptions),
+        "unique": len(unique),
+        "verbatim_mb": round(verbatim_bytes / 1_048_576, 2),
+        "deduplicated_mb": round((stored_bytes + reference_bytes) / 1_048_576, 2),
+        "disk_saving_pct": round(100 * (1 - (stored_bytes + reference_bytes) / verbatim_bytes), 1)
+        if verbatim_bytes else 0.0,
+        "memory_verbatim_mb": round(verbatim_memory / 1_048_576, 2),
+        "memory_shared_mb": round(shared_memory / 1_048_576, 2),
+    }
+
+
+def _archive_descriptions():
+    """Collect every archived description (raw segments + legacy raw files), verbatim."""
+    from raw_log import iter_legacy_raw_jobs, iter_raw_jobs
+
+    descriptions = [job.get("description") or "" for job in iter_raw_jobs()]
+    descriptions += [job.get("description") or "" for job in iter_legacy_raw_jobs()]
+    return descriptions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Description blob store maintenance")
+    parser.add_argument("--measure", action="store_true",
+                        help="Report disk/memory saved by deduplicating archived descriptions")
+    parser.add_argument("--gc", action="store_true", help="Delete unreferenced blobs")
+    args = parser.parse_args()
+
+    with BlobStore() as store:
+        if args.gc:
+            print(f"Deleted {store.gc()} unreferenced descriptions")
+        stats = store.stats()
+    print(f"Blob store: {stats['blobs']} descriptions, {stats['references']} references, "
+          f"{stats['stored_bytes'] / 1_048_576:.2f} MB stored "
+          f"({stats['referenced_chars'] / 1_048_576:.2f}M chars referenced)")
+
+    if args.measure:
+        descriptions = _archive_descriptions()
+        if not descriptions:
+            print("No archived jobs found in .tmp/. Run a scrape first.")
+            return 0
+        for key, value in measure(descriptions).items():
+            print(f"  {key}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Prebuilt index for fuzzy matching questions against the Q&A databank.
+
+Stored questions are normalized to word sets once, and an inverted index
+(word -> stored questions containing it) limits scoring to questions that
+share at least one word with the incoming one. Questions with no shared
+word have a Jaccard similarity of 0 and could never be the best match, so
+results are identical to scoring every stored question.
+"""
+
+import re
+from types import MappingProxyType
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+
+def normalize_words(text):
+    """Lowercase, strip punctuation and return the set of words (as calculate_similarity does)."""
+    return set(_PUNCTUATION_RE.sub("", text.lower()).split())
+
+
+class DatabankIndex:
+    """Word-set index over the databank's stored questions.
+
+    Args:
+        questions: The databank's {question: answer} mapping. Entries with
+            empty answers are skipped, as the fuzzy matcher never returns them.
+    """
+
+    def __init__(self, questions):
+        self.entries = []  # (word set, answer), in databank order
+        self.postings = {}  # word -> indexes into entries, ascending
+        for stored_q, answer in questions.items():
+            if not answer:
+                continue
+            words = normalize_words(stored_q)
+            if not words:
+                continue
+            index = len(self.entries)
+            self.entries.append((words, answer))
+            for word in words:
+                self.postings.setdefault(word, []).append(index)
+
+    def best_match(self, question, threshold=0.3):
+        """Return (answer, score) for the most similar stored question above threshold.
+
+        Candidates are visited in databank order and only a strictly higher
+        score replaces the current best, so ties resolve to the earliest
+        question exactly like the original linear scan. Returns (None, 0)
+        if nothing scores above the threshold.
+        """
+        words = normalize_words(question)
+        if not words:
+            return None, 0
+
+        candidates = set()
+        for word in words:
+            candidates.update(self.postings.get(word, ()))
+
+        best_match = None
+        best_score = 0
+        for index in sorted(candidates):
+            stored_words, answer = self.entries[index]
+            score = len(words & stored_words) / len(words | stored_words)
+            if score > best_score and score > threshold:
+                best_score = score
+                best_match = answer
+        return best_match, best_score
+
+
+_cached = (None, None)  # (questions mapping, DatabankIndex)
+
+
+def get_databank_index(questions):
+    """Return a DatabankIndex for a questions mapping, reusing it while unchanged.
+
+    Frozen mappings from the file cache are replaced by a new object when
+    qa_databank.yaml changes, so the index is rebuilt exactly then. Plain
+    (mutable) dicts are indexed on every call, since they may have been
+    edited in place.
+    """
+    global _cached
+    if isinstance(questions, MappingProxyType):
+        cached_questions, index = _cached
+        if cached_questions is questions:
+            return index
+        index = DatabankIndex(questions)
+        _cached = (questions, index)
+        return index
+    return DatabankIndex(questions)
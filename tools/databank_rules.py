@@ -0,0 +1,141 @@
+"""Keyword rules that answer personal-info questions straight from the databank.
+
+Each rule says which phrases in a question (lowercased) trigger it, which
+phrases veto it, and where in qa_databank.yaml the answer lives. Rules are
+tried in priority order; the first one that triggers and whose databank
+value is set wins. All rule keywords are compiled into one KeywordScanner,
+so a question is scanned once no matter how many rules there are.
+
+The same rules are exported for the Chrome extension's matching.js:
+
+    python databank_rules.py --export
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from text_match import KeywordScanner
+
+EXTENSION_RULES_PATH = Path(__file__).parent.parent / "chrome-extension" / "lib" / "databank_rules.js"
+
+# Fields:
+#   any        trigger if the question contains any of these
+#   none       ...unless it contains any of these
+#   path       databank value to answer with; the rule is skipped if it is empty
+#   transform  "first" / "last": answer with the first word / remaining words
+#              of the value (the answer may then be empty)
+#   source     answer source label used by the extension
+#   extension  overrides applied to the exported copy (the extension matches
+#              a bare "name" field exactly rather than any "name" substring)
+DATABANK_RULES = [
+    {"name": "first_name", "priority": 10, "any": ["first name"], "none": ["last"],
+     "path": "personal_info.full_name", "transform": "first", "source": "personal_info"},
+    {"name": "last_name", "priority": 20, "any": ["last name", "surname", "family name"],
+     "path": "personal_info.full_name", "transform": "last", "source": "personal_info"},
+    {"name": "full_name", "priority": 30, "any": ["your name", "full name", "name"],
+     "path": "personal_info.full_name", "source": "personal_info",
+     "extension": {"any": ["your name", "full name"], "exact": ["name"]}},
+    {"name": "email", "priority": 40, "any": ["email", "e-mail"],
+     "path": "personal_info.email", "source": "personal_info"},
+    {"name": "phone", "priority": 50, "any": ["phone", "telephone", "mobile", "contact number"],
+     "path": "personal_info.phone", "source": "personal_info"},
+    {"name": "location", "priority": 60, "any": ["location", "address", "city", "where do you live"],
+     "path": "personal_info.location", "source": "personal_info"},
+    {"name": "linkedin", "priority": 70, "any": ["linkedin"],
+     "path": "personal_info.linkedin", "source": "personal_info"},
+    {"name": "salary", "priority": 80, "any": ["salary", "compensation", "pay", "wage", "expected"],
+     "path": "salary.expected_salary", "source": "salary"},
+    {"name": "work_authorization", "priority": 90,
+     "any": ["work in uk", "eligible to work", "right to work", "authorization"],
+     "path": "work_authorization.eligible_to_work_uk", "source": "work_auth"},
+    {"name": "sponsorship", "priority": 100, "any": ["sponsor", "visa"],
+     "path": "work_authorization.require_sponsorship", "source": "work_auth"},
+    {"name": "notice_period", "priority": 110, "any": ["notice period", "start date", "when can you start"],
+     "path": "work_authorization.notice_period", "source": "work_auth"},
+]
+
+
+def _lookup(databank, path):
+    """Return the value at a dotted path, or None if any part is missing."""
+    value = databank
+    for key in path.split("."):
+        if not hasattr(value, "get"):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _transform(value, transform):
+    if transform == "first":
+        parts = value.split()
+        return parts[0] if parts else ""
+    if transform == "last":
+        parts = value.split()
+        return " ".join(parts[1:]) if len(parts) > 1 else ""
+    return value
+
+
+class RuleSet:
+    """Rules compiled for single-pass classification."""
+
+    def __init__(self, rules=DATABANK_RULES):
+        self.rules = sorted(rules, key=lambda rule: rule["priority"])
+        self.scanner = KeywordScanner(
+            keyword for rule in self.rules for keyword in rule["any"] + rule.get("none", [])
+        )
+
+    def triggered(self, question):
+        """Return the rules a question triggers, in priority order (ignoring databank values)."""
+        found = self.scanner.find(question.lower())
+        return [
+            rule for rule in self.rules
+            if found.intersection(rule["any"]) and not found.intersection(rule.get("none", ()))
+        ]
+
+    def match(self, question, databank):
+        """Answer a question from the first triggered rule whose databank value is set.
+
+        Returns:
+            tuple: (rule, answer), or (None, None) if no rule applies
+        """
+        for rule in self.triggered(question):
+            value = _lookup(databank, rule["path"])
+            if value:
+                return rule, _transform(value, rule.get("transform"))
+        return None, None
+
+
+RULES = RuleSet()
+
+
+def export_rules(path=EXTENSION_RULES_PATH, rules=DATABANK_RULES):
+    """Write the rules as an ES module for the Chrome extension, with extension overrides applied."""
+    exported = []
+    for rule in sorted(rules, key=lambda rule: rule["priority"]):
+        rule = dict(rule)
+        rule.update(rule.pop("extension", {}))
+        exported.append(rule)
+    path.write_text(
+        "// Generated by tools/databank_rules.py --export. Do not edit by hand.\n"
+        f"export const DATABANK_RULES = {json.dumps(exported, indent=2)};\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Databank shortcut rules")
+    parser.add_argument("--export", action="store_true",
+                        help=f"Write the rules for the Chrome extension to {EXTENSION_RULES_PATH}")
+    args = parser.parse_args()
+    if args.export:
+        print(f"Exported {len(DATABANK_RULES)} rules to {export_rules()}")
+    else:
+        parser.print_help()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
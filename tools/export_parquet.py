@@ -0,0 +1,188 @@
+"""Columnar export of job and score history for analysis.
+
+Writes recorded scrape runs (see job_store run snapshots), with the job
+fields and fit scores each run recorded, to a Parquet dataset under
+.tmp/history/, hive-partitioned by run date (history/run_date=2026-01-31/...).
+Each export appends only the runs not in the dataset yet; existing files
+are never rewritten. company, location, source and run_id are
+dictionary-encoded, so repeated values are stored once per column chunk.
+Readers can load just the columns they need, memory-mapped:
+
+    from export_parquet import read_history
+    df = read_history(columns=["company", "fit_score"]).to_pandas()
+
+Requires pyarrow (pip install pyarrow).
+
+Run with: python export_parquet.py [--format parquet|arrow] [--no-descriptions]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from job_store import open_job_store
+from scraper_utils import TMP_DIR
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+HISTORY_DIR = TMP_DIR / "history"
+
+# Low-cardinality text columns stored as dictionary<int32, string>
+DICTIONARY_COLUMNS = ("company", "location", "source", "run_id")
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("pyarrow is required for the columnar export: pip install pyarrow")
+
+
+def history_schema(include_descriptions=True):
+    """Return the Arrow schema of the exported history."""
+    _require_pyarrow()
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    fields = [
+        pa.field("run_id", dictionary),
+        pa.field("run_date", pa.string()),
+        pa.field("url", pa.string()),
+        pa.field("title", pa.string()),
+        pa.field("company", dictionary),
+        pa.field("location", dictionary),
+        pa.field("source", dictionary),
+        pa.field("date_posted", pa.string()),
+        pa.field("salary", pa.string()),
+        pa.field("salary_min", pa.int64()),
+        pa.field("salary_max", pa.int64()),
+        pa.field("scraped_at", pa.string()),
+        pa.field("fit_score", pa.int64()),
+        pa.field("content_hash", pa.string()),
+    ]
+    if include_descriptions:
+        fields.append(pa.field("description", pa.string()))
+    return pa.schema(fields)
+
+
+def run_table(store, run, include_descriptions=True):
+    """Build the Arrow table for one recorded run."""
+    schema = history_schema(include_descriptions)
+    columns = {field.name: [] for field in schema}
+    run_date = (run["created_at"] or run["run_id"])[:10]
+    for job, content_hash in store.iter_run_jobs(run["run_id"]):
+        columns["run_id"].append(run["run_id"])
+        columns["run_date"].append(run_date)
+        columns["content_hash"].append(content_hash)
+        for name in schema.names:
+            if name not in ("run_id", "run_date", "content_hash"):
+                columns[name].append(job.get(name))
+    return pa.table(columns, schema=schema)
+
+
+def exported_run_ids(path=HISTORY_DIR, file_format="parquet"):
+    """Return the set of run ids already in the dataset at path."""
+    _require_pyarrow()
+    if not path.exists() or not any(path.iterdir()):
+        return set()
+    dataset = ds.dataset(str(path), format="parquet" if file_format == "parquet" else "ipc",
+                         partitioning="hive")
+    return set(pc.unique(dataset.to_table(columns=["run_id"]).column("run_id")).to_pylist())
+
+
+def export_history(path=HISTORY_DIR, file_format="parquet", include_descriptions=True, runs=None):
+    """Append recorded runs that are not in the dataset yet, partitioned by run date.
+
+    Running this after every scrape adds that run's rows; earlier runs keep
+    the values they were exported with. Delete the dataset directory to
+    rebuild it from scratch.
+
+    Args:
+        path: Dataset directory
+        file_format: "parquet" or "arrow" (Arrow IPC/Feather v2)
+        include_descriptions: Include the description column (the bulk of the size)
+        runs: Run ids to export (default: all recorded runs); runs already
+            in the dataset are skipped
+
+    Returns:
+        int: Number of rows written
+    """
+    _require_pyarrow()
+    path = Path(path)
+    exported = exported_run_ids(path, file_format)
+    with open_job_store() as store:
+        recorded = [run for run in store.list_runs()
+                    if (runs is None or run["run_id"] in runs) and run["run_id"] not in exported]
+        tables = [run_table(store, run, include_descriptions) for run in reversed(recorded)]
+    tables = [table for table in tables if table.num_rows]
+    if not tables:
+        return 0
+    table = pa.concat_tables(tables).unify_dictionaries()
+
+    write_options = None
+    if file_format == "parquet":
+        write_options = ds.ParquetFileFormat().make_write_options(
+            compression="zstd", use_dictionary=list(DICTIONARY_COLUMNS),
+        )
+    # Name files after the newest run exported, so each export adds new files
+    # next to earlier ones in a shared run_date partition
+    extension = "parquet" if file_format == "parquet" else "arrow"
+    ds.write_dataset(
+        table,
+        str(path),
+        format="parquet" if file_format == "parquet" else "ipc",
+        file_options=write_options,
+        partitioning=["run_date"],
+        partitioning_flavor="hive",
+        basename_template=f"runs-{recorded[0]['run_id']}-{{i}}.{extension}",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+    return table.num_rows
+
+
+def read_history(path=HISTORY_DIR, columns=None, filters=None, file_format="parquet"):
+    """Read the exported history, loading only the requested columns.
+
+    Args:
+        path: Dataset directory
+        columns: Column names to load (default: all)
+        filters: Row filter in pyarrow form, e.g. [("fit_score", ">=", 70)]
+        file_format: "parquet" or "arrow", matching the export
+
+    Returns:
+        pyarrow.Table (call .to_pandas() for a DataFrame)
+    """
+    _require_pyarrow()
+    if file_format == "parquet":
+        return pq.read_table(str(path), columns=columns, filters=filters,
+                             memory_map=True, partitioning="hive")
+    dataset = ds.dataset(str(path), format="ipc", partitioning="hive")
+    expression = pq.filters_to_expression(filters) if filters else None
+    return dataset.to_table(columns=columns, filter=expression)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export job and score history to a columnar dataset")
+    parser.add_argument("--format", choices=["parquet", "arrow"], default="parquet")
+    parser.add_argument("--no-descriptions", action="store_true",
+                        help="Leave out job descriptions (much smaller files)")
+    parser.add_argument("--output", default=str(HISTORY_DIR), help="Dataset directory")
+    args = parser.parse_args()
+
+    try:
+        rows = export_history(args.output, file_format=args.format,
+                              include_descriptions=not args.no_descriptions)
+    except ImportError as e:
+        print(e)
+        return 1
+    if not rows:
+        print("No new scrape runs to export.")
+        return 0
+    print(f"Exported {rows} job rows to {args.output} ({args.format}, partitioned by run date)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""Two-tier cache of AI question extraction results.
+
+Users re-click the extension on the same application form constantly, and
+each click used to send the page text to the LLM again. Results are cached
+under a hash of the normalized page text and the prompt version: first in
+an in-process LRU, then in a SQLite table in .tmp/extraction_cache.db that
+survives API restarts. Entries older than the TTL are treated as missing.
+Only successful AI extractions should be stored, never regex fallbacks.
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+from persistence import dumps, loads
+
+# Also imported by the Flask API, so avoid scraper_utils (and its .env loading)
+TMP_DIR = Path(__file__).parent.parent / ".tmp"
+EXTRACTION_CACHE_PATH = TMP_DIR / "extraction_cache.db"
+
+DEFAULT_TTL_SECONDS = 7 * 86400
+DEFAULT_MEMORY_ENTRIES = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS extractions (
+    key TEXT PRIMARY KEY,
+    questions TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def extraction_key(page_text, prompt_version):
+    """Return the cache key for a page: sha256 of the prompt version and normalized text.
+
+    Whitespace runs are collapsed and case is kept, so re-extracted DOM text
+    that only differs in layout maps to the same entry.
+    """
+    normalized = _WHITESPACE_RE.sub(" ", page_text).strip()
+    return hashlib.sha256(f"{prompt_version}\0{normalized}".encode("utf-8")).hexdigest()
+
+
+class ExtractionCache:
+    """In-memory LRU in front of a SQLite store, with a TTL on both.
+
+    Args:
+        path: SQLite database file (None = memory only)
+        ttl_seconds: Entries older than this read as missing (None or 0 = never expire)
+        max_memory_entries: LRU size of the in-memory tier
+    """
+
+    def __init__(self, path=EXTRACTION_CACHE_PATH, ttl_seconds=DEFAULT_TTL_SECONDS,
+                 max_memory_entries=DEFAULT_MEMORY_ENTRIES):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self._memory = OrderedDict()  # key -> (created_at, questions)
+        self._lock = threading.Lock()
+        self._counts = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self.conn = None
+        if path is not None:
+            self.path.parent.mkdir(exist_ok=True)
+            self.conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.executescript(SCHEMA)
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+
+    def _expired(self, created_at):
+        return bool(self.ttl_seconds) and created_at < time.time() - self.ttl_seconds
+
+    def _remember(self, key, created_at, questions):
+        self._memory[key] = (created_at, questions)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Return the cached question list for a key, or None if missing or expired.
+
+        Returns a new list each time, so callers may modify it.
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[0]):
+                    self._memory.move_to_end(key)
+                    self._counts["memory_hits"] += 1
+                    return list(entry[1])
+                del self._memory[key]
+
+            if self.conn is not None:
+                row = self.conn.execute(
+                    "SELECT questions, created_at FROM extractions WHERE key = ?", (key,)
+                ).fetchone()
+                if row and not self._expired(row[1]):
+                    questions = tuple(loads(row[0]))
+                    self._remember(key, row[1], questions)
+                    self._counts["disk_hits"] += 1
+                    return list(questions)
+
+            self._counts["misses"] += 1
+            return None
+
+    def put(self, key, questions):
+        """Store an extraction result in both tiers."""
+        created_at = time.time()
+        questions = tuple(questions)
+        with self._lock:
+            self._remember(key, created_at, questions)
+            if self.conn is not None:
+                with self.conn:
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO extractions (key, questions, created_at) VALUES (?, ?, ?)",
+                        (key, dumps(list(questions)).decode("utf-8"), created_at),
+                    )
+
+    def purge_expired(self):
+        """Delete expired entries from disk. Returns the number deleted."""
+        if self.conn is None or not self.ttl_seconds:
+            return 0
+        with self._lock, self.conn:
+            return self.conn.execute(
+                "DELETE FROM extractions WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            ).rowcount
+
+    def clear(self):
+        """Drop every cached entry (memory and disk) and reset the counters."""
+        with self._lock:
+            self._memory.clear()
+            self._counts = dict.fromkeys(self._counts, 0)
+            if self.conn is not None:
+                with self.conn:
+                    self.conn.execute("DELETE FROM extractions")
+
+    def stats(self):
+        """Return hit/miss counts since startup, the hit rate and entry counts."""
+        with self._lock:
+            counts = dict(self._counts)
+            memory_entries = len(self._memory)
+            disk_entries = (self.conn.execute("SELECT COUNT(*) FROM extractions").fetchone()[0]
+                            if self.conn is not None else 0)
+        lookups = sum(counts.values())
+        hits = counts["memory_hits"] + counts["disk_hits"]
+        return {
+            **counts,
+            "lookups": lookups,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "memory_entries": memory_entries,
+            "disk_entries": disk_entries,
+        }
+
+
+@lru_cache(maxsize=None)
+def open_extraction_cache():
+    """Return the process-wide extraction cache."""
+    return ExtractionCache()
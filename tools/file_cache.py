@@ -0,0 +1,105 @@
+"""Process-wide cache of parsed config/data files, invalidated by mtime.
+
+Entries are keyed on (path, mtime_ns, size), so a file rewritten by the
+dashboard, the Flask API or a CLI tool is re-parsed on the next load while
+unchanged files cost one os.stat(). Cached objects are shared by every
+caller, so they are handed out frozen (dicts as read-only MappingProxyType,
+lists as tuples); use thaw() or mutable=True for a private editable copy.
+"""
+
+import os
+import threading
+from pathlib import Path
+from types import MappingProxyType
+
+from persistence import load_json, load_yaml
+
+_entries = {}  # (loader name, resolved path) -> ((mtime_ns, size) or None, frozen value)
+_stats = {"hits": 0, "misses": 0}
+_lock = threading.Lock()
+
+
+def freeze(obj):
+    """Return a read-only deep view of parsed JSON/YAML data."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(freeze(value) for value in obj)
+    return obj
+
+
+def thaw(obj):
+    """Return a mutable deep copy of frozen data (plain dicts and lists)."""
+    if isinstance(obj, (dict, MappingProxyType)):
+        return {key: thaw(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [thaw(value) for value in obj]
+    return obj
+
+
+def _file_stamp(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def cached_load(path, loader, default=None, mutable=False):
+    """Load a file through loader(path), reusing the parsed result while it is unchanged.
+
+    Args:
+        path: File to load
+        loader: Function taking the path and returning parsed data
+        default: Returned (frozen, or copied if mutable) when the file doesn't exist
+        mutable: Return an editable deep copy instead of the shared frozen object
+
+    Returns:
+        The parsed data, frozen unless mutable=True
+    """
+    path = Path(path).resolve()
+    key = (getattr(loader, "__name__", repr(loader)), path)
+    stamp = _file_stamp(path)
+
+    with _lock:
+        entry = _entries.get(key)
+        hit = entry is not None and entry[0] == stamp
+        _stats["hits" if hit else "misses"] += 1
+
+    if hit:
+        value = entry[1]
+    else:
+        value = freeze(loader(path) if stamp is not None else None)
+        with _lock:
+            _entries[key] = (stamp, value)
+
+    if value is None:
+        value = default
+    return thaw(value) if mutable else value
+
+
+def load_yaml_cached(path, default=None, mutable=False):
+    """Load a YAML file via the cache (see cached_load)."""
+    return cached_load(path, load_yaml, default=default, mutable=mutable)
+
+
+def load_json_cached(path, default=None, mutable=False):
+    """Load a JSON file via the cache (see cached_load)."""
+    return cached_load(path, load_json, default=default, mutable=mutable)
+
+
+def invalidate(path=None):
+    """Drop cached entries for one path, or everything if path is None."""
+    with _lock:
+        if path is None:
+            _entries.clear()
+            return
+        path = Path(path).resolve()
+        for key in [key for key in _entries if key[1] == path]:
+            del _entries[key]
+
+
+def cache_stats():
+    """Return hit/miss counters and the number of cached files."""
+    with _lock:
+        return {**_stats, "entries": len(_entries)}
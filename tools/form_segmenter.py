@@ -0,0 +1,140 @@
+"""Pick the form-like parts of a page before sending it to the LLM.
+
+Copied application pages are mostly job description, and the extraction
+prompt used to send the first 8000 characters whatever they contained, so
+forms further down were cut off. Here the page is split into blocks
+(paragraphs, and runs of short lines vs prose), each block is scored for
+form-likeness from its lines (short labels, "*" required markers, "?" and
+":" endings, field vocabulary; bullets, prose and job-description phrases
+count against it), and the best blocks that fit a token budget are kept
+in page order.
+"""
+
+import re
+
+from text_match import KeywordScanner
+
+# Same estimate the app uses elsewhere (~4 characters per token)
+CHARS_PER_TOKEN = 4
+DEFAULT_TOKEN_BUDGET = 2000
+
+MAX_BLOCK_LINES = 12
+PROSE_WORDS = 20
+# A lone short heading ("Benefits", "Submit") scores 0.5; a lone field label 2+
+MIN_BLOCK_SCORE = 1.0
+
+FIELD_VOCABULARY = [
+    "name", "first name", "last name", "surname", "email", "e-mail", "phone", "mobile",
+    "address", "city", "country", "postcode", "post code", "zip", "location",
+    "linkedin", "github", "portfolio", "website", "resume", "cv", "cover letter",
+    "upload", "attach", "salary", "compensation", "notice period", "start date",
+    "when can you start", "availability", "visa", "sponsorship", "authorized",
+    "authorised", "eligible", "right to work", "gender", "pronouns", "ethnicity",
+    "disability", "veteran", "how did you hear", "referred", "current company",
+    "why do you want", "why are you interested", "tell us", "describe", "please provide",
+]
+
+# Phrases that mark job description text rather than form fields
+JOB_DESCRIPTION_PHRASES = [
+    'experience with', 'experience in', 'knowledge of', 'proficiency in',
+    'ability to', 'responsible for', 'you will', 'we are looking',
+    'the ideal candidate', 'requirements', 'qualifications',
+    'must have', 'should have', 'preferred', 'required',
+    'years of experience', 'degree in', 'background in',
+    'skills in', 'familiarity with', 'understanding of'
+]
+
+_FIELD_SCANNER = KeywordScanner(FIELD_VOCABULARY)
+_JOB_DESCRIPTION_SCANNER = KeywordScanner(JOB_DESCRIPTION_PHRASES)
+_BULLET_RE = re.compile(r"^(?:[-•·▪◦]|\*\s)")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
+
+def estimate_tokens(text):
+    """Rough token count for budgeting (characters / 4)."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def _is_prose(line):
+    return len(line.split()) > PROSE_WORDS
+
+
+def segment_blocks(page_text):
+    """Split page text into blocks of stripped lines.
+
+    Blocks end at blank lines, where lines switch between prose and short
+    labels (copied DOM text often has no blank lines), and every
+    MAX_BLOCK_LINES lines.
+
+    Returns:
+        list: Lists of lines, in page order
+    """
+    blocks = []
+    for paragraph in _BLANK_LINES_RE.split(page_text):
+        block = []
+        for line in paragraph.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if block and (_is_prose(line) != _is_prose(block[-1]) or len(block) >= MAX_BLOCK_LINES):
+                blocks.append(block)
+                block = []
+            block.append(line)
+        if block:
+            blocks.append(block)
+    return blocks
+
+
+def score_line(line):
+    """Score one line for looking like a form field label or applicant question."""
+    lower = line.lower()
+    words = len(line.split())
+    score = 0.0
+    if _FIELD_SCANNER.find(lower):
+        score += 2
+    if line.endswith("*") or " * " in line:
+        score += 2
+    if line.endswith("?"):
+        score += 1.5
+    elif line.endswith(":"):
+        score += 1
+    if _BULLET_RE.match(line):
+        score -= 1
+    elif words <= 6:
+        score += 0.5
+    if words > PROSE_WORDS:
+        score -= 2
+    if _JOB_DESCRIPTION_SCANNER.find(lower):
+        score -= 1.5
+    return score
+
+
+def score_block(lines):
+    """Score a block as the sum of its line scores."""
+    return sum(score_line(line) for line in lines)
+
+
+def select_form_text(page_text, token_budget=DEFAULT_TOKEN_BUDGET):
+    """Return the most form-like blocks of a page that fit in token_budget, in page order.
+
+    Blocks are taken best score per token first. If no block reaches
+    MIN_BLOCK_SCORE (nothing looks like a form), the start of the page is
+    returned, as the prompt used to send.
+    """
+    blocks = [(index, "\n".join(lines), score_block(lines))
+              for index, lines in enumerate(segment_blocks(page_text))]
+    candidates = [block for block in blocks if block[2] >= MIN_BLOCK_SCORE]
+    candidates.sort(key=lambda block: (-block[2] / max(estimate_tokens(block[1]), 1), block[0]))
+
+    chosen = []
+    used = 0
+    for index, text, _ in candidates:
+        tokens = estimate_tokens(text) + 1  # + joining newline
+        if used + tokens > token_budget:
+            continue
+        chosen.append((index, text))
+        used += tokens
+
+    if not chosen:
+        return page_text[:token_budget * CHARS_PER_TOKEN]
+    return "\n\n".join(text for _, text in sorted(chosen))
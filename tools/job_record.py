@@ -0,0 +1,132 @@
+"""Compact job record shared by the scraper, scorer and exporters.
+
+Job behaves like the plain dicts the pipeline used to pass around (job["title"],
+job.get("fit_score"), {**job}, csv.DictWriter rows) but stores its fields in
+__slots__ and interns the highly repeated source/company/location strings,
+so large job lists take noticeably less memory and copy faster.
+"""
+
+import sys
+from collections.abc import MutableMapping
+
+JOB_FIELDS = (
+    "title", "company", "location", "url", "date_posted", "salary",
+    "salary_min", "salary_max", "description", "source", "scraped_at",
+    "fit_score", "fit_breakdown",
+)
+
+# Fields whose values repeat across many jobs and are worth interning
+INTERNED_FIELDS = frozenset({"source", "company", "location"})
+
+_FIELD_SET = frozenset(JOB_FIELDS)
+_MISSING = object()
+
+
+class Job(MutableMapping):
+    """A single job listing with dict-style access.
+
+    Standard fields live in slots; an unset slot reads as a missing key, just
+    like a dict without that key. Any non-standard keys are kept in a small
+    side dict so round-tripping arbitrary JSON is lossless.
+    """
+
+    __slots__ = JOB_FIELDS + ("_extra",)
+
+    def __init__(self, data=None, **fields):
+        self._extra = None
+        for source in (data, fields):
+            if not source:
+                continue
+            # Inlined __setitem__: this runs once per field for every job loaded
+            for key, value in source.items():
+                if key in _FIELD_SET:
+                    if key in INTERNED_FIELDS and type(value) is str:
+                        value = sys.intern(value)
+                    setattr(self, key, value)
+                else:
+                    if self._extra is None:
+                        self._extra = {}
+                    self._extra[key] = value
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a Job from a dict (e.g. a record loaded from JSON)."""
+        return data.copy() if isinstance(data, Job) else cls(data)
+
+    def to_dict(self):
+        """Return a plain dict, e.g. for json.dump."""
+        return dict(self.items())
+
+    def copy(self):
+        """Return a shallow copy."""
+        new = Job.__new__(Job)
+        for field in JOB_FIELDS:
+            value = getattr(self, field, _MISSING)
+            if value is not _MISSING:
+                setattr(new, field, value)
+        new._extra = dict(self._extra) if self._extra else None
+        return new
+
+    # Mapping protocol
+
+    def __getitem__(self, key):
+        if key in _FIELD_SET:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                return value
+        elif self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in _FIELD_SET:
+            if key in INTERNED_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in _FIELD_SET:
+            if getattr(self, key, _MISSING) is _MISSING:
+                raise KeyError(key)
+            delattr(self, key)
+        elif self._extra and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        for field in JOB_FIELDS:
+            if getattr(self, field, _MISSING) is not _MISSING:
+                yield field
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    # Faster than the MutableMapping defaults, which go through KeyError
+
+    def __contains__(self, key):
+        if key in _FIELD_SET:
+            return getattr(self, key, _MISSING) is not _MISSING
+        return bool(self._extra) and key in self._extra
+
+    def get(self, key, default=None):
+        if key in _FIELD_SET:
+            value = getattr(self, key, _MISSING)
+            return default if value is _MISSING else value
+        if self._extra:
+            return self._extra.get(key, default)
+        return default
+
+    def __repr__(self):
+        return f"Job({self.to_dict()!r})"
+
+
+def jobs_to_dicts(jobs):
+    """Convert a list of Job records (or dicts) to plain dicts for JSON."""
+    return [job.to_dict() if isinstance(job, Job) else job for job in jobs]
@@ -0,0 +1,609 @@
+"""Embedded SQLite store for scraped and scored jobs.
+
+The scraper, scorer, Sheets push and dashboard read and write jobs here
+instead of rewriting/re-parsing .tmp/scored_jobs.json as a whole. Jobs are
+upserted by URL, and filtering/paging are indexed queries. The JSON files
+are still written as an export for compatibility.
+"""
+
+import hashlib
+import re
+import sqlite3
+from datetime import datetime, timezone
+
+from job_record import Job
+from persistence import dumps, load_json, loads, save_json
+from blob_store import DESCRIPTIONS_DB_PATH, BlobStore
+from scraper_utils import TMP_DIR
+
+JOB_DB_PATH = TMP_DIR / "jobs.db"
+LEGACY_SCORED_PATH = TMP_DIR / "scored_jobs.json"
+
+# Columns stored as-is; fit_breakdown is stored as JSON text
+COLUMNS = ["url", "title", "company", "location", "date_posted", "salary",
+           "salary_min", "salary_max", "description", "source", "scraped_at",
+           "fit_score", "fit_breakdown"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    url TEXT,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    date_posted TEXT,
+    salary TEXT,
+    salary_min INTEGER,
+    salary_max INTEGER,
+    description TEXT,
+    source TEXT,
+    scraped_at TEXT,
+    fit_score INTEGER,
+    fit_breakdown TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_fit_score ON jobs(fit_score);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source);
+CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at ON jobs(scraped_at);
+
+-- One row per scrape run, and the jobs it saw with their values and score
+-- at the time (see RUN_SNAPSHOT_COLUMNS; added to older databases on open)
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    created_at TEXT,
+    job_count INTEGER
+);
+CREATE TABLE IF NOT EXISTS run_snapshots (
+    run_id TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    PRIMARY KEY (run_id, job_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_run_snapshots_content ON run_snapshots(content_hash);
+-- SNAPSHOT_FIELDS, stored once per content hash (unchanged jobs share a
+-- row); the description is kept in the blob store, referenced by hash
+CREATE TABLE IF NOT EXISTS snapshot_contents (
+    content_hash TEXT PRIMARY KEY,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    salary TEXT,
+    description_hash TEXT
+);
+"""
+
+# Fields that make a job "changed" between runs (not scrape time, relative
+# posting dates like "3 days ago", or scores)
+SNAPSHOT_FIELDS = ("title", "company", "location", "salary", "description")
+# The snapshot fields stored as text in snapshot_contents
+CONTENT_FIELDS = ("title", "company", "location", "salary")
+
+# Per-run job fields stored in run_snapshots alongside the content hash
+RUN_SNAPSHOT_COLUMNS = {
+    "url": "TEXT",
+    "source": "TEXT",
+    "date_posted": "TEXT",
+    "salary_min": "INTEGER",
+    "salary_max": "INTEGER",
+    "scraped_at": "TEXT",
+    "fit_score": "INTEGER",
+}
+
+_RUN_JOBS_SQL = (
+    "SELECT s.content_hash AS snapshot_hash, c.content_hash AS stored_hash, "
+    + ", ".join(f"s.{column} AS snapshot_{column}" for column in RUN_SNAPSHOT_COLUMNS) + ", "
+    + ", ".join(f"c.{field} AS snapshot_{field}" for field in CONTENT_FIELDS) + ", "
+    "c.description_hash AS snapshot_description_hash, "
+    "jobs.* FROM run_snapshots s "
+    "LEFT JOIN snapshot_contents c ON c.content_hash = s.content_hash "
+    "LEFT JOIN jobs ON jobs.job_id = s.job_id "
+    "WHERE s.run_id = ? ORDER BY jobs.rowid"
+)
+
+# Full-text index over the jobs table, kept in sync by triggers so it is
+# maintained incrementally as jobs are upserted. It references jobs.rowid,
+# which is stable as long as the database is never VACUUMed (call
+# rebuild_search_index() if it is).
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, location, description,
+    content='jobs', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, title, company, location, description)
+    VALUES (new.rowid, new.title, new.company, new.location, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+    VALUES ('delete', old.rowid, old.title, old.company, old.location, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, company, location, description ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+    VALUES ('delete', old.rowid, old.title, old.company, old.location, old.description);
+    INSERT INTO jobs_fts(rowid, title, company, location, description)
+    VALUES (new.rowid, new.title, new.company, new.location, new.description);
+END;
+"""
+
+# bm25 column weights: title, company, location, description
+SEARCH_RANK = "bm25(jobs_fts, 10.0, 5.0, 2.0, 1.0)"
+
+_QUERY_TOKEN_RE = re.compile(r'"([^"]+)"|(\S+)')
+
+# Re-scraping an unchanged job must not wipe its score, so scores only
+# overwrite when set; a job whose content changed loses its stale score
+_CONTENT_CHANGED_SQL = " OR ".join(f"jobs.{field} IS NOT excluded.{field}" for field in SNAPSHOT_FIELDS)
+_UPSERT_SQL = (
+    f"INSERT INTO jobs (job_id, {', '.join(COLUMNS)}) "
+    f"VALUES ({', '.join('?' * (len(COLUMNS) + 1))}) "
+    "ON CONFLICT(job_id) DO UPDATE SET "
+    + ", ".join(f"{c} = excluded.{c}" for c in COLUMNS if c not in ("fit_score", "fit_breakdown"))
+    + "".join(
+        f", {c} = CASE WHEN excluded.{c} IS NOT NULL THEN excluded.{c} "
+        f"WHEN {_CONTENT_CHANGED_SQL} THEN NULL ELSE jobs.{c} END"
+        for c in ("fit_score", "fit_breakdown")
+    )
+)
+
+
+def job_key(job):
+    """Return the upsert key for a job: its URL, or title/company/location if it has none."""
+    url = (job.get("url") or "").strip()
+    if url:
+        return url
+    return "|".join((job.get("title", ""), job.get("company", ""), job.get("location", ""))).lower()
+
+
+def job_content_hash(job):
+    """Return a short hash of the fields compared between runs (SNAPSHOT_FIELDS)."""
+    content = "\x1f".join(str(job.get(field) or "") for field in SNAPSHOT_FIELDS)
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def compute_delta(old, new):
+    """Compare two run snapshots in linear time.
+
+    Args:
+        old: {job_id: content_hash} for the earlier run
+        new: {job_id: content_hash} for the later run
+
+    Returns:
+        dict: "added", "removed" and "changed" lists of job ids (added and
+        changed in the later run's order, removed in the earlier run's)
+    """
+    added = []
+    changed = []
+    for job_id, digest in new.items():
+        previous = old.get(job_id)
+        if previous is None:
+            added.append(job_id)
+        elif previous != digest:
+            changed.append(job_id)
+    removed = [job_id for job_id in old if job_id not in new]
+    return {"added": added, "removed": removed, "changed": changed}
+
+
+def build_search_query(text):
+    """Turn search box text into an FTS5 query.
+
+    Quoted text becomes a phrase query; every other word becomes a prefix
+    query, so "pyth lond" matches "Python developer, London". All terms must
+    match. Returns "" if the text has no searchable words.
+    """
+    terms = []
+    for phrase, word in _QUERY_TOKEN_RE.findall(text):
+        if phrase:
+            words = phrase.split()
+            if words:
+                terms.append('"' + " ".join(w.replace('"', "") for w in words) + '"')
+        else:
+            # Strip FTS5 syntax characters so user input can't break the query
+            word = re.sub(r"[^\w]+", " ", word).strip()
+            terms.extend(f'"{part}"*' for part in word.split())
+    return " ".join(terms)
+
+
+def _row_values(job):
+    """Return the INSERT parameters for a job."""
+    breakdown = job.get("fit_breakdown")
+    values = [job_key(job)]
+    for column in COLUMNS:
+        if column == "fit_breakdown":
+            values.append(dumps(breakdown).decode("utf-8") if breakdown is not None else None)
+        else:
+            values.append(job.get(column))
+    return values
+
+
+def _row_to_job(row):
+    """Convert a jobs row (sqlite3.Row) to a Job record."""
+    job = Job()
+    for column in COLUMNS:
+        value = row[column]
+        if value is None and column in ("fit_score", "fit_breakdown"):
+            continue  # Not scored yet: leave the field absent, like an unscored dict
+        if column == "fit_breakdown":
+            value = loads(value)
+        job[column] = value
+    return job
+
+
+def _snapshot_to_job(row, texts):
+    """Convert a run snapshot row (see _RUN_JOBS_SQL) to a Job record with the run's values.
+
+    Args:
+        row: sqlite3.Row from _RUN_JOBS_SQL
+        texts: {description hash: text} holding the row's description
+    """
+    job = Job()
+    for column in COLUMNS:
+        if column == "fit_breakdown":
+            continue
+        if column == "description":
+            value = texts.get(row["snapshot_description_hash"], "")
+        else:
+            value = row[f"snapshot_{column}"]
+        if value is None and column == "fit_score":
+            continue
+        job[column] = value
+    return job
+
+
+class JobStore:
+    """SQLite-backed job store (WAL mode) with upsert-by-URL semantics."""
+
+    def __init__(self, path=JOB_DB_PATH, blobs_path=None):
+        self.path = path
+        # Run snapshot descriptions live in the description blob store next to the database
+        self.blobs_path = blobs_path or path.with_name(DESCRIPTIONS_DB_PATH.name)
+        self.path.parent.mkdir(exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._add_snapshot_columns()
+        self._move_snapshot_descriptions()
+        self.has_fts = self._init_search_index()
+
+    def _add_snapshot_columns(self):
+        """Add RUN_SNAPSHOT_COLUMNS to a run_snapshots table created before they existed."""
+        existing = {row["name"] for row in self.conn.execute("PRAGMA table_info(run_snapshots)")}
+        with self.conn:
+            for column, column_type in RUN_SNAPSHOT_COLUMNS.items():
+                if column not in existing:
+                    self.conn.execute(f"ALTER TABLE run_snapshots ADD COLUMN {column} {column_type}")
+
+    def _move_snapshot_descriptions(self):
+        """Move description text stored in snapshot_contents by older versions into the blob store."""
+        existing = {row["name"] for row in self.conn.execute("PRAGMA table_info(snapshot_contents)")}
+        if "description" not in existing:
+            return
+        with self.conn:
+            if "description_hash" not in existing:
+                self.conn.execute("ALTER TABLE snapshot_contents ADD COLUMN description_hash TEXT")
+            rows = self.conn.execute(
+                "SELECT content_hash, description FROM snapshot_contents WHERE description IS NOT NULL"
+            ).fetchall()
+            if rows:
+                with BlobStore(self.blobs_path) as blobs:
+                    hashes = blobs.put_many([row["description"] for row in rows])
+                self.conn.executemany(
+                    "UPDATE snapshot_contents SET description_hash = ?, description = NULL WHERE content_hash = ?",
+                    [(digest, row["content_hash"]) for row, digest in zip(rows, hashes)],
+                )
+
+    def _init_search_index(self):
+        """Create the FTS5 index if SQLite supports it. Returns True if available."""
+        existed = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'"
+        ).fetchone()
+        try:
+            self.conn.executescript(FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            return False  # SQLite built without FTS5: search falls back to LIKE
+        if not existed:
+            # Index jobs stored before the index existed
+            self.rebuild_search_index()
+        return True
+
+    def rebuild_search_index(self):
+        """Rebuild the full-text index from the jobs table."""
+        with self.conn:
+            self.conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def upsert_jobs(self, jobs):
+        """Insert or update jobs by URL. Returns the number of jobs written."""
+        rows = [_row_values(job) for job in jobs]
+        with self.conn:
+            self.conn.executemany(_UPSERT_SQL, rows)
+        return len(rows)
+
+    def _filter_sql(self, min_score=0, include_zero=False, min_salary=0, search="", delta=None):
+        """Build the FROM/WHERE SQL and parameters for the dashboard filters.
+
+        Returns:
+            tuple: (from_where_sql, params, ranked) where ranked is True if
+            the query joins the full-text index and can order by relevance
+        """
+        clauses = []
+        params = []
+        source = "jobs"
+        ranked = False
+        # Plain fit_score comparisons (not COALESCE) so the index is usable;
+        # unscored (NULL) jobs count as 0
+        if min_score:
+            if include_zero:
+                clauses.append("(jobs.fit_score >= ? OR jobs.fit_score = 0 OR jobs.fit_score IS NULL)")
+            else:
+                clauses.append("jobs.fit_score >= ?")
+            params.append(min_score)
+        if min_salary:
+            clauses.append("jobs.salary_max >= ?")
+            params.append(min_salary)
+        if delta:
+            # Jobs added or changed in delta[1] compared with delta[0]
+            clauses.append(
+                "jobs.job_id IN (SELECT n.job_id FROM run_snapshots n "
+                "LEFT JOIN run_snapshots o ON o.run_id = ? AND o.job_id = n.job_id "
+                "WHERE n.run_id = ? AND (o.job_id IS NULL OR o.content_hash != n.content_hash))"
+            )
+            params.extend(delta)
+        if search and self.has_fts:
+            fts_query = build_search_query(search)
+            if fts_query:
+                source = "jobs JOIN jobs_fts ON jobs_fts.rowid = jobs.rowid"
+                clauses.append("jobs_fts MATCH ?")
+                params.append(fts_query)
+                ranked = True
+        elif search:
+            pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            clauses.append("(jobs.title LIKE ? ESCAPE '\\' OR jobs.company LIKE ? ESCAPE '\\')")
+            params.extend([pattern, pattern])
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return source + where, params, ranked
+
+    def query_jobs(self, min_score=0, include_zero=False, min_salary=0, search="",
+                   delta=None, limit=None, offset=0):
+        """Return filtered jobs as Job records.
+
+        Results are ordered by search relevance when a search is given,
+        otherwise best fit first.
+
+        Args:
+            min_score: Minimum fit_score (unscored jobs count as 0)
+            include_zero: Also include jobs scoring exactly 0
+            min_salary: Minimum annual salary_max (0 = any, including unlisted)
+            search: Search box text: words are prefix-matched against title,
+                company, location and description; "quoted text" is a phrase
+            delta: (old_run_id, new_run_id) to only return jobs added or
+                changed between those runs
+            limit: Page size, or None for all matching jobs
+            offset: Number of matching jobs to skip
+        """
+        from_where, params, ranked = self._filter_sql(min_score, include_zero, min_salary, search, delta)
+        order = f"{SEARCH_RANK}, jobs.fit_score DESC" if ranked else "jobs.fit_score DESC, jobs.rowid"
+        sql = f"SELECT jobs.* FROM {from_where} ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+        return [_row_to_job(row) for row in self.conn.execute(sql, params)]
+
+    def search_ids(self, search, limit=None, **filters):
+        """Return job ids matching a search, most relevant first."""
+        from_where, params, ranked = self._filter_sql(search=search, **filters)
+        order = f"{SEARCH_RANK}, jobs.fit_score DESC" if ranked else "jobs.fit_score DESC, jobs.rowid"
+        sql = f"SELECT jobs.job_id FROM {from_where} ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [row[0] for row in self.conn.execute(sql, params)]
+
+    def count_jobs(self, min_score=0, include_zero=False, min_salary=0, search="", delta=None):
+        """Return the number of jobs matching the filters."""
+        from_where, params, _ = self._filter_sql(min_score, include_zero, min_salary, search, delta)
+        return self.conn.execute(f"SELECT COUNT(*) FROM {from_where}", params).fetchone()[0]
+
+    def get_jobs(self, job_ids):
+        """Return the stored jobs with the given ids as Job records, in the given order."""
+        found = {}
+        job_ids = list(job_ids)
+        for start in range(0, len(job_ids), 900):
+            chunk = job_ids[start:start + 900]
+            sql = f"SELECT * FROM jobs WHERE job_id IN ({','.join('?' * len(chunk))})"
+            for row in self.conn.execute(sql, chunk):
+                found[row["job_id"]] = _row_to_job(row)
+        return [found[job_id] for job_id in job_ids if job_id in found]
+
+    # Run snapshots
+
+    def record_run(self, run_id, jobs):
+        """Store a snapshot of the jobs seen by a scrape run. Returns the job count.
+
+        Each job's fields and fit_score are stored as they are now, so later
+        re-scrapes and re-scoring don't change what the run recorded. Jobs
+        are keyed like the jobs table (job_key), so a job scraped twice in
+        one run is counted once.
+        """
+        snapshot = {job_key(job): job for job in jobs}
+        rows = []
+        contents = {}
+        for job_id, job in snapshot.items():
+            digest = job_content_hash(job)
+            contents[digest] = job
+            rows.append([run_id, job_id, digest] + [job.get(column) for column in RUN_SNAPSHOT_COLUMNS])
+
+        # Only new contents add a description reference to the blob store
+        stored = set()
+        digests = list(contents)
+        for start in range(0, len(digests), 900):
+            chunk = digests[start:start + 900]
+            stored.update(row[0] for row in self.conn.execute(
+                f"SELECT content_hash FROM snapshot_contents WHERE content_hash IN ({','.join('?' * len(chunk))})",
+                chunk))
+        new = [digest for digest in digests if digest not in stored]
+        described = [digest for digest in new if contents[digest].get("description")]
+        with BlobStore(self.blobs_path) as blobs:
+            description_hashes = dict(zip(described, blobs.put_many(
+                [contents[digest]["description"] for digest in described])))
+        content_rows = [[digest] + [contents[digest].get(field) for field in CONTENT_FIELDS]
+                        + [description_hashes.get(digest)] for digest in new]
+
+        columns = ", ".join(RUN_SNAPSHOT_COLUMNS)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO runs (run_id, created_at, job_count) VALUES (?, ?, ?)",
+                (run_id, datetime.now(timezone.utc).isoformat(timespec="seconds"), len(rows)),
+            )
+            self.conn.execute("DELETE FROM run_snapshots WHERE run_id = ?", (run_id,))
+            self.conn.executemany(
+                f"INSERT OR IGNORE INTO snapshot_contents (content_hash, {', '.join(CONTENT_FIELDS)}, "
+                f"description_hash) VALUES ({', '.join('?' * (len(CONTENT_FIELDS) + 2))})",
+                content_rows,
+            )
+            self.conn.executemany(
+                f"INSERT INTO run_snapshots (run_id, job_id, content_hash, {columns}) "
+                f"VALUES ({', '.join('?' * (len(RUN_SNAPSHOT_COLUMNS) + 3))})",
+                rows,
+            )
+        return len(rows)
+
+    def prune_runs(self, keep_runs):
+        """Delete all but the newest keep_runs recorded runs. Returns the deleted run ids.
+
+        Snapshot contents no remaining run refers to are deleted too, and
+        their descriptions released from the blob store (see raw_log.prune_runs).
+        """
+        old = [row[0] for row in self.conn.execute(
+            "SELECT run_id FROM runs ORDER BY run_id DESC LIMIT -1 OFFSET ?", (max(keep_runs, 0),))]
+        if not old:
+            return []
+        orphaned = ("FROM snapshot_contents WHERE content_hash NOT IN "
+                    "(SELECT content_hash FROM run_snapshots)")
+        with self.conn:
+            for start in range(0, len(old), 900):
+                chunk = old[start:start + 900]
+                placeholders = ",".join("?" * len(chunk))
+                self.conn.execute(f"DELETE FROM run_snapshots WHERE run_id IN ({placeholders})", chunk)
+                self.conn.execute(f"DELETE FROM runs WHERE run_id IN ({placeholders})", chunk)
+            released = [row[0] for row in self.conn.execute(f"SELECT description_hash {orphaned}")
+                        if row[0]]
+            self.conn.execute(f"DELETE {orphaned}")
+        if released:
+            with BlobStore(self.blobs_path) as blobs:
+                blobs.release(released)
+                blobs.gc()
+        return old
+
+    def list_runs(self, limit=None):
+        """Return recorded runs, newest first, as dicts (run_id, created_at, job_count)."""
+        sql = "SELECT run_id, created_at, job_count FROM runs ORDER BY run_id DESC"
+        params = []
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def run_hashes(self, run_id):
+        """Return {job_id: content_hash} for one run's snapshot."""
+        return dict(self.conn.execute(
+            "SELECT job_id, content_hash FROM run_snapshots WHERE run_id = ?", (run_id,)))
+
+    def run_delta(self, old_run_id, new_run_id):
+        """Return added/removed/changed job ids between two runs (see compute_delta)."""
+        return compute_delta(self.run_hashes(old_run_id), self.run_hashes(new_run_id))
+
+    def iter_run_jobs(self, run_id):
+        """Yield (Job, content_hash) for every job in a run's snapshot.
+
+        Job fields and fit_score are the values recorded with the run. Runs
+        recorded before snapshots stored them fall back to the job's
+        current (latest) values.
+        """
+        texts = {}
+        with BlobStore(self.blobs_path) as blobs:
+            cursor = self.conn.execute(_RUN_JOBS_SQL, (run_id,))
+            while True:
+                rows = cursor.fetchmany(500)
+                if not rows:
+                    break
+                missing = {row["snapshot_description_hash"] for row in rows
+                           if row["snapshot_description_hash"] and row["snapshot_description_hash"] not in texts}
+                if missing:
+                    texts.update(blobs.get_many(missing))
+                for row in rows:
+                    if row["stored_hash"] is not None:
+                        yield _snapshot_to_job(row, texts), row["snapshot_hash"]
+                    elif row["job_id"] is not None:
+                        yield _row_to_job(row), row["snapshot_hash"]
+
+    def latest_run_jobs(self):
+        """Return the jobs of the most recent recorded run with their stored values, or []."""
+        runs = self.list_runs(limit=1)
+        if not runs:
+            return []
+        return self.get_jobs(self.run_hashes(runs[0]["run_id"]))
+
+    def stored_versions(self, jobs):
+        """Return the stored record (with its score) for each job, or the job itself if not stored."""
+        jobs = list(jobs)
+        stored = {job_key(job): job for job in self.get_jobs({job_key(job) for job in jobs})}
+        return [stored.get(job_key(job), job) for job in jobs]
+
+    def latest_delta(self):
+        """Return (old_run_id, new_run_id, delta) for the last two runs, or None if fewer exist."""
+        runs = self.list_runs(limit=2)
+        if len(runs) < 2:
+            return None
+        new_run_id, old_run_id = runs[0]["run_id"], runs[1]["run_id"]
+        return old_run_id, new_run_id, self.run_delta(old_run_id, new_run_id)
+
+    def iter_jobs(self):
+        """Yield every stored job as a Job record, best fit first."""
+        for row in self.conn.execute("SELECT * FROM jobs ORDER BY fit_score DESC, rowid"):
+            yield _row_to_job(row)
+
+    def stats(self):
+        """Return summary counts for the dashboard stat rows."""
+        row = self.conn.execute(
+            "SELECT COUNT(*) AS total, "
+            "SUM(COALESCE(fit_score, 0) > 0) AS matching, "
+            "SUM(COALESCE(fit_score, 0) >= 70) AS high_fit, "
+            "MAX(COALESCE(fit_score, 0)) AS top_score, "
+            "AVG(COALESCE(fit_score, 0)) AS avg_score FROM jobs"
+        ).fetchone()
+        return {
+            "total": row["total"],
+            "matching": row["matching"] or 0,
+            "high_fit": row["high_fit"] or 0,
+            "top_score": row["top_score"],
+            "avg_score": row["avg_score"],
+        }
+
+    def export_json(self, path=LEGACY_SCORED_PATH):
+        """Write every job to a JSON file (the legacy scored_jobs.json format)."""
+        jobs = [job.to_dict() for job in self.iter_jobs()]
+        save_json(path, jobs, pretty=True)
+        return path
+
+    def import_json(self, path=LEGACY_SCORED_PATH):
+        """Upsert every job from a JSON export. Returns the number imported."""
+        return self.upsert_jobs(load_json(path, default=[]))
+
+
+def open_job_store(path=JOB_DB_PATH):
+    """Open the job store, importing a legacy scored_jobs.json if the store is new."""
+    store = JobStore(path)
+    if LEGACY_SCORED_PATH.exists() and not store.conn.execute("SELECT 1 FROM jobs LIMIT 1").fetchone():
+        store.import_json(LEGACY_SCORED_PATH)
+    return store
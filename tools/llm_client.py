@@ -0,0 +1,89 @@
+"""Shared Anthropic client for every LLM call in the app and the API.
+
+Building an anthropic.Anthropic client per call opens a fresh connection
+pool each time, so every request paid for a new TCP + TLS handshake.
+get_client() creates one client per (API key, base URL) on first use and
+returns it from then on, keeping its HTTP keep-alive connections warm
+across requests and Streamlit reruns. The client is safe to share between
+threads.
+
+Settings can be overridden through the environment:
+    ANTHROPIC_BASE_URL     API endpoint (e.g. a local stub server for testing)
+    LLM_TIMEOUT_SECONDS    read timeout per request (default 60)
+    LLM_MAX_RETRIES        retries on connection errors, 429 and 5xx (default 2)
+"""
+
+import importlib
+import os
+import threading
+
+CONNECT_TIMEOUT_SECONDS = 5.0
+DEFAULT_TIMEOUT_SECONDS = 60.0
+DEFAULT_MAX_RETRIES = 2
+# Keep enough idle connections for the API's worker threads
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+KEEPALIVE_EXPIRY_SECONDS = 120.0
+
+_clients = {}  # (api_key, base_url) -> anthropic.Anthropic
+_lock = threading.Lock()
+
+
+def _sdk_limits_class(anthropic):
+    """Return the Limits type of the HTTP library the SDK is built on.
+
+    Older SDKs use httpx, newer ones httpx2, and each rejects the other's
+    config objects, so it is taken from the SDK's own client class rather
+    than imported directly.
+    """
+    http_module = importlib.import_module(anthropic.DefaultHttpxClient.__mro__[1].__module__.partition(".")[0])
+    return http_module.Limits
+
+
+def _build_client(api_key, base_url):
+    import anthropic
+
+    timeout = anthropic.Timeout(float(os.getenv("LLM_TIMEOUT_SECONDS", DEFAULT_TIMEOUT_SECONDS)),
+                                connect=CONNECT_TIMEOUT_SECONDS)
+    limits = _sdk_limits_class(anthropic)(max_connections=MAX_CONNECTIONS,
+                                          max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                                          keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS)
+    # DefaultHttpxClient keeps the SDK's own defaults (redirects, proxies)
+    return anthropic.Anthropic(
+        api_key=api_key,
+        base_url=base_url,
+        timeout=timeout,
+        max_retries=int(os.getenv("LLM_MAX_RETRIES", DEFAULT_MAX_RETRIES)),
+        http_client=anthropic.DefaultHttpxClient(timeout=timeout, limits=limits),
+    )
+
+
+def get_client(api_key=None, base_url=None):
+    """Return the shared Anthropic client for an API key, creating it on first use.
+
+    Args:
+        api_key: Anthropic API key (default: ANTHROPIC_API_KEY)
+        base_url: API endpoint (default: ANTHROPIC_BASE_URL, else the SDK default)
+
+    Returns:
+        anthropic.Anthropic
+    """
+    api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+    base_url = base_url or os.getenv("ANTHROPIC_BASE_URL") or None
+    key = (api_key, base_url)
+    client = _clients.get(key)
+    if client is None:
+        with _lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = _build_client(api_key, base_url)
+    return client
+
+
+def close_clients():
+    """Close every shared client's connection pool (e.g. on shutdown or key change)."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
@@ -0,0 +1,124 @@
+"""Shared JSON/YAML load and save helpers.
+
+Picks the fastest installed backend once at import time: orjson, then
+msgspec, then the stdlib json module for JSON; LibYAML's CSafeLoader/CDumper
+for YAML when PyYAML was built with it. Machine-only files (session state,
+caches, history) are written compact; files people read or edit (YAML
+config, JSON exports) stay indented.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if orjson is not None:
+    JSON_BACKEND = "orjson"
+elif msgspec is not None:
+    JSON_BACKEND = "msgspec"
+    _msgspec_encoder = msgspec.json.Encoder()
+    _msgspec_decoder = msgspec.json.Decoder()
+else:
+    JSON_BACKEND = "json"
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+YAML_BACKEND = "libyaml" if YAML_LOADER is not yaml.SafeLoader else "pure-python"
+
+
+def _stdlib_dumps(obj, pretty):
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps(obj, pretty=False):
+    """Serialize obj to UTF-8 JSON bytes.
+
+    Falls back to the stdlib encoder for anything the fast backend rejects
+    (e.g. integers over 64 bits), so it accepts exactly what json.dumps does
+    and raises the same TypeError/ValueError when an object can't be encoded.
+
+    Args:
+        obj: JSON-serializable object
+        pretty: Indent by 2 spaces (for files people read)
+    """
+    try:
+        if JSON_BACKEND == "orjson":
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            return orjson.dumps(obj, option=option)
+        if JSON_BACKEND == "msgspec":
+            data = _msgspec_encoder.encode(obj)
+            return msgspec.json.format(data, indent=2) if pretty else data
+    except Exception:
+        pass
+    return _stdlib_dumps(obj, pretty)
+
+
+def loads(data):
+    """Parse JSON from str or bytes.
+
+    Anything the fast backend rejects is re-parsed by the stdlib, which
+    either accepts it (e.g. NaN literals) or raises json.JSONDecodeError.
+    """
+    try:
+        if JSON_BACKEND == "orjson":
+            return orjson.loads(data)
+        if JSON_BACKEND == "msgspec":
+            return _msgspec_decoder.decode(data)
+    except Exception:
+        pass
+    return json.loads(data)
+
+
+def _write_atomic(path, data):
+    """Write bytes via a temp file + rename so readers never see a partial file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def load_json(path, default=None):
+    """Load a JSON file, returning default if it doesn't exist."""
+    path = Path(path)
+    if not path.exists():
+        return default
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def save_json(path, obj, pretty=False):
+    """Save obj as JSON (compact unless pretty), creating parent directories."""
+    _write_atomic(path, dumps(obj, pretty=pretty))
+
+
+def load_yaml(path, default=None):
+    """Load a YAML file with the safe loader, returning default if it doesn't exist.
+
+    An empty file loads as None, same as yaml.safe_load.
+    """
+    path = Path(path)
+    if not path.exists():
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
+def save_yaml(path, data):
+    """Save data as block-style YAML (same layout as yaml.dump with default_flow_style=False)."""
+    text = yaml.dump(data, Dumper=YAML_DUMPER, default_flow_style=False, allow_unicode=True)
+    _write_atomic(path, text.encode("utf-8"))
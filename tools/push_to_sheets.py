@@ -12,7 +12,7 @@ First-time setup:
 5. Run this script once - it will open a browser for login
 """
 
-import json
+import argparse
 import sys
 from pathlib import Path
 
@@ -21,7 +21,9 @@ from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
-from scraper_utils import TMP_DIR, load_config
+from job_store import open_job_store
+from raw_log import iter_legacy_raw_jobs, iter_raw_jobs
+from scraper_utils import load_config
 
 PROJECT_ROOT = Path(__file__).parent.parent
 CREDENTIALS_PATH = PROJECT_ROOT / "credentials.json"
@@ -31,8 +33,10 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive",
 ]
 
+# New columns are appended at the end so existing sheet rows stay aligned
 HEADERS = ["title", "company", "location", "url", "date_posted",
-           "salary", "description", "source", "scraped_at", "fit_score"]
+           "salary", "description", "source", "scraped_at", "fit_score",
+           "salary_min", "salary_max"]
 
 
 def get_google_creds():
@@ -61,8 +65,15 @@ def get_google_creds():
     return creds
 
 
-def push_jobs(jobs, config=None):
-    """Push job list to Google Sheets, deduplicating by URL."""
+def push_jobs(jobs, config=None, update_existing=False):
+    """Push job list (Job records or dicts) to Google Sheets, deduplicating by URL.
+
+    Args:
+        jobs: Jobs to push
+        config: Job search config (loaded if omitted)
+        update_existing: Overwrite the rows of jobs whose URL is already in the
+            sheet (used when pushing a run's changed jobs) instead of skipping them
+    """
     if config is None:
         config = load_config()
 
@@ -95,20 +106,32 @@ def push_jobs(jobs, config=None):
         first_row = existing_data[0]
         if "url" in first_row:
             url_col_idx = first_row.index("url")
-            existing_urls = {row[url_col_idx] for row in existing_data[1:] if len(row) > url_col_idx}
+            # Sheet row number (1-based, header is row 1) of each URL
+            existing_urls = {row[url_col_idx]: number for number, row in enumerate(existing_data[1:], start=2)
+                             if len(row) > url_col_idx}
             # Update headers if they've changed (e.g., added fit_score)
             if first_row != HEADERS:
                 worksheet.update(values=[HEADERS], range_name="A1")
         else:
             worksheet.insert_row(HEADERS, 1)
-            existing_urls = set()
+            existing_urls = {}
     else:
         worksheet.append_row(HEADERS)
-        existing_urls = set()
+        existing_urls = {}
 
     # Filter out duplicates and prepare rows
     new_jobs = [job for job in jobs if job.get("url") not in existing_urls]
 
+    if update_existing:
+        updates = [
+            {"range": f"A{existing_urls[job['url']]}",
+             "values": [["" if job.get(h) is None else job.get(h) for h in HEADERS]]}
+            for job in jobs if job.get("url") in existing_urls
+        ]
+        if updates:
+            worksheet.batch_update(updates)
+            print(f"Updated {len(updates)} changed jobs in '{spreadsheet_name}' / '{worksheet_name}'")
+
     if not new_jobs:
         print("No new jobs to add (all duplicates).")
         return
@@ -117,29 +140,50 @@ def push_jobs(jobs, config=None):
     new_jobs.sort(key=lambda x: x.get("fit_score", 0), reverse=True)
 
     # Append rows
-    rows = [[job.get(h, "") for h in HEADERS] for job in new_jobs]
+    rows = [["" if job.get(h) is None else job.get(h) for h in HEADERS] for job in new_jobs]
     worksheet.append_rows(rows)
 
     print(f"Added {len(new_jobs)} new jobs to '{spreadsheet_name}' / '{worksheet_name}'")
-    print(f"Skipped {len(jobs) - len(new_jobs)} duplicates")
+    if not update_existing:
+        print(f"Skipped {len(jobs) - len(new_jobs)} duplicates")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Push scraped jobs to Google Sheets")
+    parser.add_argument("--delta", action="store_true",
+                        help="Only push jobs added or changed in the latest scrape run")
+    parser.add_argument("--all", action="store_true",
+                        help="Push every job in the job store, not just the latest scrape")
+    args = parser.parse_args()
+
     # Load most recent scraped data from .tmp/
     config = load_config()
-    all_jobs = []
-
-    # Prefer scored_jobs.json if it exists (has fit_score)
-    scored_path = TMP_DIR / "scored_jobs.json"
-    if scored_path.exists():
-        with open(scored_path, "r", encoding="utf-8") as f:
-            all_jobs = json.load(f)
-        print(f"Loaded {len(all_jobs)} scored jobs from scored_jobs.json")
-    else:
-        # Fall back to raw files
-        for json_file in TMP_DIR.glob("*_raw.json"):
-            with open(json_file, "r", encoding="utf-8") as f:
-                all_jobs.extend(json.load(f))
+
+    if args.delta:
+        with open_job_store() as store:
+            latest = store.latest_delta()
+            if latest is None:
+                print("Need at least two recorded scrape runs for --delta.")
+                sys.exit(1)
+            old_run, new_run, delta = latest
+            delta_jobs = store.get_jobs(delta["added"] + delta["changed"])
+        print(f"Run {new_run} vs {old_run}: {len(delta['added'])} added, "
+              f"{len(delta['changed'])} changed, {len(delta['removed'])} removed")
+        push_jobs(delta_jobs, config, update_existing=True)
+        sys.exit(0)
+
+    # The job store has fit_score (and imports a legacy scored_jobs.json on first use)
+    with open_job_store() as store:
+        if args.all:
+            all_jobs = list(store.iter_jobs())
+            print(f"Loaded {len(all_jobs)} jobs from the job store")
+        else:
+            # The latest scrape: the newest run's raw segments, else the latest
+            # recorded run, else legacy raw files; scores come from the store
+            latest = list(iter_raw_jobs(latest=True))
+            all_jobs = store.stored_versions(latest) if latest else store.latest_run_jobs()
+            if not all_jobs:
+                all_jobs = store.stored_versions(iter_legacy_raw_jobs())
 
     if not all_jobs:
         print("No scraped data found in .tmp/ directory. Run a scraper first.")
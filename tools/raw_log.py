@@ -0,0 +1,192 @@
+"""Append-only JSON Lines storage for raw scrape output.
+
+Each scrape run writes one segment per site (.tmp/raw/<site>/<run_id>.jsonl,
+optionally gzip-compressed) and records it in a small manifest. Segments are
+never rewritten, so ingest cost is O(new records), and readers stream jobs
+one line at a time instead of loading whole files.
+
+Descriptions are stored once each in the blob store (see blob_store.py);
+segment lines carry a description_hash instead of the text, and readers
+resolve it, sharing one string per distinct description.
+"""
+
+import gzip
+import secrets
+from datetime import datetime, timezone
+
+from blob_store import BlobStore
+from job_record import Job
+from persistence import dumps, load_json, loads, save_json
+from scraper_utils import TMP_DIR
+
+RAW_DIR = TMP_DIR / "raw"
+MANIFEST_PATH = RAW_DIR / "manifest.json"
+
+# Lines resolved per blob store query when reading a segment
+_READ_BATCH = 500
+
+
+def new_run_id():
+    """Return a sortable, unique id for a scrape run (UTC timestamp + suffix)."""
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ") + "-" + secrets.token_hex(2)
+
+
+def load_manifest():
+    """Load the segment manifest (a list of segment entries, oldest first)."""
+    return load_json(MANIFEST_PATH, default={}).get("segments", [])
+
+
+def _save_manifest(segments):
+    """Atomically replace the manifest so readers never see a partial file."""
+    save_json(MANIFEST_PATH, {"segments": segments})
+
+
+def _open_segment(path, mode):
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "b")
+    return open(path, mode + "b")
+
+
+def append_segment(jobs, site, run_id=None, compress=False):
+    """Write one run's jobs for a site as a new JSONL segment.
+
+    Args:
+        jobs: Iterable of Job records or dicts
+        site: Site name, e.g. "google_jobs"
+        run_id: Scrape run id (see new_run_id); generated if omitted
+        compress: Write a gzip-compressed segment
+
+    Returns:
+        dict: The manifest entry for the new segment
+    """
+    run_id = run_id or new_run_id()
+    site_dir = RAW_DIR / site
+    site_dir.mkdir(parents=True, exist_ok=True)
+    path = site_dir / (f"{run_id}.jsonl.gz" if compress else f"{run_id}.jsonl")
+
+    records = [job.to_dict() if isinstance(job, Job) else dict(job) for job in jobs]
+    described = [record for record in records if record.get("description")]
+    with BlobStore() as blobs:
+        hashes = blobs.put_many([record["description"] for record in described])
+    for record, digest in zip(described, hashes):
+        del record["description"]
+        record["description_hash"] = digest
+
+    with _open_segment(path, "w") as f:
+        for record in records:
+            f.write(dumps(record) + b"\n")
+    count = len(records)
+
+    entry = {
+        "site": site,
+        "run_id": run_id,
+        "path": path.relative_to(RAW_DIR).as_posix(),
+        "count": count,
+        "compressed": compress,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    segments = load_manifest()
+    segments.append(entry)
+    _save_manifest(segments)
+    return entry
+
+
+def select_segments(site=None, run_id=None, latest=False):
+    """Return manifest entries filtered by site/run, oldest first.
+
+    Args:
+        site: Only segments for this site
+        run_id: Only segments from this run
+        latest: Only the segments of the newest run (by run_id), so sites
+            missing from that run don't bring back older runs' jobs
+    """
+    segments = [
+        seg for seg in load_manifest()
+        if (site is None or seg["site"] == site) and (run_id is None or seg["run_id"] == run_id)
+    ]
+    if latest and segments:
+        newest_run = max(seg["run_id"] for seg in segments)
+        segments = [seg for seg in segments if seg["run_id"] == newest_run]
+    return segments
+
+
+def _iter_records(entry):
+    path = RAW_DIR / entry["path"]
+    if not path.exists():
+        return
+    with _open_segment(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def _resolve_batch(records, blobs, texts):
+    """Turn a batch of segment records into Job records with full descriptions."""
+    missing = {record["description_hash"] for record in records
+               if "description_hash" in record and record["description_hash"] not in texts}
+    if missing:
+        texts.update(blobs.get_many(missing))
+    for record in records:
+        digest = record.pop("description_hash", None)
+        if digest is not None:
+            record["description"] = texts.get(digest, "")
+        yield Job(record)
+
+
+def iter_segment(entry, texts=None):
+    """Yield the jobs in one segment as Job records, streaming in small batches.
+
+    Args:
+        entry: Manifest entry (see select_segments)
+        texts: Optional {hash: description} cache shared across segments, so
+            repeated descriptions resolve to the same string object
+    """
+    texts = {} if texts is None else texts
+    with BlobStore() as blobs:
+        batch = []
+        for record in _iter_records(entry):
+            batch.append(record)
+            if len(batch) >= _READ_BATCH:
+                yield from _resolve_batch(batch, blobs, texts)
+                batch = []
+        yield from _resolve_batch(batch, blobs, texts)
+
+
+def iter_raw_jobs(site=None, run_id=None, latest=False):
+    """Stream raw jobs from the selected segments (see select_segments)."""
+    texts = {}
+    for entry in select_segments(site=site, run_id=run_id, latest=latest):
+        yield from iter_segment(entry, texts)
+
+
+def delete_segments(entries):
+    """Delete segments, release their descriptions and drop unreferenced blobs.
+
+    Returns:
+        int: Number of unreferenced descriptions removed from the blob store
+    """
+    doomed = {entry["path"] for entry in entries}
+    with BlobStore() as blobs:
+        for entry in entries:
+            blobs.release([record["description_hash"] for record in _iter_records(entry)
+                           if "description_hash" in record])
+            (RAW_DIR / entry["path"]).unlink(missing_ok=True)
+        _save_manifest([seg for seg in load_manifest() if seg["path"] not in doomed])
+        return blobs.gc()
+
+
+def prune_runs(keep_runs):
+    """Keep only the newest keep_runs runs' segments. Returns the deleted manifest entries."""
+    run_ids = sorted({seg["run_id"] for seg in load_manifest()})
+    old = set(run_ids[:-keep_runs]) if keep_runs > 0 else set(run_ids)
+    entries = [seg for seg in load_manifest() if seg["run_id"] in old]
+    if entries:
+        delete_segments(entries)
+    return entries
+
+
+def iter_legacy_raw_jobs():
+    """Yield jobs from pre-segment .tmp/*_raw.json files, if any remain."""
+    for json_file in TMP_DIR.glob("*_raw.json"):
+        for job in load_json(json_file, default=[]):
+            yield Job.from_dict(job)
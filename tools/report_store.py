@@ -0,0 +1,143 @@
+"""Keyed store for AI company research reports.
+
+Reports live in a company_reports table in .tmp/jobs.db, one row per
+normalized company name, so a lookup or save touches a single row instead
+of parsing and rewriting .tmp/company_reports.json. Reports older than the
+TTL read as missing, so the dashboard offers to research the company again.
+"""
+
+import re
+import sqlite3
+import time
+
+from job_store import JOB_DB_PATH
+from persistence import load_json
+from scraper_utils import TMP_DIR
+
+LEGACY_REPORTS_PATH = TMP_DIR / "company_reports.json"
+DEFAULT_TTL_DAYS = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS company_reports (
+    company_key TEXT PRIMARY KEY,
+    company TEXT,
+    report TEXT,
+    created_at REAL
+);
+"""
+
+# Legal-form suffixes dropped from company keys ("Acme Ltd" == "ACME Limited").
+# Only legal entity types: words like "group" or "company" can tell two
+# employers apart ("Acme Group" is not "Acme")
+_COMPANY_SUFFIXES = {
+    "ltd", "limited", "inc", "incorporated", "llc", "llp", "lp", "plc", "corp",
+    "corporation", "gmbh", "ag", "kg", "sa", "sarl", "srl", "bv", "nv", "pty", "pte",
+}
+
+
+def company_key(name):
+    """Normalize a company name for lookup: case, punctuation and legal suffix insensitive."""
+    words = re.sub(r"[^\w\s&]", " ", (name or "").casefold()).split()
+    while len(words) > 1 and words[-1] in _COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+class ReportStore:
+    """SQLite-backed company report store with per-company get/put and a TTL.
+
+    Args:
+        path: SQLite database file (shared with the job store by default)
+        ttl_days: Reports older than this read as missing (None or 0 = never expire)
+    """
+
+    def __init__(self, path=JOB_DB_PATH, ttl_days=DEFAULT_TTL_DAYS):
+        self.path = path
+        self.ttl_days = ttl_days
+        self.path.parent.mkdir(exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._rekey()
+
+    def _rekey(self):
+        """Update rows whose key was made with different suffix rules (keys derive from company)."""
+        rows = self.conn.execute("SELECT company_key, company FROM company_reports").fetchall()
+        changed = [(company_key(company), key) for key, company in rows if company_key(company) != key]
+        if changed:
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE OR REPLACE company_reports SET company_key = ? WHERE company_key = ?", changed)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _cutoff(self):
+        return time.time() - self.ttl_days * 86400 if self.ttl_days else 0
+
+    def get(self, company):
+        """Return the stored report for a company, or None if missing or expired."""
+        row = self.conn.execute(
+            "SELECT report FROM company_reports WHERE company_key = ? AND created_at >= ?",
+            (company_key(company), self._cutoff()),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, company, report, created_at=None):
+        """Save (or replace) the report for a company."""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO company_reports (company_key, company, report, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (company_key(company), company, report, created_at or time.time()),
+            )
+
+    def delete(self, company):
+        """Remove a company's report, e.g. to force it to be regenerated."""
+        with self.conn:
+            self.conn.execute("DELETE FROM company_reports WHERE company_key = ?", (company_key(company),))
+
+    def count(self):
+        """Return the number of unexpired reports."""
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM company_reports WHERE created_at >= ?", (self._cutoff(),)
+        ).fetchone()[0]
+
+    def purge_expired(self):
+        """Delete expired reports. Returns the number removed."""
+        if not self.ttl_days:
+            return 0
+        with self.conn:
+            return self.conn.execute(
+                "DELETE FROM company_reports WHERE created_at < ?", (self._cutoff(),)
+            ).rowcount
+
+    def import_json(self, path=LEGACY_REPORTS_PATH):
+        """Import a legacy {company: report} JSON file. Returns the number imported.
+
+        Imported reports are dated by the file's modification time, so the
+        TTL still applies to old research.
+        """
+        reports = load_json(path, default={})
+        created_at = path.stat().st_mtime if reports else None
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO company_reports (company_key, company, report, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                [(company_key(name), name, report, created_at) for name, report in reports.items()],
+            )
+        return len(reports)
+
+
+def open_report_store(ttl_days=DEFAULT_TTL_DAYS, path=JOB_DB_PATH):
+    """Open the report store, importing a legacy company_reports.json if the store is new."""
+    store = ReportStore(path, ttl_days=ttl_days)
+    if LEGACY_REPORTS_PATH.exists() and not store.conn.execute("SELECT 1 FROM company_reports LIMIT 1").fetchone():
+        store.import_json(LEGACY_REPORTS_PATH)
+    return store
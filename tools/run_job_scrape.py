@@ -1,13 +1,17 @@
 """Job scraping pipeline orchestrator.
 
 Loads config, runs scrapers for each configured site,
-merges results, saves to CSV, and optionally pushes to Google Sheets.
+merges results, saves to CSV, records a snapshot of the run, and
+optionally pushes the jobs that are new or changed since the previous
+run to Google Sheets.
 """
 
 import importlib
 import sys
 from pathlib import Path
 
+from job_store import open_job_store
+from raw_log import new_run_id, prune_runs
 from scraper_utils import load_config, save_csv, save_raw_results
 
 # Map site names to their scraper modules
@@ -27,6 +31,9 @@ def run_pipeline():
         sys.exit(1)
 
     all_jobs = []
+    # One run id for every site so a run's raw segments can be read back together
+    run_id = new_run_id()
+    compress_raw = config.get("output", {}).get("compress_raw", False)
 
     for site in sites:
         if site not in SCRAPERS:
@@ -41,7 +48,7 @@ def run_pipeline():
             module = importlib.import_module(SCRAPERS[site])
             jobs = module.scrape()
             if jobs:
-                save_raw_results(jobs, f"{site}_raw.json")
+                save_raw_results(jobs, f"{site}_raw.json", run_id=run_id, compress=compress_raw)
                 all_jobs.extend(jobs)
             else:
                 print(f"No jobs returned from {site}")
@@ -72,12 +79,45 @@ def run_pipeline():
     # Save combined CSV
     save_csv(all_jobs)
 
+    # Snapshot this run and compare it with the previous one
+    push_list, update_existing = all_jobs, False
+    with open_job_store() as store:
+        store.record_run(run_id, all_jobs)
+        latest = store.latest_delta()
+        if latest is not None:
+            old_run, _, delta = latest
+            print(f"\nSince run {old_run}: {len(delta['added'])} new, "
+                  f"{len(delta['changed'])} changed, {len(delta['removed'])} no longer listed")
+            # Sheets only needs what changed; jobs come from the store so they carry scores
+            push_list = store.get_jobs(delta["added"] + delta["changed"])
+            update_existing = True
+
+    # Optional columnar history export for analysis (needs pyarrow)
+    if config.get("output", {}).get("export_history"):
+        try:
+            from export_parquet import HISTORY_DIR, export_history
+            rows = export_history()
+            print(f"Exported {rows} job rows to {HISTORY_DIR}")
+        except Exception as e:
+            print(f"History export failed: {e}")
+
+    # Drop old raw runs and run snapshots (and descriptions only they referenced) if configured
+    keep_runs = config.get("output", {}).get("keep_raw_runs")
+    if keep_runs:
+        pruned = prune_runs(keep_runs)
+        if pruned:
+            print(f"Pruned {len(pruned)} raw segments older than the last {keep_runs} runs")
+        with open_job_store() as store:
+            pruned_runs = store.prune_runs(keep_runs)
+        if pruned_runs:
+            print(f"Pruned {len(pruned_runs)} run snapshots older than the last {keep_runs} runs")
+
     # Try pushing to Google Sheets if credentials exist
     creds_path = Path(__file__).parent.parent / "credentials.json"
     if creds_path.exists():
         try:
             from push_to_sheets import push_jobs
-            push_jobs(all_jobs, config)
+            push_jobs(push_list, config, update_existing=update_existing)
         except Exception as e:
             print(f"Google Sheets push failed: {e}")
             print("Results are still saved locally in .tmp/")
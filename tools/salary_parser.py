@@ -0,0 +1,149 @@
+"""Parse free-text salary strings into numeric annual ranges.
+
+Job boards return salary as display text ("£30K–£35K a year", "£15 an hour").
+Each string is parsed once at ingest into salary_min/salary_max fields
+(annualised, currency not converted) so scoring and filtering can compare
+plain numbers instead of re-parsing text.
+"""
+
+import re
+from functools import lru_cache
+
+# Multipliers used to annualise hourly/daily/weekly/monthly rates
+# (37.5 hour week, 5 day week, 52 weeks)
+PERIOD_MULTIPLIERS = {
+    "hour": 1950,
+    "day": 260,
+    "week": 52,
+    "month": 12,
+    "year": 1,
+}
+
+PERIOD_ALIASES = {
+    "hour": "hour", "hr": "hour", "hourly": "hour",
+    "day": "day", "daily": "day",
+    "week": "week", "wk": "week", "weekly": "week",
+    "month": "month", "mo": "month", "monthly": "month",
+    "year": "year", "yr": "year", "annum": "year", "annual": "year",
+    "annually": "year", "yearly": "year", "pa": "year",
+    "ph": "hour", "pd": "day", "pw": "week", "pcm": "month",
+}
+
+UNIT_MULTIPLIERS = {"k": 1_000, "m": 1_000_000}
+
+# Annual figures outside these bounds are not salaries (budgets, typos, noise)
+MIN_ANNUAL_SALARY = 1_000
+MAX_ANNUAL_SALARY = 1_000_000
+
+CURRENCY_SYMBOLS = "£$€"
+
+_AMOUNT_RE = re.compile(r"([£$€])?\s*(\d+(?:[.,]\d+)*)\s*(?:([kKmM])(?![a-zA-Z]))?")
+# What may sit between the two figures of a range ("£30k-35k", "£30,000 to 40,000")
+_RANGE_SEPARATOR_RE = re.compile(r"\s*(?:-|–|—|to)\s*", re.IGNORECASE)
+_PERIOD_RE = re.compile(
+    r"(?:\b(?:per|an?)\s+|/\s*)(hour|hr|day|week|wk|month|mo|year|yr|annum)\b"
+    r"|\b(hourly|daily|weekly|monthly|yearly|annually|annual|p\.?a|ph|pd|pw|pcm)\b",
+    re.IGNORECASE,
+)
+
+
+def _to_number(digits, unit):
+    """Convert a matched amount like '30,000', '45.000', '30.5' or '30' (+ k/m) to a float.
+
+    Raises:
+        ValueError: If the digits are not a number ("1.2.3")
+    """
+    # Commas are thousands separators, and so are dots when every group after
+    # one has three digits ("€45.000", "€1.500.000"); otherwise '.d' is decimal
+    dot_groups = digits.split(".")[1:]
+    if dot_groups and all(len(group.replace(",", "")) == 3 for group in dot_groups):
+        digits = digits.replace(".", "")
+    value = float(digits.replace(",", ""))
+    if unit:
+        value *= UNIT_MULTIPLIERS[unit.lower()]
+    return value
+
+
+def _detect_period(text):
+    """Return the pay period named in text, or None if not stated."""
+    match = _PERIOD_RE.search(text)
+    if not match:
+        return None
+    word = (match.group(1) or match.group(2)).lower().replace(".", "")
+    return PERIOD_ALIASES.get(word)
+
+
+@lru_cache(maxsize=4096)
+def parse_salary(text):
+    """Parse a salary string into an annual (min, max) range.
+
+    Args:
+        text: Free-text salary, e.g. "£30K–£35K a year" or "£15 an hour"
+
+    Returns:
+        tuple: (min, max) as ints, or (None, None) if no amount found or it
+        is not a plausible annual salary. A single figure ("Up to £40k")
+        gives min == max.
+    """
+    if not text:
+        return None, None
+
+    amounts = []  # (digits, unit)
+    start = previous_end = None
+    bare_range_end = False
+    has_currency = any(symbol in text for symbol in CURRENCY_SYMBOLS)
+    for match in _AMOUNT_RE.finditer(text):
+        currency, digits, unit = match.groups()
+        # When a currency symbol is present, ignore other numbers (e.g. "37.5 hours"),
+        # except the second figure of a range ("£30,000 - 40,000")
+        if has_currency and not currency:
+            continue_range = (len(amounts) == 1
+                              and _RANGE_SEPARATOR_RE.fullmatch(text, previous_end, match.start()))
+            if not continue_range:
+                continue
+            bare_range_end = True
+        if start is None:
+            start = match.start()
+        amounts.append((digits, unit))
+        previous_end = match.end()
+        if len(amounts) == 2:
+            break
+
+    if not amounts:
+        return None, None
+
+    # A unit written once applies to both ends of a range ("£30-35k")
+    units = [unit for _, unit in amounts if unit]
+    values = []
+    try:
+        for digits, unit in amounts:
+            value = _to_number(digits, unit)
+            if not unit and units and value < 1000:
+                value = _to_number(digits, units[0])
+            values.append(value)
+    except ValueError:
+        return None, None  # Malformed figure; treat like an unlisted salary
+    # A bare second figure below the first is not the top of the range ("£30,000 - 2025 start")
+    if bare_range_end and values[1] < values[0]:
+        values.pop()
+
+    # Only look for the period after the pay figure ("37.5 hours per week, £25,000")
+    period = _detect_period(text[start:])
+    if period is None:
+        # Unlabelled small figures are almost always hourly rates, and
+        # three-figure ones contract day rates
+        top = max(values)
+        period = "hour" if top < 100 else "day" if top < 1000 else "year"
+
+    multiplier = PERIOD_MULTIPLIERS[period]
+    low, high = round(min(values) * multiplier), round(max(values) * multiplier)
+    if low < MIN_ANNUAL_SALARY or high > MAX_ANNUAL_SALARY:
+        return None, None
+    return low, high
+
+
+def salary_range(job):
+    """Return a job's annual (min, max) salary, parsing only if not precomputed."""
+    if "salary_max" in job:
+        return job.get("salary_min"), job.get("salary_max")
+    return parse_salary(job.get("salary", ""))
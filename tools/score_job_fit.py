@@ -4,70 +4,144 @@ Uses keyword matching to score how well each job matches
 the user's skills, location preferences, and other criteria.
 """
 
-import json
+import argparse
 from pathlib import Path
 
-import yaml
-
+from job_record import Job, jobs_to_dicts
+from job_store import open_job_store
+from persistence import load_yaml, save_json
+from raw_log import iter_legacy_raw_jobs, iter_raw_jobs
+from salary_parser import parse_salary, salary_range
 from scraper_utils import TMP_DIR
 
 PROJECT_ROOT = Path(__file__).parent.parent
 PROFILE_PATH = PROJECT_ROOT / "user_profile.yaml"
 
 
-def load_profile():
+def load_profile(path=PROFILE_PATH):
     """Load user profile from YAML file."""
-    if not PROFILE_PATH.exists():
+    path = Path(path)
+    if not path.exists():
         raise FileNotFoundError(
-            f"User profile not found: {PROFILE_PATH}\n"
+            f"User profile not found: {path}\n"
             "Create user_profile.yaml with your skills and preferences."
         )
-    with open(PROFILE_PATH, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return load_yaml(path)
 
 
-def calculate_fit_score(job, profile):
-    """Calculate fit score (0-100) for a single job.
+def load_profiles(profiles_dir):
+    """Load every *.yaml / *.yml profile in a directory, keyed by file stem."""
+    profiles_dir = Path(profiles_dir)
+    if not profiles_dir.is_dir():
+        raise FileNotFoundError(f"Profiles directory not found: {profiles_dir}")
+    paths = sorted(list(profiles_dir.glob("*.yaml")) + list(profiles_dir.glob("*.yml")))
+    return {path.stem: load_profile(path) for path in paths}
+
+
+TITLE_KEYWORDS = ["developer", "engineer", "software", "programmer", "coding"]
+
+
+def find_spans(text, term):
+    """Return [start, end] spans of every non-overlapping occurrence of term in text."""
+    spans = []
+    if not term:
+        return spans
+    start = text.find(term)
+    while start != -1:
+        end = start + len(term)
+        spans.append([start, end])
+        start = text.find(term, end)
+    return spans
+
+
+def profile_terms(profile):
+    """Return the lowercased terms a profile matches against job text."""
+    user = profile.get("profile", {})
+    skills = user.get("skills", {})
+    terms = user.get("dealbreakers", []) + skills.get("required", []) + skills.get("preferred", [])
+    return {term.lower() for term in terms}
+
+
+def match_job_terms(job, terms):
+    """Scan a job's title and description once for a set of lowercased terms.
+
+    Args:
+        job: Dict with job data
+        terms: Iterable of lowercased terms (see profile_terms)
+
+    Returns:
+        dict: term -> [[start, end], ...] description spans, for every term
+        present in the job text (spans may be empty for title-only hits)
+    """
+    description = job.get("description", "")
+    text = (description + " " + job.get("title", "")).lower()
+    # Spans index into the original description; skip them in the rare case
+    # lowercasing changed its length (some non-ASCII characters do)
+    description_len = len(description) if len(description.lower()) == len(description) else 0
+
+    hits = {}
+    for term in terms:
+        if term not in text:
+            continue
+        hits[term] = [sp for sp in find_spans(text, term) if sp[1] <= description_len]
+    return hits
+
+
+def score_from_matches(job, profile, hits):
+    """Score a job for one profile from precomputed term hits.
 
     Args:
         job: Dict with job data (title, description, location, etc.)
         profile: Dict with user profile data
+        hits: Output of match_job_terms covering at least profile_terms(profile)
 
     Returns:
-        int: Score from 0-100, or 0 if dealbreaker found
+        dict: Score breakdown (see calculate_fit_breakdown)
     """
     scores = {}
+    matched = {}
+    spans = {}
     user = profile.get("profile", {})
     scoring = profile.get("scoring", {})
     weights = scoring.get("weights", {
-        "required_skills": 0.40,
-        "preferred_skills": 0.25,
+        "required_skills": 0.35,
+        "preferred_skills": 0.20,
         "location": 0.20,
         "title_relevance": 0.15,
+        "salary": 0.10,
     })
 
-    # Combine description and title for matching
-    text = (job.get("description", "") + " " + job.get("title", "")).lower()
-
-    # Check dealbreakers first - if found, return 0 immediately
+    def match_terms(terms):
+        found = []
+        for term in terms:
+            term_lower = term.lower()
+            if term_lower not in hits:
+                continue
+            found.append(term)
+            if hits[term_lower]:
+                spans[term_lower] = hits[term_lower]
+        return found
+
+    # Check dealbreakers first - if found, score is 0 immediately
     dealbreakers = user.get("dealbreakers", [])
     for dealbreaker in dealbreakers:
-        if dealbreaker.lower() in text:
-            return 0
+        if dealbreaker.lower() in hits:
+            return {"score": 0, "scores": {}, "matched": {}, "spans": {},
+                    "dealbreaker": dealbreaker}
 
     # Required skills score (0-100)
     required_skills = user.get("skills", {}).get("required", [])
     if required_skills:
-        required_matches = sum(1 for skill in required_skills if skill.lower() in text)
-        scores["required_skills"] = (required_matches / len(required_skills)) * 100
+        matched["required_skills"] = match_terms(required_skills)
+        scores["required_skills"] = (len(matched["required_skills"]) / len(required_skills)) * 100
     else:
         scores["required_skills"] = 50  # Neutral if no required skills defined
 
     # Preferred skills score (0-100)
     preferred_skills = user.get("skills", {}).get("preferred", [])
     if preferred_skills:
-        preferred_matches = sum(1 for skill in preferred_skills if skill.lower() in text)
-        scores["preferred_skills"] = (preferred_matches / len(preferred_skills)) * 100
+        matched["preferred_skills"] = match_terms(preferred_skills)
+        scores["preferred_skills"] = (len(matched["preferred_skills"]) / len(preferred_skills)) * 100
     else:
         scores["preferred_skills"] = 50  # Neutral if no preferred skills defined
 
@@ -76,89 +150,238 @@ def calculate_fit_score(job, profile):
     preferred_locations = user.get("locations", {}).get("preferred", [])
     acceptable_locations = user.get("locations", {}).get("acceptable", [])
 
-    if any(loc.lower() in job_location for loc in preferred_locations):
+    preferred_hits = [loc for loc in preferred_locations if loc.lower() in job_location]
+    acceptable_hits = [loc for loc in acceptable_locations if loc.lower() in job_location]
+    if preferred_hits:
         scores["location"] = 100
-    elif any(loc.lower() in job_location for loc in acceptable_locations):
+        matched["location"] = preferred_hits
+    elif acceptable_hits:
         scores["location"] = 50
+        matched["location"] = acceptable_hits
     else:
         scores["location"] = 0
 
     # Title relevance score (0-100)
     job_title = job.get("title", "").lower()
-    relevant_keywords = ["developer", "engineer", "software", "programmer", "coding"]
-    if any(kw in job_title for kw in relevant_keywords):
+    title_hits = [kw for kw in TITLE_KEYWORDS if kw in job_title]
+    if title_hits:
         scores["title_relevance"] = 100
+        matched["title_relevance"] = title_hits
     else:
         scores["title_relevance"] = 50
 
+    # Salary score (0, 50, or 100) from the precomputed annual range
+    salary_prefs = user.get("salary", {}) or {}
+    minimum = salary_prefs.get("minimum")
+    preferred = salary_prefs.get("preferred", minimum)
+    _, job_salary_max = salary_range(job)
+    if job_salary_max is None or not minimum:
+        scores["salary"] = 50  # Neutral if salary not listed or no minimum set
+    elif job_salary_max >= (preferred or minimum):
+        scores["salary"] = 100
+    elif job_salary_max >= minimum:
+        scores["salary"] = 50
+    else:
+        scores["salary"] = 0
+
     # Calculate weighted average
     final_score = sum(scores.get(k, 0) * weights.get(k, 0) for k in weights)
 
-    return round(final_score)
+    return {
+        "score": round(final_score),
+        "scores": {k: round(v, 1) for k, v in scores.items()},
+        "matched": matched,
+        "spans": spans,
+    }
+
+
+def calculate_fit_breakdown(job, profile):
+    """Score a single job and explain the score in the same pass.
+
+    Args:
+        job: Dict with job data (title, description, location, etc.)
+        profile: Dict with user profile data
+
+    Returns:
+        dict: {
+            "score": int 0-100 (0 if a dealbreaker was found),
+            "scores": category -> sub-score (0-100),
+            "matched": category -> matched profile terms,
+            "spans": lowercased term -> [[start, end], ...] in the description,
+            "dealbreaker": the dealbreaker hit (only present when score is 0),
+        }
+    """
+    return score_from_matches(job, profile, match_job_terms(job, profile_terms(profile)))
+
+
+def calculate_fit_score(job, profile):
+    """Calculate fit score (0-100) for a single job.
+
+    Args:
+        job: Dict with job data (title, description, location, etc.)
+        profile: Dict with user profile data
+
+    Returns:
+        int: Score from 0-100, or 0 if dealbreaker found
+    """
+    return calculate_fit_breakdown(job, profile)["score"]
+
+
+def load_raw_jobs(all_stored=False):
+    """Load the latest scraped jobs as Job records.
 
+    Reads the raw segments of the newest scrape run (streamed), falling
+    back to the latest recorded scrape run in the job store and then
+    legacy .tmp/*_raw.json files for older data.
 
-def score_jobs(jobs=None):
+    Args:
+        all_stored: Load every job in the job store instead of the latest scrape
+    """
+    with open_job_store() as store:
+        if all_stored:
+            return list(store.iter_jobs())
+        jobs = list(iter_raw_jobs(latest=True)) or store.latest_run_jobs()
+    if not jobs:
+        jobs = list(iter_legacy_raw_jobs())
+    return jobs
+
+
+def _with_score(job, breakdown):
+    """Return a copy of a job (Job record or dict) as a Job with fit_score and fit_breakdown set."""
+    record = Job.from_dict(job)
+    record["fit_score"] = breakdown.pop("score")
+    record["fit_breakdown"] = breakdown
+    # Backfill numeric salary for jobs scraped before it was parsed at ingest
+    if "salary_max" not in record:
+        salary_min, salary_max = parse_salary(record.get("salary", ""))
+        record["salary_min"] = salary_min
+        record["salary_max"] = salary_max
+    return record
+
+
+def print_summary(scored_jobs):
+    """Print score statistics for a sorted list of scored jobs."""
+    total = len(scored_jobs)
+    with_score = len([j for j in scored_jobs if j["fit_score"] > 0])
+    avg_score = sum(j["fit_score"] for j in scored_jobs) / total if total else 0
+
+    print(f"\nScored {total} jobs:")
+    print(f"  Jobs with score > 0: {with_score}")
+    print(f"  Jobs filtered (dealbreakers): {total - with_score}")
+    print(f"  Average score: {avg_score:.1f}")
+    if scored_jobs:
+        print(f"  Top score: {scored_jobs[0]['fit_score']} - {scored_jobs[0]['title']} at {scored_jobs[0]['company']}")
+
+
+def score_jobs(jobs=None, profile=None):
     """Score all jobs and return sorted by fit score.
 
     Args:
-        jobs: List of job dicts, or None to load from .tmp/
+        jobs: List of Job records or dicts, or None to load from .tmp/.
+            The inputs are not modified; scored copies are returned.
+        profile: Profile dict, or None to load user_profile.yaml
 
     Returns:
-        List of jobs with fit_score field, sorted descending
+        List of Jobs with fit_score and fit_breakdown fields, sorted descending
     """
     # Load jobs if not provided
     if jobs is None:
-        jobs = []
-        for json_file in TMP_DIR.glob("*_raw.json"):
-            with open(json_file, "r", encoding="utf-8") as f:
-                jobs.extend(json.load(f))
+        jobs = load_raw_jobs()
 
     if not jobs:
         print("No jobs to score.")
         return []
 
     # Load user profile
-    profile = load_profile()
+    if profile is None:
+        profile = load_profile()
 
     # Score each job
     scored_jobs = []
     for job in jobs:
-        score = calculate_fit_score(job, profile)
-        job_with_score = {**job, "fit_score": score}
-        scored_jobs.append(job_with_score)
+        scored_jobs.append(_with_score(job, calculate_fit_breakdown(job, profile)))
 
     # Sort by fit score descending
     scored_jobs.sort(key=lambda x: x["fit_score"], reverse=True)
 
-    # Print summary
-    total = len(scored_jobs)
-    with_score = len([j for j in scored_jobs if j["fit_score"] > 0])
-    avg_score = sum(j["fit_score"] for j in scored_jobs) / total if total else 0
-
-    print(f"\nScored {total} jobs:")
-    print(f"  Jobs with score > 0: {with_score}")
-    print(f"  Jobs filtered (dealbreakers): {total - with_score}")
-    print(f"  Average score: {avg_score:.1f}")
-    if scored_jobs:
-        print(f"  Top score: {scored_jobs[0]['fit_score']} - {scored_jobs[0]['title']} at {scored_jobs[0]['company']}")
+    print_summary(scored_jobs)
 
     return scored_jobs
 
 
+def score_jobs_batch(profiles, jobs=None):
+    """Score jobs against several profiles in a single pass over the jobs.
+
+    Each job's text is scanned once for the union of every profile's terms
+    (a sparse job x term hit set); each profile's score is then computed from
+    those shared hits instead of rescanning the description per profile.
+
+    Args:
+        profiles: Dict of name -> profile dict (see load_profiles)
+        jobs: List of Job records or dicts, or None to load from .tmp/
+
+    Returns:
+        Dict of name -> list of scored Jobs (one copy per profile), each sorted descending
+    """
+    if jobs is None:
+        jobs = load_raw_jobs()
+
+    if not jobs or not profiles:
+        print("No jobs or profiles to score.")
+        return {}
+
+    terms = set()
+    for profile in profiles.values():
+        terms |= profile_terms(profile)
+
+    results = {name: [] for name in profiles}
+    for job in jobs:
+        hits = match_job_terms(job, terms)
+        for name, profile in profiles.items():
+            results[name].append(_with_score(job, score_from_matches(job, profile, hits)))
+
+    for name, scored_jobs in results.items():
+        scored_jobs.sort(key=lambda x: x["fit_score"], reverse=True)
+        print(f"\n[{name}]", end="")
+        print_summary(scored_jobs)
+
+    return results
+
+
 def save_scored_jobs(jobs, filename="scored_jobs.json"):
-    """Save scored jobs to JSON file."""
-    TMP_DIR.mkdir(exist_ok=True)
+    """Save scored jobs to the job store and a JSON export file.
+
+    Batch (per-profile) results only go to their JSON file, since the store
+    holds scores for the main user_profile.yaml.
+    """
     filepath = TMP_DIR / filename
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(jobs, f, indent=2, ensure_ascii=False)
+    if filename == "scored_jobs.json":
+        with open_job_store() as store:
+            store.upsert_jobs(jobs)
+    save_json(filepath, jobs_to_dicts(jobs), pretty=True)
     print(f"Saved {len(jobs)} scored jobs to {filepath}")
     return filepath
 
 
 if __name__ == "__main__":
-    scored = score_jobs()
-    if scored:
-        save_scored_jobs(scored)
-        print("\nTop 10 jobs by fit score:")
-        for i, job in enumerate(scored[:10], 1):
-            print(f"  {i}. [{job['fit_score']}] {job['title']} at {job['company']}")
+    parser = argparse.ArgumentParser(description="Score scraped jobs against user profiles.")
+    parser.add_argument(
+        "--profiles-dir",
+        help="Score against every profile in this directory in one pass, "
+             "writing .tmp/scored_jobs_<profile>.json for each",
+    )
+    parser.add_argument("--all", action="store_true",
+                        help="Score every job in the job store, not just the latest scrape")
+    args = parser.parse_args()
+
+    jobs = load_raw_jobs(all_stored=args.all)
+    if args.profiles_dir:
+        for name, scored in score_jobs_batch(load_profiles(args.profiles_dir), jobs).items():
+            save_scored_jobs(scored, f"scored_jobs_{name}.json")
+    else:
+        scored = score_jobs(jobs)
+        if scored:
+            save_scored_jobs(scored)
+            print("\nTop 10 jobs by fit score:")
+            for i, job in enumerate(scored[:10], 1):
+                print(f"  {i}. [{job['fit_score']}] {job['title']} at {job['company']}")
@@ -1,13 +1,15 @@
 """Shared utilities for job scrapers."""
 
-import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
 
-import yaml
 from dotenv import load_dotenv
 
+from job_record import Job
+from persistence import load_yaml
+from salary_parser import parse_salary
+
 # Project root is one level up from tools/
 PROJECT_ROOT = Path(__file__).parent.parent
 CONFIG_PATH = PROJECT_ROOT / "job_search_config.yaml"
@@ -21,37 +23,51 @@ def load_config():
     """Load and return the job search configuration."""
     if not CONFIG_PATH.exists():
         raise FileNotFoundError(f"Config not found: {CONFIG_PATH}")
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return load_yaml(CONFIG_PATH)
 
 
 def normalize_job(raw_data, source):
-    """Ensure a job dict has all standard fields."""
-    return {
+    """Build a Job record with all standard fields from a scraper's raw dict."""
+    salary = raw_data.get("salary", "").strip()
+    salary_min, salary_max = parse_salary(salary)
+    return Job({
         "title": raw_data.get("title", "").strip(),
         "company": raw_data.get("company", "").strip(),
         "location": raw_data.get("location", "").strip(),
         "url": raw_data.get("url", "").strip(),
         "date_posted": raw_data.get("date_posted", "").strip(),
-        "salary": raw_data.get("salary", "").strip(),
+        "salary": salary,
+        "salary_min": salary_min,
+        "salary_max": salary_max,
         "description": raw_data.get("description", "").strip()[:2000],
         "source": source,
         "scraped_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
-    }
-
-
-def save_raw_results(jobs, filename):
-    """Save job list as JSON to .tmp/ directory."""
-    TMP_DIR.mkdir(exist_ok=True)
-    filepath = TMP_DIR / filename
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(jobs, f, indent=2, ensure_ascii=False)
+    })
+
+
+def save_raw_results(jobs, filename, run_id=None, compress=False):
+    """Append a site's jobs to the raw JSONL log and upsert them into the job store.
+
+    Args:
+        jobs: List of Job records or dicts
+        filename: Legacy "<site>_raw.json" name; the site name is taken from it
+        run_id: Scrape run id shared by every site in a pipeline run
+        compress: Write a gzip-compressed segment
+    """
+    from job_store import open_job_store
+    from raw_log import RAW_DIR, append_segment
+
+    site = filename[:-len("_raw.json")] if filename.endswith("_raw.json") else filename
+    entry = append_segment(jobs, site, run_id=run_id, compress=compress)
+    with open_job_store() as store:
+        store.upsert_jobs(jobs)
+    filepath = RAW_DIR / entry["path"]
     print(f"Saved {len(jobs)} jobs to {filepath}")
     return filepath
 
 
 def save_csv(jobs, filename="jobs_export.csv"):
-    """Save job list as CSV to .tmp/ directory."""
+    """Save job list (Job records or dicts) as CSV to .tmp/ directory."""
     import csv
 
     TMP_DIR.mkdir(exist_ok=True)
@@ -61,7 +77,8 @@ def save_csv(jobs, filename="jobs_export.csv"):
         return filepath
 
     fieldnames = ["title", "company", "location", "url", "date_posted",
-                  "salary", "description", "source", "scraped_at"]
+                  "salary", "salary_min", "salary_max", "description", "source",
+                  "scraped_at"]
 
     # Add fit_score column if any job has it
     if any("fit_score" in job for job in jobs):
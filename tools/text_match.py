@@ -0,0 +1,43 @@
+"""Find which of many keywords occur in a text in a single regex pass.
+
+Checking keywords one by one (any(k in text for k in ...)) rescans the text
+per keyword. KeywordScanner compiles them into one lookahead alternation,
+longest keyword first, so a single finditer visits each position once and
+reports the longest keyword starting there. Shorter keywords that are
+prefixes of it ("name" in "name of employer") are added from a precomputed
+prefix map, so the result is exactly the set of keywords that are
+substrings of the text, overlapping ones included.
+"""
+
+import re
+
+
+class KeywordScanner:
+    """Compiled matcher for a fixed set of keywords.
+
+    Args:
+        keywords: Literal substrings to look for (matched case-sensitively;
+            lowercase both sides for case-insensitive matching)
+    """
+
+    def __init__(self, keywords):
+        self.keywords = sorted({k for k in keywords if k}, key=lambda k: (-len(k), k))
+        self._regex = None
+        if self.keywords:
+            alternation = "|".join(re.escape(k) for k in self.keywords)
+            self._regex = re.compile(f"(?=({alternation}))")
+        # keyword -> every keyword that is a prefix of it (itself included)
+        self._prefixes = {
+            keyword: frozenset(k for k in self.keywords if keyword.startswith(k))
+            for keyword in self.keywords
+        }
+
+    def find(self, text):
+        """Return the set of keywords that occur in text."""
+        found = set()
+        if self._regex is None:
+            return found
+        prefixes = self._prefixes
+        for match in self._regex.finditer(text):
+            found.update(prefixes[match.group(1)])
+        return found